@@ -8,6 +8,8 @@ Pythagoras.
 Key exports:
     get_hash_signature: Compute a short, URL-safe content hash for any object.
     get_node_signature: Derive a stable identifier for the current compute node.
+    get_node_local_cache: Open a persistent cache shared by processes on a node.
+    get_node_local_cache_key: Build a release-specific key for such a cache.
     get_random_signature: Generate a cryptographically secure random ID.
     get_long_infoname: Build extended identifier strings for objects.
     current_date_gmt_string: Format current UTC date for filenames and logs.
@@ -19,6 +21,7 @@ from .base_16_32_converters import *
 from .current_date_gmt_str import *
 from .hash_signature import *
 from .node_signature import *
+from .node_local_cache import *
 from .random_signature import *
 from .long_infoname import *
 from .reimported_objects import *
\ No newline at end of file
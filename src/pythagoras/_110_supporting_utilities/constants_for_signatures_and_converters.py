@@ -40,3 +40,7 @@ SMBIOS_UUID_PATH: Final[str] = "/sys/class/dmi/id/product_uuid"
 
 PTH_NODE_SIGNATURE_VERSION: Final[str] = "version_2"
 # Version tag mixed into node-signature payload (enables future evolution).
+
+PTH_NODE_CACHE_DIR_ENV_VAR: Final[str] = "PYTHAGORAS_NODE_CACHE_DIR"
+# Environment variable overriding the node-local cache directory;
+# an empty value disables node-local caching.
@@ -0,0 +1,110 @@
+"""Persistent caches shared by all Pythagoras processes on the same node.
+
+Some derived data (e.g., normalized function source code) is expensive to
+compute, fully determined by its inputs, and needed again by every process:
+each swarm worker, each interpreter that imports a module full of decorated
+functions. Such data is cached on the local filesystem, so that only the
+first process on a node pays the cost.
+
+The cache lives in ``~/.pythagoras/node_cache`` unless the
+``PYTHAGORAS_NODE_CACHE_DIR`` environment variable points elsewhere; setting
+it to an empty string disables node-local caching. Caches are best-effort:
+callers must treat a missing cache (None) or any cache failure as a miss.
+
+Cache keys are built with get_node_local_cache_key(), which mixes in the
+installed Pythagoras version: a release that changes how cached data is
+computed never reads entries written by another release, without anybody
+having to remember to bump a format version by hand.
+
+Public API
+----------
+get_node_local_cache(name) → PersiDict | None
+    Return the persistent dictionary for the named cache on this node.
+get_node_local_cache_key(*key_parts) → str
+    Build a cache key from the data that determines a cached value.
+"""
+
+from __future__ import annotations
+
+import os
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+from persidict import FileDirDict, PersiDict
+
+from .._version_info import __version__ as _pythagoras_version
+from .constants_for_signatures_and_converters import (
+    PTH_APP_NAME, PTH_NODE_CACHE_DIR_ENV_VAR)
+from .hash_signature import get_hash_signature
+
+
+def _node_local_cache_base_dir() -> str | None:
+    """Resolve the base directory of node-local caches.
+
+    Returns:
+        str | None: The directory path, or None if caching is disabled.
+    """
+    base_dir = os.environ.get(PTH_NODE_CACHE_DIR_ENV_VAR)
+    if base_dir is None:
+        return str(Path.home() / f".{PTH_APP_NAME}" / "node_cache")
+    if not base_dir.strip():
+        return None
+    return base_dir
+
+
+@cache
+def _open_node_local_cache(base_dir: str, name: str
+        , serialization_format: str) -> PersiDict | None:
+    """Open (and create if needed) a node-local cache directory.
+
+    Args:
+        base_dir: Base directory for all node-local caches.
+        name: Name of the cache, used as a subdirectory.
+        serialization_format: persidict serialization format of the values.
+
+    Returns:
+        PersiDict | None: The cache, or None if it can't be created.
+    """
+    try:
+        cache_dir = Path(base_dir) / name
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        return FileDirDict(base_dir=str(cache_dir)
+            , serialization_format=serialization_format, digest_len=0)
+    except Exception:
+        return None
+
+
+def get_node_local_cache(name: str, serialization_format: str = "json"
+        ) -> PersiDict | None:
+    """Return a persistent cache shared by all processes on this node.
+
+    Args:
+        name: Name of the cache (a valid directory name).
+        serialization_format: persidict serialization format of the values,
+            e.g., "json" or "pkl".
+
+    Returns:
+        PersiDict | None: The cache, or None if node-local caching is
+        disabled or the cache directory is not writable.
+    """
+    base_dir = _node_local_cache_base_dir()
+    if base_dir is None:
+        return None
+    return _open_node_local_cache(base_dir, name, serialization_format)
+
+
+def get_node_local_cache_key(*key_parts: Any) -> str:
+    """Build a node-local cache key from the data that determines a value.
+
+    The installed Pythagoras version is always part of the key, so entries
+    written by other releases are never read.
+
+    Args:
+        *key_parts: Hashable description of everything the cached value
+            depends on, e.g., the source code it is computed from.
+
+    Returns:
+        str: The hash signature to use as the cache key.
+    """
+    return get_hash_signature((_pythagoras_version, *key_parts))
@@ -179,22 +179,45 @@ class BasicPortal(NotPicklableMixin,
     def __enter__(self):
         """Add the portal to the active stack and set it as the current one.
 
+        Re-entering the portal that is already current only increments
+        its re-entrancy counter.
+
         Returns:
             The portal instance itself.
+
+        Raises:
+            RuntimeError: If called from a thread other than the one
+                owning the portal registry.
         """
-        _PORTAL_REGISTRY.push_new_active_portal(self)
+        _PORTAL_REGISTRY._restrict_to_single_thread()
+        if not _PORTAL_REGISTRY.portal_stack.reenter(self):
+            _PORTAL_REGISTRY.push_new_active_portal(self)
         return self
 
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Pop the portal from the stack of active ones.
 
+        Leaving a nested (re-entered) use of the portal only decrements
+        its re-entrancy counter.
+
         Args:
             exc_type: Exception type if an exception occurred, None otherwise.
             exc_val: Exception value if an exception occurred, None otherwise.
             exc_tb: Exception traceback if an exception occurred, None otherwise.
         """
-        _PORTAL_REGISTRY.pop_active_portal(self)
+        _PORTAL_REGISTRY._restrict_to_single_thread()
+        if not _PORTAL_REGISTRY.portal_stack.leave_reentered(self):
+            _PORTAL_REGISTRY.pop_active_portal(self)
+
+
+    def _is_reentered(self) -> bool:
+        """Check whether the portal is current and entered more than once.
+
+        Returns:
+            True if exiting the portal now would leave it current.
+        """
+        return _PORTAL_REGISTRY.portal_stack.is_reentered(self)
 
 
     def _clear(self) -> None:
@@ -239,11 +262,55 @@ class _PortalStack:
     Attributes:
         _stack: List of active portals (most recent at end).
         _counters: Re-entrancy counters matching each stack entry.
+        _depth: Total depth, i.e. the sum of all counters.
     """
 
     def __init__(self) -> None:
         self._stack: list[BasicPortal] = []
         self._counters: list[int] = []
+        self._depth: int = 0
+
+    def reenter(self, portal: BasicPortal) -> bool:
+        """Re-enter the portal if it is already at the top of the stack.
+
+        This is the fast path of portal re-entry: a counter increment
+        without any further bookkeeping.
+
+        Args:
+            portal: The portal being entered.
+
+        Returns:
+            True if the portal was re-entered, False if it must be pushed.
+        """
+        stack = self._stack
+        if (stack and stack[-1] is portal
+                and self._depth < MAX_NESTED_PORTALS):
+            self._counters[-1] += 1
+            self._depth += 1
+            return True
+        return False
+
+    def leave_reentered(self, portal: BasicPortal) -> bool:
+        """Leave a nested use of the portal at the top of the stack.
+
+        Args:
+            portal: The portal being exited.
+
+        Returns:
+            True if the portal was re-entered and its counter decremented,
+            False if this is its outermost exit and it must be popped.
+        """
+        stack = self._stack
+        if stack and stack[-1] is portal and self._counters[-1] > 1:
+            self._counters[-1] -= 1
+            self._depth -= 1
+            return True
+        return False
+
+    def is_reentered(self, portal: BasicPortal) -> bool:
+        """Check if the portal is at the top and entered more than once."""
+        return (bool(self._stack) and self._stack[-1] is portal
+            and self._counters[-1] > 1)
 
     def push(self, portal: BasicPortal) -> None:
         """Push a portal onto the stack, handling re-entrancy.
@@ -254,15 +321,16 @@ class _PortalStack:
         Raises:
             RuntimeError: If nesting exceeds MAX_NESTED_PORTALS.
         """
-        if self.depth() >= MAX_NESTED_PORTALS:
+        if self._depth >= MAX_NESTED_PORTALS:
             raise RuntimeError(
-                f"Too many nested portals: current depth is {self.depth()}, "
+                f"Too many nested portals: current depth is {self._depth}, "
                 f"max allowed is {MAX_NESTED_PORTALS}")
         if self._stack and self._stack[-1] is portal:
             self._counters[-1] += 1
         else:
             self._stack.append(portal)
             self._counters.append(1)
+        self._depth += 1
         self._check_consistency()
 
     def pop(self, portal: BasicPortal) -> None:
@@ -283,6 +351,7 @@ class _PortalStack:
             self._counters.pop()
         else:
             self._counters[-1] -= 1
+        self._depth -= 1
         self._check_consistency()
 
     def peek(self) -> BasicPortal | None:
@@ -295,7 +364,7 @@ class _PortalStack:
 
     def depth(self) -> int:
         """Return total depth including re-entrancy counts."""
-        return sum(self._counters)
+        return self._depth
 
     def unique_count(self) -> int:
         """Return the number of unique portals in the stack."""
@@ -321,6 +390,7 @@ class _PortalStack:
         """Clear the stack."""
         self._stack.clear()
         self._counters.clear()
+        self._depth = 0
 
     def _check_consistency(self) -> None:
         """Verify stack and counters are in sync."""
@@ -328,6 +398,10 @@ class _PortalStack:
             raise RuntimeError(
                 f"Internal error: _stack and _counters are out of sync "
                 f"(stack length={len(self._stack)}, counters length={len(self._counters)})")
+        if self._depth != sum(self._counters):
+            raise RuntimeError(
+                f"Internal error: stack depth {self._depth} does not match "
+                f"re-entrancy counters {self._counters}")
 
 
 class _PortalRegistry(NotPicklableMixin, SingleThreadEnforcerMixin):
@@ -376,6 +376,18 @@ class HashAddr(SafeStrTuple, CacheablePropertiesMixin):
         raise NotImplementedError
 
 
+    @classmethod
+    def _all_ready(cls, addresses: list[HashAddr]) -> bool:
+        """Check whether all given addresses of this class are ready.
+
+        Subclasses may override it to check many addresses in bulk.
+
+        Args:
+            addresses: Addresses whose type is exactly this class.
+        """
+        return all(address.ready for address in addresses)
+
+
     @abstractmethod
     def get(self, timeout: int | None = None, expected_type:Type[T]= Any) -> T:
         """Retrieve the value referenced by this address.
@@ -25,6 +25,9 @@ from .data_portal_core_classes import HashAddr
 def ready(obj: Any) -> bool:
     """Check if all HashAddr instances in an object graph are retrievable.
 
+    Addresses of the same type are checked together, so address types
+    that support bulk checks (see HashAddr._all_ready) check them in bulk.
+
     Args:
         obj: Object structure to check, may contain nested HashAddr instances.
 
@@ -32,10 +35,12 @@ def ready(obj: Any) -> bool:
         True if every HashAddr in obj has its value available in at least
         one known portal, False otherwise.
     """
-    for addr in find_instances_inside_composite_object(obj, HashAddr):
-        if not addr.ready:
-            return False
-    return True
+    addrs_by_type: dict[type, list[HashAddr]] = {}
+    for addr in find_instances_inside_composite_object(
+            obj, HashAddr, deep_search=False):
+        addrs_by_type.setdefault(type(addr), []).append(addr)
+    return all(addr_type._all_ready(addrs)
+        for addr_type, addrs in addrs_by_type.items())
 
 
 def get(obj: Any) -> Any:
@@ -4,19 +4,107 @@ This module provides functionality to normalize Python function source code by
 removing decorators, docstrings, type annotations, and comments, then applying
 PEP 8 formatting. This enables consistent comparison and hashing of function
 implementations.
+
+Two versioned normalizers are available:
+
+- ``LEGACY_NORMALIZER_VERSION`` ("autopep8_v1"): the canonical form is
+  ``autopep8.fix_code(ast.unparse(tree))``. This is the default, so existing
+  portals keep their function hashes (and thus their cached results).
+- ``AST_NORMALIZER_VERSION`` ("ast_v1"): the canonical form is built directly
+  from the cleaned AST with ``ast.unparse``. It is much faster and does not
+  depend on autopep8, whose output may change between its releases.
+
+The version in use is part of a function's identity (see OrdinaryFn), except
+for the legacy version, which is implied when absent. Migrating a portal is
+therefore explicit: select the new version with
+set_default_normalizer_version() or the ``PYTHAGORAS_NORMALIZER_VERSION``
+environment variable on every node. Functions then get new addresses, so
+their results are recomputed on first use; results stored under the legacy
+addresses stay in the portal and remain available to nodes that still use
+the legacy normalizer. Mixing versions across nodes is safe but duplicates
+work, so switch all nodes of a portal together.
+
+Normalization results are cached in-process and in a node-local persistent
+cache shared by all processes on the machine (see get_node_local_cache),
+keyed by a hash of the raw source, the normalizer version, and the
+Pythagoras version (see get_node_local_cache_key). Any change to a
+normalization pipeline must introduce a new normalizer version.
 """
 
 import ast
 import inspect
+import os
 import textwrap
 from functools import cache
-from typing import Callable
-import autopep8
+from typing import Callable, Final
 
 from .function_processing import get_function_name_from_source
 from .._110_supporting_utilities.long_infoname import get_long_infoname
 from .function_processing import assert_ordinarity
 from .function_error_exception import FunctionError
+from .._110_supporting_utilities import (
+    get_node_local_cache, get_node_local_cache_key)
+
+LEGACY_NORMALIZER_VERSION: Final[str] = "autopep8_v1"
+AST_NORMALIZER_VERSION: Final[str] = "ast_v1"
+_NORMALIZER_VERSIONS: Final[tuple[str, ...]] = (
+    LEGACY_NORMALIZER_VERSION, AST_NORMALIZER_VERSION)
+_NORMALIZER_VERSION_ENV_VAR: Final[str] = "PYTHAGORAS_NORMALIZER_VERSION"
+_NORMALIZED_SOURCES_CACHE_NAME: Final[str] = "normalized_fn_sources"
+
+_default_normalizer_version: str | None = None
+
+
+def _validate_normalizer_version(normalizer_version: str) -> None:
+    """Check that a normalizer version is supported.
+
+    Args:
+        normalizer_version: The version to check.
+
+    Raises:
+        ValueError: If the version is not one of the supported versions.
+    """
+    if normalizer_version not in _NORMALIZER_VERSIONS:
+        raise ValueError(
+            f"normalizer_version must be one of {_NORMALIZER_VERSIONS}, "
+            f"got {normalizer_version!r}")
+
+
+def set_default_normalizer_version(normalizer_version: str | None) -> None:
+    """Select the normalizer used for newly created functions.
+
+    Args:
+        normalizer_version: LEGACY_NORMALIZER_VERSION, AST_NORMALIZER_VERSION,
+            or None to fall back to the PYTHAGORAS_NORMALIZER_VERSION
+            environment variable (or the legacy version if it is not set).
+
+    Raises:
+        ValueError: If the version is not supported.
+    """
+    global _default_normalizer_version
+    if normalizer_version is not None:
+        _validate_normalizer_version(normalizer_version)
+    _default_normalizer_version = normalizer_version
+
+
+def get_default_normalizer_version() -> str:
+    """Return the normalizer version used for newly created functions.
+
+    Returns:
+        The version selected with set_default_normalizer_version(), else the
+        one from the PYTHAGORAS_NORMALIZER_VERSION environment variable,
+        else LEGACY_NORMALIZER_VERSION.
+
+    Raises:
+        ValueError: If the environment variable holds an unsupported version.
+    """
+    if _default_normalizer_version is not None:
+        return _default_normalizer_version
+    normalizer_version = os.environ.get(_NORMALIZER_VERSION_ENV_VAR, "")
+    if not normalizer_version.strip():
+        return LEGACY_NORMALIZER_VERSION
+    _validate_normalizer_version(normalizer_version)
+    return normalizer_version
 
 _pythagoras_decorator_names: set[str] = {
     "ordinary"
@@ -314,16 +402,75 @@ def _normalize_fn_source_code_str(
         fn_source_code: str,
         fn_name_for_error_messages: str | None,
         drop_pth_decorators: bool = False,
+        normalizer_version: str = LEGACY_NORMALIZER_VERSION,
+        ) -> str:
+    """Normalize function source code string, using the node-local cache.
+
+    The cache key is a hash of the raw source, the drop_pth_decorators flag,
+    and the normalizer version (for the legacy version, also the autopep8
+    version, whose output is part of the result). Errors are never cached:
+    invalid sources are re-analysed so that the same exception is raised
+    every time.
+
+    Args:
+        fn_source_code: Source code string to normalize.
+        fn_name_for_error_messages: Function name for error messages; may be None.
+        drop_pth_decorators: Whether to remove Pythagoras decorators.
+        normalizer_version: Which normalizer to apply.
+
+    Returns:
+        Normalized source code string.
+
+    Raises:
+        FunctionError: If function has multiple decorators.
+        TypeError: If AST node types are invalid.
+        ValueError: If parsing assumptions or integrity checks fail.
+        SyntaxError: If source cannot be parsed.
+    """
+    _validate_normalizer_version(normalizer_version)
+    version_key = normalizer_version
+    if normalizer_version == LEGACY_NORMALIZER_VERSION:
+        import autopep8
+        version_key += "_" + autopep8.__version__
+    cache_key = get_node_local_cache_key(
+        version_key, drop_pth_decorators, fn_source_code)
+    node_cache = get_node_local_cache(_NORMALIZED_SOURCES_CACHE_NAME)
+    if node_cache is not None:
+        try:
+            cached_result = node_cache.get(cache_key, None)
+            if isinstance(cached_result, str):
+                return cached_result
+        except Exception:
+            pass  # A corrupted or unreadable entry is treated as a miss
+
+    result = _normalize_fn_source_code_str_uncached(fn_source_code
+        , fn_name_for_error_messages, drop_pth_decorators, normalizer_version)
+
+    if node_cache is not None:
+        try:
+            node_cache[cache_key] = result
+        except Exception:
+            pass  # Caching is best-effort
+    return result
+
+
+def _normalize_fn_source_code_str_uncached(
+        fn_source_code: str,
+        fn_name_for_error_messages: str | None,
+        drop_pth_decorators: bool = False,
+        normalizer_version: str = LEGACY_NORMALIZER_VERSION,
         ) -> str:
     """Normalize function source code string.
 
     Applies full normalization: dedent, clean empty lines, parse AST, remove
-    decorators/annotations/docstrings, and PEP 8 format.
+    decorators/annotations/docstrings, and unparse. The legacy normalizer
+    additionally applies autopep8 formatting.
 
     Args:
         fn_source_code: Source code string to normalize.
         fn_name_for_error_messages: Function name for error messages; may be None.
         drop_pth_decorators: Whether to remove Pythagoras decorators.
+        normalizer_version: Which normalizer to apply.
 
     Returns:
         Normalized source code string.
@@ -345,7 +492,11 @@ def _normalize_fn_source_code_str(
     _remove_docstrings(code_ast)
 
     result = ast.unparse(code_ast)
-    result = autopep8.fix_code(result)
+    if normalizer_version == LEGACY_NORMALIZER_VERSION:
+        import autopep8
+        result = autopep8.fix_code(result)
+    else:
+        result += "\n"
 
     return result
 
@@ -354,6 +505,7 @@ def _get_normalized_fn_source_code_str_impl(
         a_func: Callable | str,
         drop_pth_decorators: bool = False,
         skip_ordinarity_check: bool = False,
+        normalizer_version: str | None = None,
         ) -> str:
     """Produce normalized representation of function source code.
 
@@ -369,12 +521,14 @@ def _get_normalized_fn_source_code_str_impl(
     4. Optionally strip Pythagoras decorators (@ordinary, @pure, etc.)
     5. Remove docstrings, type annotations, and variable annotations
     6. Ensure syntactic validity (add 'pass' to empty bodies)
-    7. Unparse and apply PEP 8 formatting for consistent style
+    7. Unparse (and, for the legacy normalizer, apply PEP 8 formatting)
 
     Args:
         a_func: Function or source code string.
         drop_pth_decorators: Whether to remove Pythagoras decorators.
         skip_ordinarity_check: If True, skip ordinarity validation for callables.
+        normalizer_version: Which normalizer to apply; None means
+            get_default_normalizer_version().
 
     Returns:
         Normalized source code string.
@@ -386,6 +540,9 @@ def _get_normalized_fn_source_code_str_impl(
         ValueError: If parsing assumptions or integrity checks fail.
         SyntaxError: If source cannot be parsed.
     """
+    if normalizer_version is None:
+        normalizer_version = get_default_normalizer_version()
     func_name_for_error_messages, code = _extract_fn_name_and_source_code(
         a_func, skip_ordinarity_check=skip_ordinarity_check)
-    return _normalize_fn_source_code_str(code, func_name_for_error_messages, drop_pth_decorators)
+    return _normalize_fn_source_code_str(code, func_name_for_error_messages
+        , drop_pth_decorators, normalizer_version)
@@ -7,6 +7,7 @@ OrdinaryCodePortal, which manages portal context and linked wrappers.
 from __future__ import annotations
 
 import ast
+import weakref
 from copy import deepcopy
 from functools import cached_property
 from itertools import product
@@ -19,7 +20,8 @@ from .function_error_exception import FunctionError
 from .reuse_flag import ReuseFlag, USE_FROM_OTHER
 from .._230_tunable_portals import TunablePortal, TunableObject
 from .._110_supporting_utilities import get_long_infoname
-from .code_normalizer import _get_normalized_fn_source_code_str_impl
+from .code_normalizer import (_get_normalized_fn_source_code_str_impl,
+    get_default_normalizer_version, LEGACY_NORMALIZER_VERSION)
 from .function_processing import get_function_name_from_source
 from .._110_supporting_utilities import get_hash_signature
 from .._210_basic_portals.basic_portal_core_classes import (
@@ -28,17 +30,21 @@ from .._210_basic_portals.basic_portal_core_classes import (
 
 def get_normalized_fn_source_code_str(
         a_func: OrdinaryFn | Callable | str,
-        skip_ordinarity_check: bool = False
+        skip_ordinarity_check: bool = False,
+        normalizer_version: str | None = None
         ) -> str:
     """Get normalized source code for a function.
 
     Normalizes function source by removing comments, docstrings, type
-    annotations, and empty lines, then applying PEP 8 formatting. This creates
-    a canonical representation for reliable comparison and hashing.
+    annotations, and empty lines, then rendering it in canonical form. This
+    creates a canonical representation for reliable comparison and hashing.
 
     Args:
         a_func: OrdinaryFn instance, callable, or source code string.
         skip_ordinarity_check: If True, skip ordinarity validation for callables.
+        normalizer_version: Normalizer to apply to callables and strings;
+            None means get_default_normalizer_version(). OrdinaryFn
+            instances always return their own normalized source.
 
     Returns:
         Normalized source code string.
@@ -56,7 +62,8 @@ def get_normalized_fn_source_code_str(
     else:
         return _get_normalized_fn_source_code_str_impl(
             a_func, drop_pth_decorators=True,
-            skip_ordinarity_check=skip_ordinarity_check)
+            skip_ordinarity_check=skip_ordinarity_check,
+            normalizer_version=normalizer_version)
 
 
 def _expand_grid(grid_of_kwargs: dict[str, list[Any]]) -> list[dict[str, Any]]:
@@ -150,6 +157,43 @@ class OrdinaryCodePortal(TunablePortal):
         result.reset_index(drop=True, inplace=True)
         return result
 
+class InvocationPlan:
+    """Per-portal data an OrdinaryFn needs to execute, resolved once.
+
+    A plan is built on the first call of a function in a portal and reused
+    by all subsequent calls there, so that the hot path does not recompute
+    values that can't change between calls. Each layer of the function
+    class hierarchy adds its own attributes in _build_invocation_plan().
+
+    Settings are deliberately not part of a plan: they can be changed at
+    any time, also by other processes, and are resolved on every call.
+
+    Plans are cached on functions, which usually outlive portals, so a
+    plan refers to its portal weakly and doesn't keep it alive.
+
+    Attributes:
+        compiled_code: Code object executing the function.
+        available_names: Namespace template for exec(), copied per call.
+    """
+    _portal_ref: weakref.ref
+    compiled_code: Any
+    available_names: dict[str, Any]
+
+    def __init__(self, portal: OrdinaryCodePortal):
+        """Create an empty plan for the given portal.
+
+        Args:
+            portal: The portal the plan is built for.
+        """
+        self._portal_ref = weakref.ref(portal)
+
+
+    @property
+    def portal(self) -> OrdinaryCodePortal | None:
+        """The portal the plan was built for, or None if it is gone."""
+        return self._portal_ref()
+
+
 class OrdinaryFn(TunableObject):
     """A wrapper around an ordinary function that enables controlled execution.
 
@@ -174,10 +218,16 @@ class OrdinaryFn(TunableObject):
     and execute functions in isolated contexts where all dependencies are
     explicit and traceable.
 
+    The normalizer version used to produce the source is part of the
+    function's identity; the legacy version is implied when absent, so
+    functions normalized by it keep their historical hashes.
+
     Attributes:
         _source_code: Normalized source representation of the function.
+        _normalizer_version: Version of the normalizer that produced it.
     """
     _source_code:str
+    _normalizer_version:str
 
     def __init__(self
                  , fn: Callable | str
@@ -216,7 +266,9 @@ class OrdinaryFn(TunableObject):
             if not (callable(fn) or isinstance(fn, str)):
                 raise TypeError("fn must be a callable or a string "
                                 "with the function's source code.")
-            self._source_code = get_normalized_fn_source_code_str(fn)
+            self._normalizer_version = get_default_normalizer_version()
+            self._source_code = get_normalized_fn_source_code_str(
+                fn, normalizer_version=self._normalizer_version)
 
         self._linked_portal = portal
 
@@ -243,6 +295,16 @@ class OrdinaryFn(TunableObject):
         return self._source_code
 
 
+    @property
+    def normalizer_version(self) -> str:
+        """Get the version of the normalizer that produced the source code.
+
+        Returns:
+            One of the normalizer versions defined in code_normalizer.
+        """
+        return self._normalizer_version
+
+
     @cached_property
     def name(self) -> str:
         """Get the name of the function.
@@ -332,6 +394,21 @@ class OrdinaryFn(TunableObject):
         The compiled code expects kwargs in _kwargs_var_name and stores the
         result in _result_var_name.
 
+        Returns:
+            Compiled code object ready for exec().
+        """
+        return self._compile_with_trailer(
+            f"{self._result_var_name} = "
+            f"{self._tmp_fn_name}(**{self._kwargs_var_name})")
+
+
+    def _compile_with_trailer(self, trailer_src: str) -> Any:
+        """Compile the renamed function definition followed by a trailer.
+
+        Args:
+            trailer_src: Source code that calls the renamed function
+                (_tmp_fn_name) and stores the result in _result_var_name.
+
         Returns:
             Compiled code object ready for exec().
         """
@@ -352,9 +429,6 @@ class OrdinaryFn(TunableObject):
                 "while building _compiled_code.")
 
         # Store the result in a known variable after invocation.
-        trailer_src = (
-            f"{self._result_var_name} = "
-            f"{self._tmp_fn_name}(**{self._kwargs_var_name})")
         trailer_ast = ast.parse(trailer_src,
             filename=self._virtual_file_name,
             mode="exec",)
@@ -420,6 +494,49 @@ class OrdinaryFn(TunableObject):
             "pth": pth,}
 
 
+    @cached_property
+    def _invocation_plans(self
+            ) -> weakref.WeakKeyDictionary[OrdinaryCodePortal, InvocationPlan]:
+        """Invocation plans of this function, one per live portal."""
+        return weakref.WeakKeyDictionary()
+
+
+    def _get_invocation_plan(self, portal: OrdinaryCodePortal
+            ) -> InvocationPlan:
+        """Return the invocation plan for a portal, building it on first use.
+
+        Args:
+            portal: The portal the function is executed in.
+
+        Returns:
+            The cached invocation plan.
+        """
+        plan = self._invocation_plans.get(portal)
+        if plan is None:
+            plan = self._build_invocation_plan(portal)
+            self._invocation_plans[portal] = plan
+        return plan
+
+
+    def _build_invocation_plan(self, portal: OrdinaryCodePortal
+            ) -> InvocationPlan:
+        """Resolve everything a call needs that doesn't change between calls.
+
+        Subclasses extend the plan with data of their own layer.
+
+        Args:
+            portal: The portal the function is executed in; it is active
+                while the plan is being built.
+
+        Returns:
+            A new invocation plan.
+        """
+        plan = InvocationPlan(portal)
+        plan.compiled_code = self._compiled_code
+        plan.available_names = self._available_names()
+        return plan
+
+
     def execute(self, **kwargs: Any) -> Any:
         """Execute the underlying function with keyword arguments.
 
@@ -432,12 +549,68 @@ class OrdinaryFn(TunableObject):
         Returns:
             Function return value.
         """
-        with self.portal:
-            names_dict = self._available_names()
-            names_dict[self._kwargs_var_name] = kwargs
-            exec(self._compiled_code, names_dict)
-            result = names_dict[self._result_var_name]
-            return result
+        with self.portal as portal:
+            plan = self._get_invocation_plan(portal)
+            return self._invoke(plan, kwargs, None)
+
+
+    def _invoke(self, plan: InvocationPlan, kwargs: dict[str, Any]
+            , packed_kwargs: Any | None) -> Any:
+        """Run the function; the flat fast path behind execute().
+
+        Subclasses override this method, not execute(), to add the logic of
+        their layer; they must call super()._invoke(). The portal is already
+        active and the plan resolved, so layers don't re-enter the portal
+        or re-resolve per-function data.
+
+        Args:
+            plan: The invocation plan for the active portal.
+            kwargs: Keyword arguments for the function.
+            packed_kwargs: The same arguments packed into ValueAddr handles
+                if a higher layer already did that, otherwise None.
+
+        Returns:
+            Function return value.
+        """
+        return self._run_compiled_code(plan, kwargs)
+
+
+    def _invoke_lean(self, plan: InvocationPlan, kwargs: dict[str, Any]
+            , packed_kwargs: Any | None) -> Any:
+        """Run the function without per-call records; used for extensions.
+
+        Mirrors _invoke() for calls that must not leave execution records
+        behind. Layers that only record calls (e.g. logging) don't override
+        this method; layers whose logic applies to every call (e.g. binding
+        fixed kwargs) override it too and call super()._invoke_lean().
+
+        Args:
+            plan: The invocation plan for the active portal.
+            kwargs: Keyword arguments for the function.
+            packed_kwargs: The same arguments packed into ValueAddr handles,
+                or None.
+
+        Returns:
+            Function return value.
+        """
+        return self._run_compiled_code(plan, kwargs)
+
+
+    def _run_compiled_code(self, plan: InvocationPlan
+            , kwargs: dict[str, Any]) -> Any:
+        """Execute the compiled function code with the given kwargs.
+
+        Args:
+            plan: The invocation plan for the active portal.
+            kwargs: Keyword arguments for the function.
+
+        Returns:
+            Function return value.
+        """
+        names_dict = plan.available_names.copy()
+        names_dict[self._kwargs_var_name] = kwargs
+        exec(plan.compiled_code, names_dict)
+        return names_dict[self._result_var_name]
 
 
     def execute_each(self, list_of_kwargs: list[dict[str, Any]]) -> list[Any]:
@@ -480,9 +653,12 @@ class OrdinaryFn(TunableObject):
         """Return picklable state for this instance.
 
         Returns:
-            Dictionary with normalized source code.
+            Dictionary with normalized source code, and the normalizer
+            version unless it is the legacy one.
         """
         state = dict(source_code=self._source_code)
+        if self._normalizer_version != LEGACY_NORMALIZER_VERSION:
+            state["normalizer_version"] = self._normalizer_version
         return state
 
 
@@ -495,6 +671,8 @@ class OrdinaryFn(TunableObject):
         """
         super().__setstate__(state)
         self._source_code = state["source_code"]
+        self._normalizer_version = state.get(
+            "normalizer_version", LEGACY_NORMALIZER_VERSION)
 
 
     def __hash_addr_descriptor__(self) -> str:
@@ -10,7 +10,9 @@ Core Concepts
 function-level logging. Maintains three persistent dictionaries:
 - _run_history: Function execution artifacts (attempts, results, outputs)
 - _crash_history: Exception logs organized by date
+- _crash_fingerprints: Per-day crash counters grouped by exception fingerprint
 - _event_history: Custom event logs organized by date
+- _execution_metrics: Compact resource metrics of every function execution
 
 **LoggingFn**: Function wrapper created by the @logging decorator. Extends
 OrdinaryFn with automatic logging of execution attempts, results, exceptions,
@@ -47,9 +49,14 @@ Decorator:
 Logging utilities:
 - log_exception(): Log the current exception to the active portal
 - log_event(): Log custom events with arbitrary keyword arguments
+
+Profiling utilities:
+- merge_execution_profiles(): Combine stored profiles into pstats.Stats
+- format_collapsed_stacks(): Render profiles as flamegraph input text
 """
 
 from .logging_portal_core_classes import *
 from .execution_environment_summary import *
+from .execution_profiling import *
 from .logging_decorator import *
 
@@ -0,0 +1,72 @@
+"""Stable fingerprints for grouping repeated exceptions.
+
+When a function fails on many inputs, the resulting crashes are usually
+near-identical: same exception type, raised from the same place. This module
+computes a short fingerprint from the exception type and the code locations
+of its traceback, so that LoggingCodePortal can aggregate such crashes
+instead of persisting (and printing) a full payload for every occurrence.
+
+Frames that belong to Pythagoras itself are left out of the fingerprint
+whenever user frames are present. This way the same failure gets the same
+fingerprint no matter whether the function was called directly, through
+a swarm worker, or from another Pythagoras function.
+"""
+
+import os
+import traceback
+
+from .._110_supporting_utilities import get_hash_signature
+
+_PYTHAGORAS_PACKAGE_DIR = os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__)))
+
+
+def _is_pythagoras_frame(filename: str) -> bool:
+    """Check whether a traceback frame comes from Pythagoras source files.
+
+    Args:
+        filename: The file name stored in the traceback frame.
+
+    Returns:
+        bool: True if the file is located inside the Pythagoras package.
+    """
+    try:
+        return os.path.abspath(filename).startswith(_PYTHAGORAS_PACKAGE_DIR)
+    except (TypeError, ValueError):
+        return False
+
+
+def get_exception_fingerprint(exc_type, exc_value, trace_back) -> str:
+    """Compute a fingerprint that groups recurring occurrences of an exception.
+
+    The fingerprint depends on the qualified name of the exception type and
+    on the (file, function, line) locations of the traceback frames. The
+    exception message is deliberately ignored: messages often embed
+    input-specific values, while the failure itself is the same.
+
+    Args:
+        exc_type: The exception class. May be None.
+        exc_value: The exception instance. Unused.
+        trace_back: The traceback object associated with the exception.
+
+    Returns:
+        str: A short base32 hash signature identifying the failure.
+    """
+    type_name = "None"
+    if exc_type is not None:
+        type_name = f"{exc_type.__module__}.{exc_type.__qualname__}"
+
+    locations = []
+    if trace_back is not None:
+        try:
+            locations = [(frame.filename, frame.name, frame.lineno)
+                for frame in traceback.extract_tb(trace_back)]
+        except Exception:
+            locations = []
+
+    user_locations = [location for location in locations
+        if not _is_pythagoras_frame(location[0])]
+    if user_locations:
+        locations = user_locations
+
+    return get_hash_signature((type_name, tuple(locations)))
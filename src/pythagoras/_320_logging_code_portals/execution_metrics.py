@@ -0,0 +1,150 @@
+"""Lightweight resource metrics for individual function executions.
+
+This module provides the helpers LoggingFnExecutionFrame uses to measure
+every execution (wall time, CPU time, the process's peak RSS, and the
+estimated in-memory sizes of inputs and outputs), and the aggregation that
+turns the per-execution records into a per-function summary.
+
+The per-execution records are always collected, independently of the
+verbose_logging setting. They are small flat dicts, so the overhead stays
+negligible compared to the rest of the logging machinery. For the same
+reason, sizes are estimated from sys.getsizeof() and nbytes of a sample
+of items rather than by serializing the inputs and outputs.
+
+Peak RSS is the high-water mark of the whole process at the end of an
+execution, not the memory used by that execution alone: it never goes
+down, so an execution that follows a memory-hungry one reports the same
+peak.
+"""
+
+from __future__ import annotations
+
+import sys
+from itertools import islice
+from typing import Any, Final
+
+import pandas as pd
+import psutil
+
+_METRICS_COLUMNS: Final[tuple[str, ...]] = ("fn_name", "fn_hash"
+    , "session_id", "timestamp", "wall_time", "cpu_time"
+    , "process_peak_rss"
+    , "bytes_in", "bytes_out", "crashed", "profile_addr")
+
+_SUMMARY_COLUMNS: Final[tuple[str, ...]] = ("fn_name", "fn_hash"
+    , "count", "crashes", "p50_wall_time", "p95_wall_time", "total_cpu_time"
+    , "max_process_peak_rss", "bytes_in", "bytes_out")
+
+_SIZE_SAMPLE_ITEMS: Final[int] = 100
+
+
+def _get_process_peak_rss_bytes() -> int | None:
+    """Return the peak resident set size of the current process so far.
+
+    This is the high-water mark since the process started, so it
+    includes the memory used by earlier executions in the same process.
+
+    Uses resource.getrusage() where available (it reports kilobytes on
+    Linux and bytes on macOS) and falls back to psutil elsewhere.
+
+    Returns:
+        int | None: Peak RSS in bytes, or None if it cannot be determined.
+    """
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if sys.platform != "darwin":
+            peak *= 1024
+        return int(peak)
+    except Exception:
+        pass
+    try:
+        memory_info = psutil.Process().memory_info()
+        return int(getattr(memory_info, "peak_wset", memory_info.rss))
+    except Exception:
+        return None
+
+
+def _get_shallow_size(x: Any) -> int:
+    """Return the size of an object's own buffer or, failing that, header."""
+    nbytes = getattr(x, "nbytes", None)
+    if isinstance(nbytes, int) and not isinstance(nbytes, bool):
+        return nbytes
+    return sys.getsizeof(x)
+
+
+def _estimate_size_in_bytes(x: Any) -> int | None:
+    """Cheaply estimate how many bytes an object takes in memory.
+
+    Objects with an nbytes attribute (e.g. numpy arrays) report the size
+    of their buffer. For dicts, lists, tuples, and sets, the shallow sizes
+    of up to _SIZE_SAMPLE_ITEMS items are measured and extrapolated to
+    the whole collection; nested collections are not traversed. The cost
+    thus doesn't depend on the size of the object.
+
+    Args:
+        x: The object to measure.
+
+    Returns:
+        int | None: Estimated size, or None if it can't be determined.
+    """
+    try:
+        size = _get_shallow_size(x)
+        if isinstance(x, dict):
+            items = [i for kv in islice(x.items(), _SIZE_SAMPLE_ITEMS)
+                for i in kv]
+            n_sampled = len(items) // 2
+        elif isinstance(x, (list, tuple, set, frozenset)):
+            items = list(islice(x, _SIZE_SAMPLE_ITEMS))
+            n_sampled = len(items)
+        else:
+            return size
+        if n_sampled:
+            sampled_size = sum(_get_shallow_size(i) for i in items)
+            size += sampled_size * len(x) // n_sampled
+        return size
+    except Exception:
+        return None
+
+
+def _build_execution_metrics_frame(records: list[dict]) -> pd.DataFrame:
+    """Convert per-execution metric records into a DataFrame.
+
+    Args:
+        records: Metric dicts as stored by LoggingFnExecutionFrame.
+
+    Returns:
+        pandas.DataFrame: One row per execution, with a fixed set of columns.
+    """
+    return pd.DataFrame(records, columns=list(_METRICS_COLUMNS))
+
+
+def summarize_execution_metrics(metrics: pd.DataFrame) -> pd.DataFrame:
+    """Aggregate per-execution metrics into per-function statistics.
+
+    Args:
+        metrics: A DataFrame as returned by
+            LoggingCodePortal.get_execution_metrics().
+
+    Returns:
+        pandas.DataFrame: One row per function with the execution count,
+        number of crashes, median and 95th percentile of wall time, total
+        CPU time, max process peak RSS, and total bytes in and out. Rows are sorted
+        by total wall time, most expensive functions first.
+    """
+    if metrics.empty:
+        return pd.DataFrame(columns=list(_SUMMARY_COLUMNS))
+    grouped = metrics.groupby(["fn_name", "fn_hash"], sort=False)
+    summary = grouped.agg(
+        count=("session_id", "count")
+        , crashes=("crashed", "sum")
+        , p50_wall_time=("wall_time", lambda s: s.quantile(0.5))
+        , p95_wall_time=("wall_time", lambda s: s.quantile(0.95))
+        , total_wall_time=("wall_time", "sum")
+        , total_cpu_time=("cpu_time", "sum")
+        , max_process_peak_rss=("process_peak_rss", "max")
+        , bytes_in=("bytes_in", "sum")
+        , bytes_out=("bytes_out", "sum"))
+    summary = summary.sort_values("total_wall_time", ascending=False)
+    summary = summary.reset_index()
+    return summary[list(_SUMMARY_COLUMNS)]
@@ -0,0 +1,190 @@
+"""Opt-in profiling of individual function executions.
+
+When the "profiling" setting is enabled for a function (or for the whole
+portal), LoggingFnExecutionFrame runs the execution under cProfile and,
+if "profile_memory" is also enabled, under tracemalloc. The collected
+statistics are stored as an artifact under the call signature, next to the
+captured outputs, so slow executions in a swarm can be analysed without
+reproducing them locally.
+
+This module provides the profiler context manager used by the frame, and
+helpers that merge many stored profiles into one aggregated report: either
+a pstats.Stats object or collapsed-stack text suitable for flamegraph tools.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import pstats
+import tracemalloc
+from typing import Any, Final, Iterable
+
+_MAX_MEMORY_ALLOCATION_SITES: Final[int] = 25
+
+
+class _ExecutionProfiler:
+    """Context manager collecting cProfile (and tracemalloc) statistics.
+
+    Python allows only one active cProfile profiler at a time, so a profiler
+    nested inside another one (e.g., a profiled function calling another
+    profiled function) stays inactive; its execution is still covered by
+    the outer profile.
+    """
+    _active: bool = False
+
+    profile_memory: bool
+    profile: dict | None
+    _profiler: cProfile.Profile | None
+    _owns_tracemalloc: bool
+
+    def __init__(self, profile_memory: bool = False):
+        """Initialize the profiler.
+
+        Args:
+            profile_memory: Whether to also trace memory allocations.
+        """
+        self.profile_memory = profile_memory
+        self.profile = None
+        self._profiler = None
+        self._owns_tracemalloc = False
+
+
+    def __enter__(self) -> _ExecutionProfiler:
+        """Start profiling unless another profiler is already active."""
+        if _ExecutionProfiler._active:
+            return self
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            return self  # Another profiling tool is already active
+        _ExecutionProfiler._active = True
+        self._profiler = profiler
+        if self.profile_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._owns_tracemalloc = True
+        return self
+
+
+    def __exit__(self, exc_type, exc_value, trace_back) -> None:
+        """Stop profiling and collect the statistics into self.profile."""
+        if self._profiler is None:
+            return
+        self._profiler.disable()
+        _ExecutionProfiler._active = False
+        profile = dict(cpu_stats=pstats.Stats(self._profiler).stats)
+        if self._owns_tracemalloc:
+            snapshot = tracemalloc.take_snapshot()
+            profile["memory_peak"] = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            profile["memory_top"] = [
+                dict(location=str(stat.traceback), size=stat.size
+                    , count=stat.count)
+                for stat in snapshot.statistics("lineno")[
+                    :_MAX_MEMORY_ALLOCATION_SITES]]
+        self.profile = profile
+
+
+class _StoredProfile:
+    """Minimal profiler stand-in that lets pstats.Stats load stored data."""
+
+    def __init__(self, stats: dict):
+        self.stats = stats
+
+    def create_stats(self) -> None:
+        """Do nothing: the statistics are already collected."""
+
+
+def merge_execution_profiles(profiles: Iterable[dict]) -> pstats.Stats:
+    """Merge stored execution profiles into one aggregated pstats report.
+
+    Args:
+        profiles: Profile artifacts as stored by LoggingFnExecutionFrame
+            (e.g., values of LoggingFnCallSignature.execution_profiles).
+
+    Returns:
+        pstats.Stats: Combined statistics of all given executions. Use
+        sort_stats()/print_stats() to produce a text report.
+
+    Raises:
+        ValueError: If no profiles are provided.
+    """
+    merged = None
+    for profile in profiles:
+        stats = _stats_from_profile(profile)
+        if merged is None:
+            merged = stats
+        else:
+            merged.add(stats)
+    if merged is None:
+        raise ValueError("No execution profiles to merge.")
+    return merged
+
+
+def _stats_from_profile(profile: dict) -> pstats.Stats:
+    """Build a pstats.Stats object from a stored profile artifact.
+
+    Args:
+        profile: A stored profile dict containing "cpu_stats".
+
+    Returns:
+        pstats.Stats: Statistics of a single execution.
+    """
+    return pstats.Stats(_StoredProfile(dict(profile["cpu_stats"])))
+
+
+def _format_function(func: tuple[str, int, str]) -> str:
+    """Format a pstats function key as a flamegraph frame name."""
+    filename, line, name = func
+    if filename == "~":
+        return name
+    return f"{name} ({filename}:{line})"
+
+
+def format_collapsed_stacks(stats: pstats.Stats | Iterable[dict]) -> str:
+    """Render profile statistics as collapsed-stack (flamegraph) text.
+
+    cProfile only records caller/callee pairs, not full stacks, so each
+    function's own time is attributed to a single stack built by following
+    its heaviest callers up to a root. The result is an approximation that
+    is usually good enough to spot hot paths.
+
+    Args:
+        stats: A pstats.Stats object (e.g., from merge_execution_profiles())
+            or an iterable of stored profile artifacts.
+
+    Returns:
+        str: One "frame;frame;...;frame microseconds" line per function
+        with non-zero own time, heaviest first.
+    """
+    if not isinstance(stats, pstats.Stats):
+        stats = merge_execution_profiles(stats)
+    raw_stats: dict[Any, tuple] = stats.stats
+
+    def heaviest_caller(func):
+        callers = raw_stats[func][4]
+        if not callers:
+            return None
+        return max(callers, key=lambda c: _caller_time(callers[c]))
+
+    lines = []
+    for func, (_, _, own_time, _, _) in raw_stats.items():
+        microseconds = int(own_time * 1_000_000)
+        if microseconds <= 0:
+            continue
+        stack = [func]
+        caller = heaviest_caller(func)
+        while caller is not None and caller in raw_stats and caller not in stack:
+            stack.append(caller)
+            caller = heaviest_caller(caller)
+        frames = ";".join(_format_function(f) for f in reversed(stack))
+        lines.append((microseconds, f"{frames} {microseconds}"))
+    lines.sort(key=lambda item: -item[0])
+    return "\n".join(line for _, line in lines)
+
+
+def _caller_time(caller_stats: Any) -> float:
+    """Cumulative time attributed to a caller edge in pstats data."""
+    if isinstance(caller_stats, tuple):
+        return caller_stats[3]
+    return float(caller_stats)
@@ -10,7 +10,8 @@ from typing import Callable
 from persidict import Joker, KEEP_CURRENT
 
 from .._310_ordinary_code_portals import ordinary, ReuseFlag
-from .logging_portal_core_classes import LoggingCodePortal, LoggingFn
+from .logging_portal_core_classes import (
+    LoggingCodePortal, LoggingFn, _validate_verbose_logging)
 from .._110_supporting_utilities import get_long_infoname
 
 class logging(ordinary):
@@ -20,10 +21,10 @@ class logging(ordinary):
     execution attempts, results, outputs, crashes, and events via a
     LoggingCodePortal.
     """
-    _verbose_logging: bool|Joker
+    _verbose_logging: bool|float|Joker
 
     def __init__(self
-            , verbose_logging:bool|Joker|ReuseFlag = KEEP_CURRENT
+            , verbose_logging:bool|float|Joker|ReuseFlag = KEEP_CURRENT
             , portal: LoggingCodePortal | ReuseFlag| None = None):
         """Initialize the logging decorator.
 
@@ -32,6 +33,8 @@ class logging(ordinary):
 
                 - True/False to explicitly enable/disable detailed per-execution
                   artifacts (attempt context, outputs, and results)
+                - A float in [0, 1] to fully instrument only that fraction
+                  of executions
                 - KEEP_CURRENT to inherit from the portal
                 - USE_FROM_OTHER to copy the setting from the wrapped function
                   (only valid when wrapping an existing LoggingFn)
@@ -44,11 +47,12 @@ class logging(ordinary):
                 - None to use the active portal at execution time
 
         Raises:
-            TypeError: If verbose_logging is not a bool, Joker, or ReuseFlag,
-                or if portal is not a LoggingCodePortal, ReuseFlag, or None.
+            TypeError: If verbose_logging is not a bool, float, Joker, or
+                ReuseFlag, or if portal is not a LoggingCodePortal,
+                ReuseFlag, or None.
+            ValueError: If verbose_logging is a float outside [0, 1].
         """
-        if not isinstance(verbose_logging, (bool, Joker,ReuseFlag)):
-            raise TypeError(f"verbose_logging must be bool or Joker or ReuseFlag, got {get_long_infoname(verbose_logging)}")
+        _validate_verbose_logging(verbose_logging, (Joker, ReuseFlag))
         if not (isinstance(portal, (LoggingCodePortal,ReuseFlag)) or portal is None):
             raise TypeError(f"portal must be LoggingCodePortal or ReuseFlag or None, got {get_long_infoname(portal)}")
         super().__init__(portal=portal)
@@ -38,6 +38,9 @@ Execution Model:
     - Any exceptions raised (always logged)
     - Custom events via log_event() (always logged)
     - Function result (if verbose_logging=True)
+    - Resource metrics: wall/CPU time, process peak RSS, input/output sizes
+      (always)
+    - cProfile/tracemalloc statistics (if the "profiling" setting is on)
 
     All artifacts are timestamped and organized by call signature, enabling
     time-series analysis of function behavior.
@@ -47,11 +50,21 @@ Verbose Logging Mode:
     artifacts including execution environment, full output, and results.
     When disabled, only logs exceptions and custom events to reduce storage
     overhead for high-frequency functions.
+
+    A float between 0 and 1 (e.g., verbose_logging=0.01) enables sampling:
+    only that fraction of executions is fully instrumented, so storage and
+    CPU overhead scale with the sample rate rather than with call volume.
+    Samples are drawn at random unless the "verbose_logging_sampling"
+    setting is "deterministic", in which case the decision is derived from
+    the call signature's hash (the same call is always, or never, sampled).
+    Crashes and events are logged for every execution regardless of sampling.
 """
 
 from __future__ import annotations
 
 import sys
+import time
+import random
 from pprint import pprint
 from contextlib import ExitStack
 from functools import cached_property
@@ -68,6 +81,8 @@ from .._210_basic_portals.basic_portal_core_classes import (
 from .._220_data_portals import ValueAddr
 from .._320_logging_code_portals.exception_processing_tracking import (
     _exception_needs_to_be_processed, _mark_exception_as_processed)
+from .._320_logging_code_portals.exception_fingerprints import (
+    get_exception_fingerprint)
 from .._320_logging_code_portals.uncaught_exceptions import \
     unregister_systemwide_uncaught_exception_handlers, \
     register_systemwide_uncaught_exception_handlers
@@ -80,11 +95,63 @@ from .._110_supporting_utilities.current_date_gmt_str import (
     current_date_gmt_string)
 from .._320_logging_code_portals.execution_environment_summary import (
     build_execution_environment_summary, add_execution_environment_summary)
+from .._320_logging_code_portals.execution_metrics import (
+    _get_process_peak_rss_bytes, _estimate_size_in_bytes,
+    _build_execution_metrics_frame, summarize_execution_metrics)
+from .._320_logging_code_portals.execution_profiling import (
+    _ExecutionProfiler)
 from .._110_supporting_utilities import get_long_infoname
 from .._110_supporting_utilities.random_signature import (
     get_random_signature)
 
 
+_VERBOSE_LOGGING_SAMPLING_SETTING: Final[str] = "verbose_logging_sampling"
+_PROFILING_SETTING: Final[str] = "profiling"
+_PROFILE_MEMORY_SETTING: Final[str] = "profile_memory"
+_VERBOSE_LOGGING_SAMPLING_MODES: Final[tuple[str, ...]] = (
+    "random", "deterministic")
+# A write of a numbered artifact may fail (it is logged and skipped), so
+# lookups continue past a few missing numbers before concluding the series.
+_MAX_MISSING_ARTIFACTS_IN_A_ROW: Final[int] = 5
+
+
+def _validate_verbose_logging(verbose_logging: Any, allowed_types: tuple
+        ) -> None:
+    """Check a verbose_logging argument: a flag, a marker, or a sample rate.
+
+    Args:
+        verbose_logging: The value to check.
+        allowed_types: Types accepted in addition to bool and float.
+
+    Raises:
+        TypeError: If verbose_logging has an unsupported type.
+        ValueError: If verbose_logging is a float outside [0, 1].
+    """
+    if not isinstance(verbose_logging, (bool, float, *allowed_types)):
+        type_names = ", ".join(t.__name__ for t in allowed_types)
+        raise TypeError(
+            f"verbose_logging must be a boolean, float, or {type_names}, "
+            f"got {get_long_infoname(verbose_logging)}")
+    if isinstance(verbose_logging, float) and not 0 <= verbose_logging <= 1:
+        raise ValueError(
+            "verbose_logging sample rate must be within [0, 1], "
+            f"got {verbose_logging}")
+
+
+def _verbose_logging_rate(verbose_logging: Any) -> float:
+    """Convert an effective verbose_logging setting into a sample rate.
+
+    Args:
+        verbose_logging: A bool, a float sample rate, or None (not set).
+
+    Returns:
+        float: 1.0 for True, 0.0 for False/None, the rate itself for floats.
+    """
+    if isinstance(verbose_logging, float):
+        return verbose_logging
+    return float(bool(verbose_logging))
+
+
 class LoggingFn(OrdinaryFn):
     """A function wrapper that logs executions, outputs, events, and crashes.
 
@@ -104,7 +171,7 @@ class LoggingFn(OrdinaryFn):
 
     def __init__(self
             , fn: Callable | str
-            , verbose_logging: bool | Joker | ReuseFlag = KEEP_CURRENT
+            , verbose_logging: bool | float | Joker | ReuseFlag = KEEP_CURRENT
             , portal: LoggingCodePortal | ReuseFlag | None = None
             ):
         """Initialize a LoggingFn wrapper.
@@ -115,6 +182,8 @@ class LoggingFn(OrdinaryFn):
 
                 - True/False to explicitly enable/disable detailed per-execution
                   artifacts (attempt context, outputs, results)
+                - A float in [0, 1] to fully instrument only that fraction
+                  of executions
                 - KEEP_CURRENT to inherit the setting from context
                 - USE_FROM_OTHER to copy the setting from ``fn`` when ``fn`` is
                   an existing LoggingFn (enables sharing settings across wrappers)
@@ -127,16 +196,14 @@ class LoggingFn(OrdinaryFn):
                 - None to use the active portal during execution
 
         Raises:
-            TypeError: If verbose_logging is not a bool, Joker, or ReuseFlag.
-            ValueError: If verbose_logging is USE_FROM_OTHER but fn is not
-                a LoggingFn.
+            TypeError: If verbose_logging is not a bool, float, Joker,
+                or ReuseFlag.
+            ValueError: If verbose_logging is a float outside [0, 1], or if
+                it is USE_FROM_OTHER but fn is not a LoggingFn.
         """
         super().__init__(fn=fn, portal=portal)
 
-        if not isinstance(verbose_logging, (bool, Joker, ReuseFlag)):
-            raise TypeError(
-                "verbose_logging must be a boolean, Joker, or ReuseFlag, "
-                f"got {get_long_infoname(verbose_logging)}")
+        _validate_verbose_logging(verbose_logging, (Joker, ReuseFlag))
 
         if verbose_logging is USE_FROM_OTHER:
             if isinstance(fn, LoggingFn):
@@ -155,11 +222,24 @@ class LoggingFn(OrdinaryFn):
 
         Returns:
             True if verbose logging is enabled for this function (from
-            its own config or inherited via the portal); False otherwise.
+            its own config or inherited via the portal), including sampled
+            logging with a non-zero rate; False otherwise.
         """
         return bool(self.get_effective_setting("verbose_logging"))
 
 
+    @property
+    def verbose_logging_rate(self) -> float:
+        """Fraction of executions that get fully instrumented.
+
+        Returns:
+            float: 1.0 when verbose logging is on, 0.0 when it is off,
+            or the configured sample rate.
+        """
+        return _verbose_logging_rate(
+            self.get_effective_setting("verbose_logging"))
+
+
     def get_signature(self, arguments:dict) -> LoggingFnCallSignature:
         """Create a call signature for this function and the given arguments.
 
@@ -174,11 +254,13 @@ class LoggingFn(OrdinaryFn):
         return LoggingFnCallSignature(self, arguments)
 
 
-    def execute(self,**kwargs):
+    def _invoke(self, plan, kwargs, packed_kwargs):
         """Execute the wrapped function and log artifacts via the portal.
 
         Args:
-            **kwargs: Keyword arguments to pass to the wrapped function.
+            plan: The invocation plan for the active portal.
+            kwargs: Keyword arguments to pass to the wrapped function.
+            packed_kwargs: The packed arguments, or None to pack them here.
 
         Returns:
             The result returned by the wrapped function.
@@ -187,13 +269,14 @@ class LoggingFn(OrdinaryFn):
             - Registers an execution attempt and, if enabled, captures
               stdout/stderr and stores the result and output.
         """
-        with self.portal:
+        if packed_kwargs is None:
             packed_kwargs = KwArgs(**kwargs).pack()
-            fn_call_signature = self.get_signature(packed_kwargs)
-            with LoggingFnExecutionFrame(fn_call_signature) as frame:
-                result = super().execute(**kwargs)
-                frame._register_execution_result(result)
-                return result
+        fn_call_signature = self.get_signature(packed_kwargs)
+        with LoggingFnExecutionFrame(fn_call_signature) as frame:
+            frame._register_execution_inputs(kwargs)
+            result = super()._invoke(plan, kwargs, packed_kwargs)
+            frame._register_execution_result(result)
+            return result
 
 
     @property
@@ -471,6 +554,20 @@ class LoggingFnCallSignature(ImmutableMixin, CacheablePropertiesMixin,
             return result
 
 
+    @property
+    def execution_profiles(self) -> PersiDict:
+        """Profiles of executions of this call (when profiling is enabled).
+
+        Returns:
+            PersiDict: Append-only PKL sub-dictionary of profile artifacts;
+            see merge_execution_profiles() to aggregate them.
+        """
+        with self.portal as portal:
+            profiles_path = self.addr + ["profiles"]
+            profiles = portal._run_history.pkl.get_subdict(profiles_path)
+            return profiles
+
+
     @property
     def crashes(self) -> PersiDict:
         """Timeline of crashes (exceptions) observed during this call.
@@ -591,6 +688,76 @@ class LoggingFnExecutionRecord(NotPicklableMixin, SingleThreadEnforcerMixin):
         return self.call_signature.portal
 
 
+    @cached_property
+    def _execution_attempts(self) -> PersiDict:
+        """Attempts sub-dictionary of the call signature, resolved once."""
+        return self.call_signature.execution_attempts
+
+
+    @cached_property
+    def _execution_outputs(self) -> PersiDict:
+        """Outputs sub-dictionary of the call signature, resolved once."""
+        return self.call_signature.execution_outputs
+
+
+    @cached_property
+    def _execution_results(self) -> PersiDict:
+        """Results sub-dictionary of the call signature, resolved once."""
+        return self.call_signature.execution_results
+
+
+    @cached_property
+    def _execution_profiles(self) -> PersiDict:
+        """Profiles sub-dictionary of the call signature, resolved once."""
+        return self.call_signature.execution_profiles
+
+
+    @cached_property
+    def _crashes(self) -> PersiDict:
+        """Crashes sub-dictionary of the call signature, resolved once."""
+        return self.call_signature.crashes
+
+
+    @cached_property
+    def _events(self) -> PersiDict:
+        """Events sub-dictionary of the call signature, resolved once."""
+        return self.call_signature.events
+
+
+    def _collect_numbered_artifacts(
+            self, artifacts: PersiDict, infix: str) -> list[dict]:
+        """Fetch sequentially numbered session artifacts by direct key access.
+
+        LoggingFnExecutionFrame numbers crashes and events of a session
+        with a counter that starts at zero, so the artifacts can be
+        retrieved by probing ``{session_id}_{infix}_0``, ``_1``, ...
+        without listing the sub-dictionary. A failed write leaves a gap
+        in the numbering, so probing stops only after
+        _MAX_MISSING_ARTIFACTS_IN_A_ROW consecutive missing keys.
+
+        Args:
+            artifacts: The sub-dictionary holding the artifacts.
+            infix: Artifact kind used in keys ("crash" or "event").
+
+        Returns:
+            list[dict]: Artifact payloads in the order they were logged.
+        """
+        result = []
+        index = 0
+        n_missing = 0
+        with self.portal:
+            while n_missing < _MAX_MISSING_ARTIFACTS_IN_A_ROW:
+                key = f"{self.session_id}_{infix}_{index}"
+                index += 1
+                payload = artifacts.get(key, None)
+                if payload is None:
+                    n_missing += 1
+                    continue
+                n_missing = 0
+                result.append(payload)
+        return result
+
+
     @property
     def output(self) -> str|None:
         """Combined stdout/stderr/logging output captured for the session.
@@ -600,12 +767,8 @@ class LoggingFnExecutionRecord(NotPicklableMixin, SingleThreadEnforcerMixin):
             was recorded for this session.
         """
         with self.portal:
-            execution_outputs = self.call_signature.execution_outputs
             output_key = f"{self.session_id}_output"
-            for k in execution_outputs:
-                if k[-1] == output_key:
-                    return execution_outputs[k]
-            return None
+            return self._execution_outputs.get(output_key, None)
 
 
     @property
@@ -617,12 +780,21 @@ class LoggingFnExecutionRecord(NotPicklableMixin, SingleThreadEnforcerMixin):
             None if not present (e.g., verbose logging disabled).
         """
         with self.portal:
-            execution_attempts = self.call_signature.execution_attempts
             attempt_key = f"{self.session_id}_attempt"
-            for k in execution_attempts:
-                if k[-1] == attempt_key:
-                    return execution_attempts[k]
-            return None
+            return self._execution_attempts.get(attempt_key, None)
+
+
+    @property
+    def profile(self) -> dict|None:
+        """cProfile/tracemalloc statistics collected for the session.
+
+        Returns:
+            dict | None: The profile artifact, or None if the session
+            was not profiled.
+        """
+        with self.portal:
+            profile_key = f"{self.session_id}_profile"
+            return self._execution_profiles.get(profile_key, None)
 
 
     @property
@@ -632,14 +804,7 @@ class LoggingFnExecutionRecord(NotPicklableMixin, SingleThreadEnforcerMixin):
         Returns:
             list[dict]: A list of exception payload dicts in chronological order.
         """
-        result = []
-        with self.portal:
-            crashes = self.call_signature.crashes
-            crash_prefix = f"{self.session_id}_crash_"
-            for k in crashes:
-                if k[-1].startswith(crash_prefix):
-                    result.append(crashes[k])
-        return result
+        return self._collect_numbered_artifacts(self._crashes, "crash")
 
 
     @property
@@ -649,14 +814,7 @@ class LoggingFnExecutionRecord(NotPicklableMixin, SingleThreadEnforcerMixin):
         Returns:
             list[dict]: A list of event payload dicts in chronological order.
         """
-        result = []
-        with self.portal:
-            events = self.call_signature.events
-            event_prefix = f"{self.session_id}_event_"
-            for k in events:
-                if k[-1].startswith(event_prefix):
-                    result.append(events[k])
-        return result
+        return self._collect_numbered_artifacts(self._events, "event")
 
 
     @property
@@ -670,14 +828,13 @@ class LoggingFnExecutionRecord(NotPicklableMixin, SingleThreadEnforcerMixin):
             ValueError: If there is no stored result for this session ID.
         """
         with self.portal:
-            execution_results = self.call_signature.execution_results
             result_key = f"{self.session_id}_result"
-            for k in execution_results:
-                if k[-1] == result_key:
-                    return execution_results[k].get()
-            raise ValueError(
-                f"Result for session {self.session_id} not found in "
-                f"{self.call_signature.fn_name} execution results.")
+            result_addr = self._execution_results.get(result_key, None)
+            if result_addr is None:
+                raise ValueError(
+                    f"Result for session {self.session_id} not found in "
+                    f"{self.call_signature.fn_name} execution results.")
+            return result_addr.get()
 
 
 class LoggingFnExecutionFrame(NotPicklableMixin,SingleThreadEnforcerMixin):
@@ -691,7 +848,8 @@ class LoggingFnExecutionFrame(NotPicklableMixin,SingleThreadEnforcerMixin):
     4. Registers execution attempt metadata (if verbose_logging enabled)
     5. Routes any exceptions/events to both function-level and portal-level logs
     6. Stores the result and captured output (if verbose_logging enabled)
-    7. Pops itself from the call_stack on exit
+    7. Records resource metrics of the execution (always)
+    8. Pops itself from the call_stack on exit
 
     The class-level call_stack enables nested function calls to work correctly,
     with each frame knowing its parent and able to route events to the
@@ -708,9 +866,18 @@ class LoggingFnExecutionFrame(NotPicklableMixin,SingleThreadEnforcerMixin):
             and log_exception() to determine which function is currently active.
         session_id: Unique identifier (e.g., "run_abc123") for this execution.
         fn_call_signature: The call signature being executed.
-        output_capturer: Optional OutputCapturer instance (when verbose_logging=True).
+        output_capturer: Optional OutputCapturer instance (when this
+            execution is verbosely logged).
+        verbose_logging: Whether this particular execution is fully
+            instrumented, drawn once per frame according to the function's
+            verbose logging sample rate.
+        verbose_logging_rate: The function's verbose logging sample rate.
+        profiler: Optional _ExecutionProfiler (when the "profiling"
+            setting is enabled for the function or the portal).
         exception_counter: Count of exceptions logged during this execution.
         event_counter: Count of custom events logged during this execution.
+        bytes_in: Estimated in-memory size of the call's arguments, if known.
+        bytes_out: Estimated in-memory size of the call's result, if known.
     """
     call_stack: list[LoggingFnExecutionFrame] = []
 
@@ -718,10 +885,17 @@ class LoggingFnExecutionFrame(NotPicklableMixin,SingleThreadEnforcerMixin):
     fn_call_addr: ValueAddr
     fn_call_signature: LoggingFnCallSignature
     output_capturer: OutputCapturer | None
+    verbose_logging: bool
+    verbose_logging_rate: float
+    profiler: _ExecutionProfiler | None
     exception_counter: int
     event_counter: int
+    bytes_in: int | None
+    bytes_out: int | None
     context_used: bool
     _exit_stack: ExitStack | None
+    _start_wall_time: float | None
+    _start_cpu_time: float | None
 
     def __init__(self, fn_call_signature: LoggingFnCallSignature):
         """Initialize the execution frame for a specific function call.
@@ -736,16 +910,28 @@ class LoggingFnExecutionFrame(NotPicklableMixin,SingleThreadEnforcerMixin):
             self.session_id = "run_"+get_random_signature()
             self.fn_call_signature = fn_call_signature
             self.fn_call_addr = fn_call_signature.addr
+            self.verbose_logging_rate = self.fn.verbose_logging_rate
+            self.verbose_logging = self._sample_verbose_logging()
 
             if self.verbose_logging:
                 self.output_capturer = OutputCapturer()
             else:
                 self.output_capturer = None
 
+            if self.fn.get_effective_setting(_PROFILING_SETTING):
+                self.profiler = _ExecutionProfiler(profile_memory=bool(
+                    self.fn.get_effective_setting(_PROFILE_MEMORY_SETTING)))
+            else:
+                self.profiler = None
+
             self.exception_counter = 0
             self.event_counter = 0
+            self.bytes_in = None
+            self.bytes_out = None
             self.context_used = False
             self._exit_stack = None
+            self._start_wall_time = None
+            self._start_cpu_time = None
 
 
     @property
@@ -778,14 +964,32 @@ class LoggingFnExecutionFrame(NotPicklableMixin,SingleThreadEnforcerMixin):
         return self.fn_call_signature.fn_name
 
 
-    @property
-    def verbose_logging(self) -> bool:
-        """Whether the frame should capture detailed artifacts.
+    def _sample_verbose_logging(self) -> bool:
+        """Decide whether this execution should capture detailed artifacts.
 
         Returns:
-            True if verbose logging is enabled for the function.
+            True if verbose logging is fully enabled, or if this execution
+            falls into the sampled fraction; False otherwise.
+
+        Raises:
+            ValueError: If the "verbose_logging_sampling" setting is not
+                a supported mode.
         """
-        return self.fn.verbose_logging
+        rate = self.verbose_logging_rate
+        if rate >= 1:
+            return True
+        if rate <= 0:
+            return False
+        mode = self.fn.get_effective_setting(
+            _VERBOSE_LOGGING_SAMPLING_SETTING, "random")
+        if mode not in _VERBOSE_LOGGING_SAMPLING_MODES:
+            raise ValueError(
+                "verbose_logging_sampling must be one of "
+                f"{_VERBOSE_LOGGING_SAMPLING_MODES}, got {mode!r}")
+        if mode == "random":
+            return random.random() < rate
+        position = int(self.fn_call_addr.hash_signature[:8], 32) / 32**8
+        return position < rate
 
 
     @property
@@ -851,6 +1055,12 @@ class LoggingFnExecutionFrame(NotPicklableMixin,SingleThreadEnforcerMixin):
             LoggingFnExecutionFrame.call_stack.append(self)
             self._exit_stack.callback(LoggingFnExecutionFrame.call_stack.pop)
             self._register_execution_attempt()
+            if self.profiler is not None:
+                # Registered before entering, so it runs after profiler exit
+                self._exit_stack.callback(self._register_execution_profile)
+                self._exit_stack.enter_context(self.profiler)
+            self._start_wall_time = time.perf_counter()
+            self._start_cpu_time = time.process_time()
             return self
         except BaseException:
             self._exit_stack.close()
@@ -881,6 +1091,74 @@ class LoggingFnExecutionFrame(NotPicklableMixin,SingleThreadEnforcerMixin):
             self.fn.source_code)
 
 
+    def _register_execution_profile(self) -> None:
+        """Persist the collected profile next to the execution outputs.
+
+        Note:
+            No-op when the profiler was not active (e.g., nested inside
+            another profiled execution).
+        """
+        if self.profiler is None or self.profiler.profile is None:
+            return
+        profile = dict(fn_name=self.fn_name
+            , fn_hash=self.fn_addr.hash_signature
+            , session_id=self.session_id
+            , **self.profiler.profile)
+        execution_profiles = self.fn_call_signature.execution_profiles
+        execution_profiles[self.session_id + "_profile"] = profile
+
+
+    def _register_execution_inputs(self, kwargs: dict) -> None:
+        """Remember the estimated size of the call's arguments for metrics.
+
+        Args:
+            kwargs: The keyword arguments the function is called with.
+        """
+        self.bytes_in = _estimate_size_in_bytes(kwargs)
+
+
+    def _register_execution_metrics(self, crashed: bool) -> None:
+        """Persist the resource metrics of this execution.
+
+        Writes a compact record (wall time, CPU time, peak RSS of the
+        process so far, bytes in/out) to the portal's execution metrics store,
+        keyed by the function address and the session_id. Runs for every
+        execution, independently of verbose_logging.
+
+        Args:
+            crashed: Whether the execution ended with an exception.
+        """
+        if self._start_wall_time is None:
+            return
+        metrics = dict(
+            fn_name=self.fn_name
+            , fn_hash=self.fn_addr.hash_signature
+            , session_id=self.session_id
+            , timestamp=time.time()
+            , wall_time=time.perf_counter() - self._start_wall_time
+            , cpu_time=time.process_time() - self._start_cpu_time
+            , process_peak_rss=_get_process_peak_rss_bytes()
+            , bytes_in=self.bytes_in
+            , bytes_out=self.bytes_out
+            , crashed=crashed
+            , profile_addr=self._get_profile_addr())
+        self.portal._execution_metrics[
+            self.fn_addr + [self.session_id]] = metrics
+
+
+    def _get_profile_addr(self) -> list[str] | None:
+        """Location of this execution's profile within _run_history.pkl.
+
+        Returns:
+            list[str] | None: The key of the profile artifact, or None if
+            the execution is not being profiled.
+        """
+        if self.profiler is None or self.profiler._profiler is None:
+            return None
+        return list(self.fn_call_signature.addr
+            + ["profiles", self.session_id + "_profile"])
+
+
     def _register_execution_result(self, result: Any):
         """Persist the function's return value to enable result retrieval.
 
@@ -892,11 +1170,14 @@ class LoggingFnExecutionFrame(NotPicklableMixin,SingleThreadEnforcerMixin):
             result: The value returned by the wrapped function.
 
         Side Effects:
+            - Remembers the estimated size of the result for metrics
             - Stores result as ValueAddr in execution_results under session_id
 
         Note:
-            No-op when verbose_logging is disabled.
+            Apart from measuring the result size, no-op when
+            verbose_logging is disabled.
         """
+        self.bytes_out = _estimate_size_in_bytes(result)
         if not self.verbose_logging:
             return
         execution_results = self.fn_call_signature.execution_results
@@ -907,8 +1188,9 @@ class LoggingFnExecutionFrame(NotPicklableMixin,SingleThreadEnforcerMixin):
     def __exit__(self, exc_type, exc_value, trace_back):
         """Exit the execution frame context.
 
-        Ensures the current exception (if any) is logged, then delegates
-        cleanup to the ExitStack which handles: popping from call stack,
+        Ensures the current exception (if any) is logged and the execution
+        metrics are recorded, then delegates cleanup to the ExitStack which
+        handles: popping from call stack,
         closing output capturer (and storing captured output), and exiting
         the portal context - all in reverse order of entry.
 
@@ -919,6 +1201,10 @@ class LoggingFnExecutionFrame(NotPicklableMixin,SingleThreadEnforcerMixin):
         """
         try:
             log_exception()
+            try:
+                self._register_execution_metrics(crashed=exc_type is not None)
+            except Exception:
+                pass  # Metrics are best-effort; never fail the execution
         finally:
             self._exit_stack.__exit__(exc_type, exc_value, trace_back)
 
@@ -926,6 +1212,13 @@ class LoggingFnExecutionFrame(NotPicklableMixin,SingleThreadEnforcerMixin):
 _EXCEPTIONS_TOTAL_TXT: Final[str] = "Exceptions, total"
 _EXCEPTIONS_TODAY_TXT: Final[str] = "Exceptions, today"
 _VERBOSE_LOGGING_TXT: Final[str] = "Verbose logging"
+_TOP_CRASH_FINGERPRINTS_TXT: Final[str] = "Top crash fingerprints"
+
+_CRASH_PAYLOADS_PER_WINDOW_SETTING: Final[str] = "crash_payloads_per_window"
+_CRASH_PRINTING_SETTING: Final[str] = "crash_printing"
+_CRASH_PRINTING_MODES: Final[tuple[str, ...]] = ("full", "summary", "silent")
+_MAX_CRASH_SAMPLE_SESSIONS: Final[int] = 10
+_MAX_TOP_CRASH_FINGERPRINTS: Final[int] = 5
 
 class LoggingCodePortal(OrdinaryCodePortal):
     """A portal that supports function-level logging for events and exceptions.
@@ -947,15 +1240,24 @@ class LoggingCodePortal(OrdinaryCodePortal):
     stack of nested 'with' statements.
 
     The class also supports logging uncaught exceptions globally.
+
+    Recurring crashes are aggregated by exception fingerprint (exception
+    type plus traceback locations) in `_crash_fingerprints`, one record per
+    fingerprint per GMT day. If the `crash_payloads_per_window` setting is
+    configured, only the first that many occurrences of a fingerprint within
+    a day are stored with their full payload; later ones only increment the
+    counters of the aggregate record. By default, every payload is stored.
     """
 
     _run_history: OverlappingMultiDict | None
     _crash_history: PersiDict | None
+    _crash_fingerprints: PersiDict | None
     _event_history: PersiDict | None
+    _execution_metrics: PersiDict | None
 
 
     def __init__(self, root_dict:PersiDict|str|None = None
-            , verbose_logging: bool|Joker = KEEP_CURRENT
+            , verbose_logging: bool|float|Joker = KEEP_CURRENT
             ):
         """Construct a LoggingCodePortal.
 
@@ -964,20 +1266,19 @@ class LoggingCodePortal(OrdinaryCodePortal):
                 storage root. When None, a default in-memory or configured
                 PersiDict is used by the base DataPortal.
             verbose_logging: If True, functions executed via this portal will
-                store detailed artifacts (attempts/results/outputs). If
-                KEEP_CURRENT, the setting is inherited when cloning or
-                otherwise unspecified.
+                store detailed artifacts (attempts/results/outputs). A float
+                in [0, 1] enables this only for a sampled fraction of
+                executions. If KEEP_CURRENT, the setting is inherited when
+                cloning or otherwise unspecified.
 
         Raises:
-            TypeError: If verbose_logging is not a bool or Joker.
+            TypeError: If verbose_logging is not a bool, float, or Joker.
+            ValueError: If verbose_logging is a float outside [0, 1].
         """
         super().__init__(root_dict=root_dict)
         del root_dict
 
-        if not isinstance(verbose_logging,(Joker,bool)):
-            raise TypeError(
-                "verbose_logging must be a boolean or Joker, "
-                f"got {type(verbose_logging)}")
+        _validate_verbose_logging(verbose_logging, (Joker,))
 
         self._auxiliary_config_params_at_init["verbose_logging"
             ] = verbose_logging
@@ -988,12 +1289,28 @@ class LoggingCodePortal(OrdinaryCodePortal):
             dict(serialization_format="json", append_only=True , digest_len=0))
         self._crash_history = type(self._root_dict)(**crash_history_params)
 
+        crash_fingerprints_prototype = self._root_dict.get_subdict(
+            "crash_fingerprints")
+        crash_fingerprints_params = crash_fingerprints_prototype.get_params()
+        crash_fingerprints_params.update(
+            dict(serialization_format="json", append_only=False, digest_len=0))
+        self._crash_fingerprints = type(self._root_dict)(
+            **crash_fingerprints_params)
+
         event_history_prototype = self._root_dict.get_subdict("event_history")
         event_history_params = event_history_prototype.get_params()
         event_history_params.update(
             dict(serialization_format="json", append_only=True, digest_len=0))
         self._event_history = type(self._root_dict)(**event_history_params)
 
+        execution_metrics_prototype = self._root_dict.get_subdict(
+            "execution_metrics")
+        execution_metrics_params = execution_metrics_prototype.get_params()
+        execution_metrics_params.update(
+            dict(serialization_format="json", append_only=True, digest_len=0))
+        self._execution_metrics = type(self._root_dict)(
+            **execution_metrics_params)
+
         run_history_prototype = self._root_dict.get_subdict("run_history")
         run_history_shared_params = run_history_prototype.get_params()
         dict_type = type(self._root_dict)
@@ -1013,12 +1330,19 @@ class LoggingCodePortal(OrdinaryCodePortal):
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Exit the portal context, ensuring any active exception is logged.
 
+        Nested (re-entered) exits look for an exception only when one is
+        propagating out of the block, so that the common exception-free
+        nested exit is just a counter decrement. The outermost exit always
+        checks, which also covers exceptions handled inside the block.
+        Each exception is logged once, no matter how many exits it passes.
+
         Args:
             exc_type: Exception class raised within the portal context, if any.
             exc_val: Exception instance, if any.
             exc_tb: Traceback object, if any.
         """
-        log_exception()
+        if exc_type is not None or not self._is_reentered():
+            log_exception()
         super().__exit__(exc_type, exc_val, exc_tb)
 
 
@@ -1032,13 +1356,186 @@ class LoggingCodePortal(OrdinaryCodePortal):
         return bool(self.get_effective_setting("verbose_logging"))
 
 
+    @property
+    def crash_payloads_per_window(self) -> int | None:
+        """Max number of full crash payloads stored per fingerprint per day.
+
+        Configured via the "crash_payloads_per_window" portal setting
+        (not set by default). The daily counts live in the portal's storage,
+        so they are shared by all runs that use the portal on the same GMT
+        day. They are updated with a non-atomic read-modify-write: under
+        concurrent crashes, some occurrences may go uncounted, and a few
+        more payloads than the limit may be stored.
+
+        Returns:
+            The limit, beyond which occurrences are only counted;
+            None if all payloads are stored.
+
+        Raises:
+            TypeError: If the stored setting is neither a non-negative
+                integer nor None.
+        """
+        limit = self.get_effective_setting(
+            _CRASH_PAYLOADS_PER_WINDOW_SETTING, None)
+        if limit is None:
+            return None
+        if isinstance(limit, bool) or not isinstance(limit, int) or limit < 0:
+            raise TypeError(
+                "crash_payloads_per_window must be a non-negative int or None, "
+                f"got {get_long_infoname(limit)}")
+        return limit
+
+
+    @property
+    def crash_printing(self) -> str:
+        """How much of a logged crash is printed to stdout.
+
+        Configured via the "crash_printing" portal setting. Supported modes:
+        "full" prints the whole payload, "summary" prints a single line,
+        "silent" prints nothing. Crashes beyond crash_payloads_per_window
+        are never printed in full.
+
+        Returns:
+            One of "full", "summary", or "silent".
+
+        Raises:
+            ValueError: If the stored setting is not a supported mode.
+        """
+        mode = self.get_effective_setting(_CRASH_PRINTING_SETTING, "full")
+        if mode not in _CRASH_PRINTING_MODES:
+            raise ValueError(
+                f"crash_printing must be one of {_CRASH_PRINTING_MODES}, "
+                f"got {mode!r}")
+        return mode
+
+
+    def _register_crash_occurrence(self
+            , fingerprint: str
+            , exc_type: type | None
+            , session_id: str
+            ) -> int:
+        """Count a crash in today's aggregate record for its fingerprint.
+
+        Concurrent workers may race on the read-modify-write of the record,
+        so the counters are approximate under contention.
+
+        Args:
+            fingerprint: Fingerprint of the exception.
+            exc_type: The exception class.
+            session_id: ID of the execution session (or of the crash itself
+                when raised outside of any LoggingFn).
+
+        Returns:
+            int: How many times this fingerprint was seen today before
+            the current occurrence.
+        """
+        address = (current_date_gmt_string(), fingerprint)
+        now = time.time()
+        record = self._crash_fingerprints.get(address, None)
+        if record is None:
+            record = dict(
+                exception_type=getattr(exc_type, "__name__", str(exc_type))
+                , count=0, first_seen=now, sample_session_ids=[])
+        n_previous = record["count"]
+        record["count"] = n_previous + 1
+        record["last_seen"] = now
+        if len(record["sample_session_ids"]) < _MAX_CRASH_SAMPLE_SESSIONS:
+            record["sample_session_ids"].append(session_id)
+        self._crash_fingerprints[address] = record
+        return n_previous
+
+
+    def get_top_crash_fingerprints(self
+            , max_n: int = _MAX_TOP_CRASH_FINGERPRINTS) -> list[dict]:
+        """Return the most frequent crash fingerprints across all days.
+
+        Args:
+            max_n: Maximum number of fingerprints to return.
+
+        Returns:
+            list[dict]: Aggregates sorted by descending count, each with
+            the keys "fingerprint", "exception_type", "count", "last_seen",
+            and "sample_session_ids".
+        """
+        totals: dict[str, dict] = {}
+        for key, record in self._crash_fingerprints.items():
+            fingerprint = key[-1]
+            total = totals.setdefault(fingerprint, dict(
+                fingerprint=fingerprint
+                , exception_type=record["exception_type"]
+                , count=0, last_seen=0.0, sample_session_ids=[]))
+            total["count"] += record["count"]
+            total["last_seen"] = max(total["last_seen"], record["last_seen"])
+            room = _MAX_CRASH_SAMPLE_SESSIONS - len(total["sample_session_ids"])
+            total["sample_session_ids"].extend(
+                record["sample_session_ids"][:max(room, 0)])
+        result = sorted(totals.values(), key=lambda t: -t["count"])
+        return result[:max_n]
+
+
+    def get_execution_metrics(self, fn: LoggingFn | None = None
+            ) -> pd.DataFrame:
+        """Return resource metrics of past function executions.
+
+        Args:
+            fn: If provided, only executions of this function are included.
+
+        Returns:
+            pandas.DataFrame: One row per execution with the columns
+            fn_name, fn_hash, session_id, timestamp, wall_time, cpu_time,
+            process_peak_rss, bytes_in, bytes_out, and crashed. Times are
+            in seconds, sizes in bytes. process_peak_rss is the peak RSS of
+            the worker process since it started, not of the execution alone.
+        """
+        metrics_store = self._execution_metrics
+        if fn is not None:
+            with self:
+                metrics_store = metrics_store.get_subdict(fn.addr)
+        records = [record for record in metrics_store.values()]
+        return _build_execution_metrics_frame(records)
+
+
+    def get_execution_profiles(self, fn: LoggingFn) -> list[dict]:
+        """Return all stored profiles of a function's executions.
+
+        Profiles are located through the execution metrics of the function,
+        so no scan of the run history is needed.
+
+        Args:
+            fn: The function whose profiles to collect.
+
+        Returns:
+            list[dict]: Profile artifacts; pass them to
+            merge_execution_profiles() or format_collapsed_stacks().
+        """
+        profiles = []
+        metrics = self.get_execution_metrics(fn)
+        for profile_addr in metrics["profile_addr"].dropna():
+            profile = self._run_history.pkl.get(tuple(profile_addr), None)
+            if profile is not None:
+                profiles.append(profile)
+        return profiles
+
+
+    def get_execution_metrics_summary(self) -> pd.DataFrame:
+        """Return per-function aggregates of the execution metrics.
+
+        Returns:
+            pandas.DataFrame: One row per function with count, crashes,
+            p50/p95 wall time, total CPU time, max process peak RSS, and total
+            bytes in/out, most expensive functions first.
+        """
+        return summarize_execution_metrics(self.get_execution_metrics())
+
+
     def describe(self) -> pd.DataFrame:
         """Summarize the portal's current persistent and runtime state.
 
         Returns:
             pandas.DataFrame: A table with key characteristics, including
-            total crashes logged, today's crashes, and whether verbose
-            logging is enabled, combined with the base DataPortal summary.
+            total crashes logged, today's crashes, the most frequent crash
+            fingerprints, and whether verbose logging is enabled, combined
+            with the base DataPortal summary.
         """
         all_params = [super().describe()]
         all_params.append(_describe_persistent_characteristic(
@@ -1048,6 +1545,11 @@ class LoggingCodePortal(OrdinaryCodePortal):
             , len(self._crash_history.get_subdict(current_date_gmt_string()))))
         all_params.append(_describe_runtime_characteristic(
             _VERBOSE_LOGGING_TXT, self.verbose_logging))
+        top_fingerprints = "; ".join(
+            f"{t['exception_type']} {t['fingerprint']}: {t['count']}"
+            for t in self.get_top_crash_fingerprints())
+        all_params.append(_describe_persistent_characteristic(
+            _TOP_CRASH_FINGERPRINTS_TXT, top_fingerprints))
 
         result = pd.concat(all_params)
         result.reset_index(drop=True, inplace=True)
@@ -1064,7 +1566,9 @@ class LoggingCodePortal(OrdinaryCodePortal):
             - Unregisters global uncaught exception handlers.
         """
         self._crash_history = None
+        self._crash_fingerprints = None
         self._event_history = None
+        self._execution_metrics = None
         self._run_history = None
         unregister_systemwide_uncaught_exception_handlers()
         super()._clear()
@@ -1078,6 +1582,12 @@ def log_exception() -> None:
     called during a function execution with verbose logging enabled, also
     stores the event under the function's per-call crash log.
 
+    Every occurrence is counted in the portal's per-fingerprint aggregates.
+    If the portal's crash_payloads_per_window limit is set and a fingerprint
+    exceeds it for the current day, the full payload (with its environment summary) is
+    no longer persisted at portal level, the per-call crash log receives a
+    compact payload, and only a one-line summary is printed.
+
     Returns:
         None
     """
@@ -1092,12 +1602,14 @@ def log_exception() -> None:
             exception_id = frame.session_id + "_crash_"
             exception_id += str(frame.exception_counter)
             frame.exception_counter += 1
+            session_id = frame.session_id
         else:
             frame = None
             exception_id = "portal_" + get_random_signature() + "_crash"
+            session_id = exception_id
 
-        event_body = add_execution_environment_summary(
-            exc_type=exc_type, exc_value=exc_value, trace_back=trace_back)
+        fingerprint = get_exception_fingerprint(
+            exc_type, exc_value, trace_back)
         # CRITICAL: Mark exception as processed BEFORE persistence.
         # Moving this after persistence causes infinite loops: the write
         # operations below can trigger code paths that re-check
@@ -1107,20 +1619,50 @@ def log_exception() -> None:
         _mark_exception_as_processed(exc_type, exc_value, trace_back)
 
         logging_failures = []
-        if frame is not None and frame.verbose_logging:
+        portal = None
+        n_previous = 0
+        payloads_limit = None
+        printing_mode = "full"
+        try:
+            portal = get_current_portal()
+            payloads_limit = portal.crash_payloads_per_window
+            printing_mode = portal.crash_printing
+            n_previous = portal._register_crash_occurrence(
+                fingerprint, exc_type, session_id)
+        except Exception as logging_error:
+            logging_failures.append(logging_error)
+        store_full_payload = (payloads_limit is None
+            or n_previous < payloads_limit)
+
+        if store_full_payload:
+            event_body = add_execution_environment_summary(
+                exc_type=exc_type, exc_value=exc_value, trace_back=trace_back
+                , exception_fingerprint=fingerprint)
+        else:
+            event_body = dict(exc_type=exc_type, exc_value=exc_value
+                , exception_fingerprint=fingerprint
+                , occurrence=n_previous + 1)
+
+        if frame is not None and frame.verbose_logging_rate > 0:
             try:
                 frame.fn_call_signature.crashes[exception_id] = event_body
             except Exception as logging_error:
                 logging_failures.append(logging_error)
 
-        try:
-            portal = get_current_portal()
-            address = (current_date_gmt_string(),exception_id)
-            portal._crash_history[address] = event_body
-        except Exception as logging_error:
-            logging_failures.append(logging_error)
-        print(f"Exception logged: {exception_id}")
-        pprint(event_body)
+        if store_full_payload and portal is not None:
+            try:
+                address = (current_date_gmt_string(),exception_id)
+                portal._crash_history[address] = event_body
+            except Exception as logging_error:
+                logging_failures.append(logging_error)
+
+        if store_full_payload and printing_mode == "full":
+            print(f"Exception logged: {exception_id}")
+            pprint(event_body)
+        elif printing_mode != "silent":
+            print(f"Exception logged: {exception_id} "
+                  f"({getattr(exc_type, '__name__', exc_type)}, "
+                  f"fingerprint {fingerprint}, occurrence {n_previous + 1})")
         if logging_failures:
             for logging_error in logging_failures:
                 print("Logging process failed while logging exception:")
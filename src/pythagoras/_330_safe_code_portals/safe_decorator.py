@@ -28,7 +28,7 @@ class safe(logging):
     """
 
     def __init__(self
-                 , verbose_logging: bool|None|Joker|ReuseFlag = KEEP_CURRENT
+                 , verbose_logging: bool|float|None|Joker|ReuseFlag = KEEP_CURRENT
                  , portal: SafeCodePortal | None|ReuseFlag = None):
         """Create a safe decorator bound to an optional portal.
 
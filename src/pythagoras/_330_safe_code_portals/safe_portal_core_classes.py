@@ -34,7 +34,7 @@ class SafeCodePortal(LoggingCodePortal):
 
     def __init__(self
                  , root_dict: PersiDict|str|None = None
-                 , verbose_logging: bool|Joker = KEEP_CURRENT
+                 , verbose_logging: bool|float|Joker = KEEP_CURRENT
                  ):
         """Initialize a SafeCodePortal.
 
@@ -100,7 +100,7 @@ class SafeFn(LoggingFn):
     def __init__(self
                  , fn: Callable|str
                  , portal: LoggingCodePortal|None|ReuseFlag = None
-                 , verbose_logging: bool|Joker|ReuseFlag = KEEP_CURRENT
+                 , verbose_logging: bool|float|Joker|ReuseFlag = KEEP_CURRENT
                  ):
         """Create a SafeFn wrapper.
 
@@ -63,7 +63,7 @@ class autonomous(safe):
 
     def __init__(self
                  , fixed_kwargs: dict | None = None
-                 , verbose_logging: bool|Joker|ReuseFlag = KEEP_CURRENT
+                 , verbose_logging: bool|float|Joker|ReuseFlag = KEEP_CURRENT
                  , portal: AutonomousCodePortal | None = None
                  ):
         """Initialize the decorator.
@@ -40,7 +40,7 @@ class AutonomousCodePortal(SafeCodePortal):
     """
     def __init__(self
             , root_dict: PersiDict | str | None = None
-            , verbose_logging: bool|Joker = KEEP_CURRENT
+            , verbose_logging: bool|float|Joker = KEEP_CURRENT
             ):
         """Create an autonomous code portal.
 
@@ -138,7 +138,7 @@ class AutonomousFn(SafeFn):
 
     def __init__(self, fn: Callable|str|SafeFn
                  , fixed_kwargs: dict[str,Any]|None = None
-                 , verbose_logging: bool|Joker|ReuseFlag = KEEP_CURRENT
+                 , verbose_logging: bool|float|Joker|ReuseFlag = KEEP_CURRENT
                  , portal: AutonomousCodePortal|None|ReuseFlag = None):
         """Construct an AutonomousFn and validate autonomy constraints.
 
@@ -200,7 +200,7 @@ class AutonomousFn(SafeFn):
                 f"position in the package hierarchy and violate autonomy. "
                 f"Please use absolute imports instead (e.g., 'from mypackage import x').")
 
-        import_required = analyzer.names.explicitly_global_unbound_deep
+        import_required = set(analyzer.names.explicitly_global_unbound_deep)
         import_required |= analyzer.names.unclassified_deep
         builtin_names = set(dir(builtins))
         import_required -= builtin_names
@@ -258,13 +258,52 @@ class AutonomousFn(SafeFn):
             raise RuntimeError(f"No fixed kwargs stored for AutonomousFn {self.name}")
 
 
-    def execute(self, **kwargs) -> Any:
+    def _build_invocation_plan(self, portal):
+        """Extend the invocation plan with the resolved fixed kwargs.
+
+        Adds ``fixed_kwargs`` (unpacked values) and ``packed_fixed_kwargs``
+        (their ValueAddr handles), so calls don't copy or unpack them again.
+
+        Args:
+            portal: The portal the function is executed in.
+
+        Returns:
+            The invocation plan.
+        """
+        plan = super()._build_invocation_plan(portal)
+        plan.fixed_kwargs = self.fixed_kwargs
+        plan.packed_fixed_kwargs = self.packed_fixed_kwargs
+        return plan
+
+
+    def _invoke(self, plan, kwargs, packed_kwargs) -> Any:
         """Execute the function within the portal, applying fixed kwargs.
 
         Any kwargs provided here must not overlap with pre-bound fixed kwargs.
 
         Args:
-            **kwargs: Call-time keyword arguments.
+            plan: The invocation plan for the active portal.
+            kwargs: Call-time keyword arguments.
+            packed_kwargs: The packed call-time arguments, or None.
+
+        Returns:
+            Any: Result of the wrapped function call.
+
+        Raises:
+            ValueError: If provided kwargs overlap with fixed kwargs.
+        """
+        kwargs, packed_kwargs = self._bind_fixed_kwargs(
+            plan, kwargs, packed_kwargs)
+        return super()._invoke(plan, kwargs, packed_kwargs)
+
+
+    def _invoke_lean(self, plan, kwargs, packed_kwargs) -> Any:
+        """Run the function without per-call records, applying fixed kwargs.
+
+        Args:
+            plan: The invocation plan for the active portal.
+            kwargs: Call-time keyword arguments.
+            packed_kwargs: The packed call-time arguments, or None.
 
         Returns:
             Any: Result of the wrapped function call.
@@ -272,12 +311,37 @@ class AutonomousFn(SafeFn):
         Raises:
             ValueError: If provided kwargs overlap with fixed kwargs.
         """
-        with self.portal:
-            overlapping_keys = set(kwargs.keys()) & set(self.fixed_kwargs.keys())
+        kwargs, packed_kwargs = self._bind_fixed_kwargs(
+            plan, kwargs, packed_kwargs)
+        return super()._invoke_lean(plan, kwargs, packed_kwargs)
+
+
+    def _bind_fixed_kwargs(self, plan, kwargs, packed_kwargs
+            ) -> tuple[dict[str, Any], PackedKwArgs | None]:
+        """Merge the fixed kwargs into the call-time arguments.
+
+        Args:
+            plan: The invocation plan for the active portal.
+            kwargs: Call-time keyword arguments.
+            packed_kwargs: The packed call-time arguments, or None.
+
+        Returns:
+            The merged kwargs and, if packed_kwargs was given, the merged
+            packed kwargs (otherwise None).
+
+        Raises:
+            ValueError: If provided kwargs overlap with fixed kwargs.
+        """
+        fixed_kwargs = plan.fixed_kwargs
+        if fixed_kwargs:
+            overlapping_keys = kwargs.keys() & fixed_kwargs.keys()
             if len(overlapping_keys) != 0:
                 raise ValueError(f"Overlapping kwargs with fixed kwargs: {sorted(overlapping_keys)}")
-            call_kwargs = {**kwargs, **self.fixed_kwargs}
-            return super().execute(**call_kwargs)
+            kwargs = {**kwargs, **fixed_kwargs}
+            if packed_kwargs is not None:
+                packed_kwargs = PackedKwArgs(
+                    **packed_kwargs, **plan.packed_fixed_kwargs)
+        return kwargs, packed_kwargs
 
 
     def get_signature(self, arguments:dict) -> AutonomousFnCallSignature:
@@ -315,12 +379,17 @@ class AutonomousFn(SafeFn):
             raise ValueError(f"Overlapping kwargs with fixed kwargs: {sorted(overlapping_keys)}")
         new_fixed_kwargs = {**self.fixed_kwargs, **kwargs}
 
-        # Preserve portal and verbose_logging from parent
+        # Preserve portal and verbose_logging (incl. sample rate) from parent
+        verbose_logging_rate = self.verbose_logging_rate
+        if 0 < verbose_logging_rate < 1:
+            verbose_logging = verbose_logging_rate
+        else:
+            verbose_logging = bool(verbose_logging_rate)
 
         new_fn = type(self)(fn=self,
             fixed_kwargs=new_fixed_kwargs,
             portal=self._linked_portal,
-            verbose_logging=self.verbose_logging)
+            verbose_logging=verbose_logging)
 
         return new_fn
 
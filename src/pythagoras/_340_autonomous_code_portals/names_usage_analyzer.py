@@ -1,9 +1,17 @@
 import ast
 from functools import cache
-from typing import Callable
+from typing import Callable, Final
 
+from .._110_supporting_utilities import (
+    get_node_local_cache, get_node_local_cache_key)
 from .._310_ordinary_code_portals import get_normalized_fn_source_code_str
 
+_NAMES_ANALYSIS_CACHE_NAME: Final[str] = "names_usage_analysis"
+
+_NAMES_SET_ATTRIBUTES: Final[tuple[str, ...]] = (
+    "explicitly_global_unbound_deep", "explicitly_nonlocal_unbound_deep"
+    , "local", "imported", "unclassified_deep", "accessible")
+
 class NamesUsedInFunction:
     """Classification of all names referenced within a function and its nested scopes.
 
@@ -556,10 +564,91 @@ class NamesUsageAnalyzer(ast.NodeVisitor):
         self.names.accessible |= globals
         self.generic_visit(node)
 
+def _analyzer_to_record(analyzer: NamesUsageAnalyzer) -> dict:
+    """Convert the results of a completed analysis into a JSON-friendly dict.
+
+    Args:
+        analyzer: A NamesUsageAnalyzer that has visited a function.
+
+    Returns:
+        dict: The name sets (as sorted lists) and counters of the analysis.
+    """
+    names = {attr: sorted(getattr(analyzer.names, attr))
+        for attr in _NAMES_SET_ATTRIBUTES}
+    names["function"] = analyzer.names.function
+    names["has_relative_imports"] = analyzer.names.has_relative_imports
+    return dict(names=names
+        , imported_packages_deep=sorted(analyzer.imported_packages_deep)
+        , n_yelds=analyzer.n_yelds)
+
+
+def _analyzer_from_record(record: dict) -> NamesUsageAnalyzer:
+    """Rebuild a NamesUsageAnalyzer from a dict made by _analyzer_to_record.
+
+    Args:
+        record: The stored results of an analysis.
+
+    Returns:
+        NamesUsageAnalyzer: An analyzer holding the stored results, as if
+        it had just visited the function.
+    """
+    analyzer = NamesUsageAnalyzer()
+    names = record["names"]
+    for attr in _NAMES_SET_ATTRIBUTES:
+        setattr(analyzer.names, attr, set(names[attr]))
+    analyzer.names.function = names["function"]
+    analyzer.names.has_relative_imports = bool(names["has_relative_imports"])
+    analyzer.imported_packages_deep = set(record["imported_packages_deep"])
+    analyzer.n_yelds = int(record["n_yelds"])
+    return analyzer
+
+
 @cache
 def _validate_and_parse_function_source(
         normalized_source: str
         ) -> dict[str, NamesUsageAnalyzer | str]:
+    """Analyze normalized function source, using the node-local cache.
+
+    Results are cached in-process and, keyed by the hash of the normalized
+    source and the Pythagoras version, on disk, so that re-creating the same function (e.g., in
+    fix_kwargs() clones or in swarm workers) skips the AST traversal.
+    Errors are never cached.
+
+    The returned analyzer is shared by all callers and must not be modified.
+
+    Args:
+        normalized_source: Normalized function source code to validate and parse.
+
+    Returns:
+        Dictionary with the NamesUsageAnalyzer ("analyzer") and the
+        analyzed source ("normalized_source").
+
+    Raises:
+        ValueError: If the source is not a single conventional function definition.
+    """
+    cache_key = get_node_local_cache_key(normalized_source)
+    node_cache = get_node_local_cache(_NAMES_ANALYSIS_CACHE_NAME)
+    if node_cache is not None:
+        try:
+            record = node_cache.get(cache_key, None)
+            if record is not None:
+                return dict(analyzer=_analyzer_from_record(record)
+                    , normalized_source=normalized_source)
+        except Exception:
+            pass  # A corrupted or unreadable entry is treated as a miss
+
+    result = _validate_and_parse_function_source_uncached(normalized_source)
+    if node_cache is not None:
+        try:
+            node_cache[cache_key] = _analyzer_to_record(result["analyzer"])
+        except Exception:
+            pass  # Caching is best-effort
+    return result
+
+
+def _validate_and_parse_function_source_uncached(
+        normalized_source: str
+        ) -> dict[str, NamesUsageAnalyzer | str]:
     """Validate that normalized source is a single function definition and parse it.
 
     Args:
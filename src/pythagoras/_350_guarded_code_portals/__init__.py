@@ -14,6 +14,8 @@ Main Exports
 - ResultCheckFn: Base class for post-execution result checks.
 - NO_OBJECTIONS: Sentinel indicating a successful check.
 - MAX_REQUIREMENT_ITERATIONS: Maximum retry iterations for requirements.
+- get_node_resources: Free CPU/RAM on this node, sampled once for all
+  local processes and smoothed.
 
 Requirement Factories
 ---------------------
@@ -21,11 +23,14 @@ Requirement Factories
 - unused_ram: Require minimum free RAM.
 - installed_packages: Ensure packages are installed.
 - required_environment_variables: Require environment variables.
+- get_resource_demand: CPU/RAM a guarded function declares via
+  unused_cpu/unused_ram requirements.
 """
 
 from .no_objections_const import *
 from .guarded_portal_core_classes import *
 from .guarded_decorators import *
 from .system_resources_info_getters import *
+from .node_resources_sampler import *
 from .basic_requirements import *
 
@@ -18,13 +18,21 @@ Conventions:
   are treated as FAILURE, not success. Only NO_OBJECTIONS
   (the sentinel singleton) indicates success. The check uses
   identity comparison (``is NO_OBJECTIONS``), not truthiness.
+
+Caching:
+- Each factory declares how long the outcome of its requirements may be
+  reused within a process (see SimpleRequirementFn success_ttl and
+  failure_ttl). Resource and environment checks are reused for about
+  a second, while a successfully verified package stays verified until
+  the process exits.
 """
 
-from typing import TYPE_CHECKING
+import math
+from typing import TYPE_CHECKING, Final
 
-from .._350_guarded_code_portals import SimpleRequirementFn
+from .._350_guarded_code_portals import SimpleRequirementFn, GuardedFn
 from .no_objections_const import NoObjectionsFlag
-from .._110_supporting_utilities import is_valid_env_name
+from .._110_supporting_utilities import is_valid_env_name, get_long_infoname
 
 # The requirement functions below use `pth` and `self` which are injected into
 # their global namespace at runtime by the portal framework (see module docstring).
@@ -34,6 +42,11 @@ if TYPE_CHECKING:
     import pythagoras as pth
     self = None
 
+# How long (in seconds) the outcome of a check of volatile node state
+# (free resources, environment variables) is reused within a process
+# before the node is inspected again.
+_SHORT_CHECK_TTL: Final[float] = 1.0
+
 
 def _at_least_X_CPU_cores_free_check(n: int) -> NoObjectionsFlag | None:
     """Pass if at least the specified logical CPU cores are currently free.
@@ -46,7 +59,8 @@ def _at_least_X_CPU_cores_free_check(n: int) -> NoObjectionsFlag | None:
         tolerance); otherwise None.
 
     Note:
-        Uses instantaneous metrics; momentary spikes may affect the outcome.
+        Uses the node's shared, smoothed resource readings
+        (see get_unused_cpu_cores), so momentary spikes don't flip the outcome.
     """
     cores = pth.get_unused_cpu_cores()
     if cores >= n - 0.1:
@@ -71,7 +85,9 @@ def unused_cpu(cores: int) -> SimpleRequirementFn:
         raise TypeError("cores must be an int")
     if cores <= 0:
         raise ValueError("cores must be > 0")
-    return SimpleRequirementFn(_at_least_X_CPU_cores_free_check).fix_kwargs(n=cores)
+    return SimpleRequirementFn(_at_least_X_CPU_cores_free_check
+        , success_ttl=_SHORT_CHECK_TTL, failure_ttl=_SHORT_CHECK_TTL
+        ).fix_kwargs(n=cores)
 
 
 def _at_least_X_G_RAM_free_check(x: int) -> NoObjectionsFlag | None:
@@ -107,7 +123,9 @@ def unused_ram(Gb: int) -> SimpleRequirementFn:
         raise TypeError("Gb must be an int")
     if Gb <= 0:
         raise ValueError("Gb must be > 0")
-    return SimpleRequirementFn(_at_least_X_G_RAM_free_check).fix_kwargs(x=Gb)
+    return SimpleRequirementFn(_at_least_X_G_RAM_free_check
+        , success_ttl=_SHORT_CHECK_TTL, failure_ttl=_SHORT_CHECK_TTL
+        ).fix_kwargs(x=Gb)
 
 
 def _check_python_package_and_install_if_needed(
@@ -280,7 +298,10 @@ def installed_packages(*args) -> list[SimpleRequirementFn]:
         if not isinstance(package_name, str):
             raise TypeError("All package names must be strings")
         # TODO: check if the package is available on pypi.org
-        new_requirement = SimpleRequirementFn(_check_python_package_and_install_if_needed)
+        # Once a package is importable, it stays so until the process exits;
+        # failures are not cached, since they may trigger an installation.
+        new_requirement = SimpleRequirementFn(
+            _check_python_package_and_install_if_needed, success_ttl=math.inf)
         new_requirement = new_requirement.fix_kwargs(package_name=package_name)
         requirements.append(new_requirement)
     return requirements
@@ -328,7 +349,48 @@ def required_environment_variables(*names) -> list[SimpleRequirementFn]:
 
     requirements = []
     for name in names:
-        new_requirement = SimpleRequirementFn(_environment_variable_availability_check)
+        new_requirement = SimpleRequirementFn(
+            _environment_variable_availability_check
+            , success_ttl=_SHORT_CHECK_TTL)
         new_requirement = new_requirement.fix_kwargs(name=name)
         requirements.append(new_requirement)
     return requirements
+
+
+# Requirement checks that declare an amount of a node resource:
+# check function name -> (resource, fixed kwarg name, units per kwarg unit).
+_RESOURCE_DEMAND_CHECKS: Final[dict[str, tuple[str, str, float]]] = {
+    _at_least_X_CPU_cores_free_check.__name__: ("cpu_cores", "n", 1),
+    _at_least_X_G_RAM_free_check.__name__: ("ram_mb", "x", 1024)}
+
+
+def get_resource_demand(fn: GuardedFn) -> dict[str, float]:
+    """Return the node resources a guarded function declares it needs.
+
+    The demand is read from the function's unused_cpu() and unused_ram()
+    requirements; other requirements don't declare resources.
+
+    Args:
+        fn: The guarded function to inspect.
+
+    Returns:
+        dict[str, float]: "cpu_cores" (logical cores) and "ram_mb";
+        zero for resources the function doesn't declare.
+
+    Raises:
+        TypeError: If fn is not a GuardedFn.
+    """
+    if not isinstance(fn, GuardedFn):
+        raise TypeError(f"fn must be a GuardedFn, got {get_long_infoname(fn)}")
+    demand = dict(cpu_cores=0.0, ram_mb=0.0)
+    for requirement in fn.requirements:
+        if not isinstance(requirement, SimpleRequirementFn):
+            continue
+        declaration = _RESOURCE_DEMAND_CHECKS.get(requirement.name)
+        if declaration is None:
+            continue
+        resource, kwarg_name, scale = declaration
+        amount = requirement.fixed_kwargs.get(kwarg_name)
+        if isinstance(amount, (int, float)) and not isinstance(amount, bool):
+            demand[resource] = max(demand[resource], float(amount * scale))
+    return demand
@@ -44,7 +44,7 @@ class guarded(autonomous):
                  , requirements: list[ExtensionFn] | None = None
                  , result_checks: list[ExtensionFn] | None = None
                  , fixed_kwargs: dict[str,Any] | None = None
-                 , verbose_logging: bool|Joker|ReuseFlag = KEEP_CURRENT
+                 , verbose_logging: bool|float|Joker|ReuseFlag = KEEP_CURRENT
                  , portal: GuardedCodePortal | None | ReuseFlag = None
                  ):
         """Initialize the guarded decorator.
@@ -16,8 +16,9 @@ Under the hood, extensions are autonomous functions.
 
 from __future__ import annotations
 
+import math
+import time
 from collections.abc import Iterable
-from copy import copy
 from typing import Final
 
 from mixinforge import sort_dict_by_keys, flatten_nested_collection
@@ -36,6 +37,41 @@ from .._110_supporting_utilities import get_long_infoname
 # GuardedFnCallSignature objects without making progress.
 MAX_REQUIREMENT_ITERATIONS: Final[int] = 10000
 
+# Settings keys that control how long the outcome of a simple requirement
+# is reused within a process before the requirement is evaluated again.
+_REQUIREMENT_SUCCESS_TTL: Final[str] = "requirement_success_ttl"
+_REQUIREMENT_FAILURE_TTL: Final[str] = "requirement_failure_ttl"
+
+# Per-process cache of simple requirement outcomes:
+# requirement hash_signature -> (outcome, monotonic expiration time).
+_requirement_outcomes: dict[str, tuple[NoObjectionsFlag | None, float]] = {}
+
+
+def _validate_requirement_ttl(name: str, ttl: Any) -> None:
+    """Validate a requirement outcome TTL.
+
+    Args:
+        name: Parameter name used in error messages.
+        ttl: None (no caching), KEEP_CURRENT, or a non-negative number
+            of seconds; math.inf caches the outcome until the process exits.
+
+    Raises:
+        TypeError: If ttl is not None, KEEP_CURRENT, int, or float.
+        ValueError: If ttl is negative or NaN.
+    """
+    if ttl is None or ttl is KEEP_CURRENT:
+        return
+    if isinstance(ttl, bool) or not isinstance(ttl, (int, float)):
+        raise TypeError(f"{name} must be None or a number of seconds, "
+                        f"got {get_long_infoname(ttl)}")
+    if math.isnan(ttl) or ttl < 0:
+        raise ValueError(f"{name} must be non-negative, got {ttl}")
+
+
+def _clear_requirement_outcomes() -> None:
+    """Forget all cached simple requirement outcomes in this process."""
+    _requirement_outcomes.clear()
+
 
 class GuardedCodePortal(AutonomousCodePortal):
     """Portal for guarded code execution.
@@ -53,7 +89,7 @@ class GuardedCodePortal(AutonomousCodePortal):
 
     def __init__(self
             , root_dict: PersiDict|str|None = None
-            , verbose_logging: bool|Joker = KEEP_CURRENT
+            , verbose_logging: bool|float|Joker = KEEP_CURRENT
             ):
         """Initialize the portal."""
         super().__init__(root_dict=root_dict
@@ -79,7 +115,7 @@ class GuardedFn(AutonomousFn):
     def __init__(self, fn: Callable | str
                  , requirements: list[ExtensionFn] | list[Callable] | ExtensionFn | Callable | None = None
                  , result_checks: list[ExtensionFn] | list[Callable] | ExtensionFn | Callable | None = None
-                 , verbose_logging: bool | Joker | ReuseFlag = KEEP_CURRENT
+                 , verbose_logging: bool | float | Joker | ReuseFlag = KEEP_CURRENT
                  , fixed_kwargs: dict[str,Any] | None = None
                  , portal: GuardedCodePortal | None | ReuseFlag = None):
         """Construct a GuardedFn.
@@ -170,6 +206,21 @@ class GuardedFn(AutonomousFn):
         return [address.get() for address in self._result_checks_addrs]
 
 
+    def _build_invocation_plan(self, portal):
+        """Extend the invocation plan with the requirements and result checks.
+
+        Args:
+            portal: The portal the function is executed in.
+
+        Returns:
+            The invocation plan.
+        """
+        plan = super()._build_invocation_plan(portal)
+        plan.requirements = tuple(self.requirements)
+        plan.result_checks = tuple(self.result_checks)
+        return plan
+
+
     def can_be_executed(self
             , kw_args: KwArgs
             ) -> GuardedFnCallSignature|NoObjectionsFlag|None:
@@ -189,19 +240,37 @@ class GuardedFn(AutonomousFn):
             or None if a requirement fails.
         """
         with self.portal as portal:
-            kw_args = kw_args.pack()
-            requirements = copy(self.requirements)
-            portal.entropy_infuser.shuffle(requirements)
-            for requirement in requirements:
-                if isinstance(requirement, SimpleRequirementFn):
-                    requirement_result = requirement()
-                else:
-                    requirement_result = requirement(packed_kwargs=kw_args, fn_addr = self.addr)
-                if isinstance(requirement_result, GuardedFnCallSignature):
-                    return requirement_result
-                elif requirement_result is not NO_OBJECTIONS:
-                    return None
-            return NO_OBJECTIONS
+            plan = self._get_invocation_plan(portal)
+            return self._check_requirements(plan, kw_args.pack())
+
+
+    def _check_requirements(self, plan, packed_kwargs: PackedKwArgs
+            ) -> GuardedFnCallSignature|NoObjectionsFlag|None:
+        """Run the requirements of an invocation plan (see can_be_executed).
+
+        Args:
+            plan: The invocation plan for the active portal.
+            packed_kwargs: Packed arguments intended for the wrapped function.
+
+        Returns:
+            NO_OBJECTIONS, a GuardedFnCallSignature to execute first,
+            or None if a requirement fails.
+        """
+        requirements = plan.requirements
+        if len(requirements) > 1:
+            requirements = list(requirements)
+            plan.portal.entropy_infuser.shuffle(requirements)
+        for requirement in requirements:
+            if isinstance(requirement, SimpleRequirementFn):
+                requirement_result = requirement._get_outcome()
+            else:
+                requirement_result = requirement._execute_lean(dict(
+                    packed_kwargs=packed_kwargs, fn_addr = self.addr))
+            if isinstance(requirement_result, GuardedFnCallSignature):
+                return requirement_result
+            elif requirement_result is not NO_OBJECTIONS:
+                return None
+        return NO_OBJECTIONS
 
 
     def validate_execution_result(self
@@ -217,17 +286,34 @@ class GuardedFn(AutonomousFn):
             NO_OBJECTIONS if all result checks pass, otherwise None.
         """
         with self.portal as portal:
-            kw_args = kw_args.pack()
-            result_checks = copy(self.result_checks)
-            portal.entropy_infuser.shuffle(result_checks)
-            for result_check in result_checks:
-                if result_check(packed_kwargs=kw_args, fn_addr = self.addr
-                        , result=result) is not NO_OBJECTIONS:
-                    return None
-            return NO_OBJECTIONS
+            plan = self._get_invocation_plan(portal)
+            return self._check_result(plan, kw_args.pack(), result)
+
+
+    def _check_result(self, plan, packed_kwargs: PackedKwArgs
+            , result: Any) -> NoObjectionsFlag|None:
+        """Run the result checks of an invocation plan.
+
+        Args:
+            plan: The invocation plan for the active portal.
+            packed_kwargs: Packed arguments passed to the guarded function.
+            result: The value returned by the guarded function.
+
+        Returns:
+            NO_OBJECTIONS if all result checks pass, otherwise None.
+        """
+        result_checks = plan.result_checks
+        if len(result_checks) > 1:
+            result_checks = list(result_checks)
+            plan.portal.entropy_infuser.shuffle(result_checks)
+        for result_check in result_checks:
+            if result_check._execute_lean(dict(packed_kwargs=packed_kwargs
+                    , fn_addr = self.addr, result=result)) is not NO_OBJECTIONS:
+                return None
+        return NO_OBJECTIONS
 
 
-    def execute(self, **kwargs) -> Any:
+    def _invoke(self, plan, kwargs, packed_kwargs) -> Any:
         """Execute the guarded function with requirements and result checks.
 
         Performs the execution loop:
@@ -236,8 +322,13 @@ class GuardedFn(AutonomousFn):
         2. Execute the wrapped function
         3. Run result checks and verify they all succeed
 
+        Functions without requirements and result checks skip the loop
+        entirely.
+
         Args:
-            **kwargs: Keyword arguments to pass to the wrapped function.
+            plan: The invocation plan for the active portal.
+            kwargs: Keyword arguments to pass to the wrapped function.
+            packed_kwargs: The packed arguments, or None to pack them here.
 
         Returns:
             The result returned by the wrapped function.
@@ -246,28 +337,30 @@ class GuardedFn(AutonomousFn):
             FunctionError: If requirements or result checks fail, or if the
                 requirement loop exceeds MAX_REQUIREMENT_ITERATIONS.
         """
-        with (self.portal):
-            kw_args = KwArgs(**kwargs)
-            for iteration in range(MAX_REQUIREMENT_ITERATIONS):
-                validation_result = self.can_be_executed(kw_args)
-                if isinstance(validation_result, GuardedFnCallSignature):
-                    validation_result.execute()
-                    continue
-                elif validation_result is None:
-                    raise FunctionError(f"Requirements failed "
-                                        f"for function {self.name}")
-                result = super().execute(**kwargs)
-
-                if (self.validate_execution_result(kw_args, result)
-                         is not NO_OBJECTIONS):
-                    raise FunctionError(f"Result checks failed "
-                                        f"for function {self.name}")
-                return result
-            raise FunctionError(
-                f"Requirement loop exceeded {MAX_REQUIREMENT_ITERATIONS} "
-                f"iterations for function {self.name}. This may indicate a "
-                f"circular dependency between requirements or requirements that "
-                f"never reach a successful state.")
+        if not plan.requirements and not plan.result_checks:
+            return super()._invoke(plan, kwargs, packed_kwargs)
+        if packed_kwargs is None:
+            packed_kwargs = KwArgs(**kwargs).pack()
+        for iteration in range(MAX_REQUIREMENT_ITERATIONS):
+            validation_result = self._check_requirements(plan, packed_kwargs)
+            if isinstance(validation_result, GuardedFnCallSignature):
+                validation_result.execute()
+                continue
+            elif validation_result is None:
+                raise FunctionError(f"Requirements failed "
+                                    f"for function {self.name}")
+            result = super()._invoke(plan, kwargs, packed_kwargs)
+
+            if (self._check_result(plan, packed_kwargs, result)
+                     is not NO_OBJECTIONS):
+                raise FunctionError(f"Result checks failed "
+                                    f"for function {self.name}")
+            return result
+        raise FunctionError(
+            f"Requirement loop exceeded {MAX_REQUIREMENT_ITERATIONS} "
+            f"iterations for function {self.name}. This may indicate a "
+            f"circular dependency between requirements or requirements that "
+            f"never reach a successful state.")
 
 
     def _normalize_extensions(self
@@ -374,7 +467,7 @@ class ExtensionFn(AutonomousFn):
     """
     def __init__(self, fn: Callable | str | AutonomousFn
         , fixed_kwargs: dict | None = None
-        , verbose_logging: bool | Joker = KEEP_CURRENT
+        , verbose_logging: bool | float | Joker = KEEP_CURRENT
         , portal: AutonomousCodePortal | None = None):
         """Initialize an extension function wrapper.
 
@@ -420,11 +513,49 @@ class ExtensionFn(AutonomousFn):
             Depends on extension type and outcome: NO_OBJECTIONS,
             GuardedFnCallSignature, or any other value (e.g. None) for failure.
         """
+        self._check_kwargs_names(kwargs)
+        return super().execute(**kwargs)
+
+
+    def _check_kwargs_names(self, kwargs: dict[str, Any]) -> None:
+        """Verify that kwargs match get_allowed_kwargs_names() exactly.
+
+        Args:
+            kwargs: Keyword arguments of the call.
+
+        Raises:
+            ValueError: If the names differ from the allowed ones.
+        """
         expected = self.get_allowed_kwargs_names()
         provided = set(kwargs)
         if provided != expected:
             raise ValueError(f"Invalid kwargs for {type(self).__name__}: expected {sorted(expected)}, got {sorted(provided)}")
-        return super().execute(**kwargs)
+
+
+    def _execute_lean(self, kwargs: dict[str, Any]
+            ) -> GuardedFnCallSignature | NoObjectionsFlag | None:
+        """Run the extension on behalf of a guarded function.
+
+        Extensions run on every call of a guarded function, so this path
+        goes through _invoke_lean() instead of _invoke(): no execution
+        frame, no persisted call signature, and no packing of the (already
+        packed) arguments. Fixed kwargs are still applied, and exceptions
+        are still logged before they propagate.
+
+        Args:
+            kwargs: Keyword arguments, exactly get_allowed_kwargs_names().
+
+        Returns:
+            Same as execute().
+        """
+        self._check_kwargs_names(kwargs)
+        with self.portal as portal:
+            plan = self._get_invocation_plan(portal)
+            try:
+                return self._invoke_lean(plan, kwargs, None)
+            except Exception:
+                log_exception()
+                raise
 
 
 class RequirementFn(ExtensionFn):
@@ -444,7 +575,7 @@ class RequirementFn(ExtensionFn):
     """
     def __init__(self, fn: Callable | str | AutonomousFn
         , fixed_kwargs: dict | None = None
-        , verbose_logging: bool | Joker = KEEP_CURRENT
+        , verbose_logging: bool | float | Joker = KEEP_CURRENT
         , portal: AutonomousCodePortal | None = None):
         """Initialize a pre-execution requirement wrapper.
 
@@ -466,11 +597,19 @@ class SimpleRequirementFn(RequirementFn):
 
     The wrapped callable must accept no parameters. Use fixed_kwargs for any
     configuration needed during the requirement check.
+
+    Since a simple requirement only depends on the state of the node,
+    its outcome can be reused within a process for a while. How long
+    is controlled by the success_ttl and failure_ttl settings; by default,
+    outcomes are not cached. A GuardedFnCallSignature outcome (a request to
+    run a prerequisite action first) and exceptions are never cached.
     """
     def __init__(self, fn: Callable | str | AutonomousFn
         , fixed_kwargs: dict | None = None
-        , verbose_logging: bool | Joker = KEEP_CURRENT
-        , portal: AutonomousCodePortal | None = None):
+        , verbose_logging: bool | float | Joker = KEEP_CURRENT
+        , portal: AutonomousCodePortal | None = None
+        , success_ttl: float | None | Joker = KEEP_CURRENT
+        , failure_ttl: float | None | Joker = KEEP_CURRENT):
         """Initialize a simple requirement.
 
         Args:
@@ -478,13 +617,86 @@ class SimpleRequirementFn(RequirementFn):
             fixed_kwargs: Fixed keyword arguments, if any.
             verbose_logging: Controls verbose logging.
             portal: Optional portal binding.
+            success_ttl: Seconds to reuse a NO_OBJECTIONS outcome within
+                the process; math.inf reuses it until the process exits,
+                None disables caching. KEEP_CURRENT inherits the value from
+                fn when fn is a SimpleRequirementFn.
+            failure_ttl: Seconds to reuse a failed outcome within the
+                process. Same conventions as success_ttl.
+
+        Raises:
+            TypeError: If a TTL is not None, KEEP_CURRENT, or a number.
+            ValueError: If a TTL is negative.
         """
+        _validate_requirement_ttl("success_ttl", success_ttl)
+        _validate_requirement_ttl("failure_ttl", failure_ttl)
         super().__init__(
             fn=fn
             , fixed_kwargs=fixed_kwargs
             , verbose_logging=verbose_logging
             , portal=portal)
 
+        for key, ttl in ((_REQUIREMENT_SUCCESS_TTL, success_ttl)
+                , (_REQUIREMENT_FAILURE_TTL, failure_ttl)):
+            if ttl is KEEP_CURRENT and isinstance(fn, SimpleRequirementFn):
+                ttl = fn._auxiliary_config_params_at_init.get(
+                    key, KEEP_CURRENT)
+            self._auxiliary_config_params_at_init[key] = ttl
+
+
+    @property
+    def success_ttl(self) -> float:
+        """Seconds a NO_OBJECTIONS outcome is reused within the process."""
+        return self._get_ttl(_REQUIREMENT_SUCCESS_TTL)
+
+
+    @property
+    def failure_ttl(self) -> float:
+        """Seconds a failed outcome is reused within the process."""
+        return self._get_ttl(_REQUIREMENT_FAILURE_TTL)
+
+
+    def _get_ttl(self, key: str) -> float:
+        """Resolve an outcome TTL setting, treating missing values as 0."""
+        ttl = self.get_effective_setting(key)
+        if ttl is None or ttl is KEEP_CURRENT:
+            return 0
+        _validate_requirement_ttl(key, ttl)
+        return ttl
+
+
+    def _get_outcome(self) -> GuardedFnCallSignature | NoObjectionsFlag | None:
+        """Evaluate the requirement, reusing a recent outcome if possible.
+
+        Returns:
+            NO_OBJECTIONS if the requirement is met, a GuardedFnCallSignature
+            to execute first, or None if the requirement is not met.
+        """
+        key = self.hash_signature
+        cached = _requirement_outcomes.get(key)
+        if cached is not None and time.monotonic() < cached[1]:
+            return cached[0]
+        outcome = self._execute_lean({})
+        if isinstance(outcome, GuardedFnCallSignature):
+            return outcome
+        if outcome is not NO_OBJECTIONS:
+            outcome = None
+            ttl = self.failure_ttl
+        else:
+            ttl = self.success_ttl
+        if ttl > 0:
+            _requirement_outcomes[key] = (outcome, time.monotonic() + ttl)
+        else:
+            _requirement_outcomes.pop(key, None)
+        return outcome
+
+
+    def _clear(self) -> None:
+        """Clear registration state and forget the cached outcome."""
+        if self._init_finished:
+            _requirement_outcomes.pop(self.hash_signature, None)
+        super()._clear()
+
 
     @classmethod
     def get_allowed_kwargs_names(cls) -> set[str]:
@@ -500,7 +712,7 @@ class ComplexRequirementFn(RequirementFn):
     """
     def __init__(self, fn: Callable | str | AutonomousFn
         , fixed_kwargs: dict | None = None
-        , verbose_logging: bool | Joker = KEEP_CURRENT
+        , verbose_logging: bool | float | Joker = KEEP_CURRENT
         , portal: AutonomousCodePortal | None = None):
         """Initialize a complex requirement.
 
@@ -541,7 +753,7 @@ class ResultCheckFn(ExtensionFn):
     """
     def __init__(self, fn: Callable | str | AutonomousFn
         , fixed_kwargs: dict | None = None
-        , verbose_logging: bool | Joker = KEEP_CURRENT
+        , verbose_logging: bool | float | Joker = KEEP_CURRENT
         , portal: AutonomousCodePortal | None = None):
         """Initialize a post-execution result check.
 
@@ -0,0 +1,192 @@
+"""Node-level sampler of free CPU and RAM shared by all local processes.
+
+Requirement checks (unused_cpu, unused_ram) and swarm worker sizing need
+the amount of free resources on the node over and over again, in every
+worker process. Probing the OS each time is wasteful, and on systems
+without load averages it even blocks for 100 ms.
+
+Instead, resources are sampled at most about once per sampling interval
+for the whole node, and the reading is published in a node-local cache
+(see get_node_local_cache) from which all processes read it. There is no
+daemon: whichever process finds the published reading stale takes a new
+sample and publishes it. Within a process, the latest reading is also
+reused for a short while, so consuming it usually costs next to nothing.
+If node-local caching is disabled, each process samples on its own.
+
+Along with the latest raw values, every reading carries exponentially
+smoothed ones, which don't flap on momentary spikes of resource usage.
+
+Public API
+----------
+get_node_resources(smoothed=True) → dict
+    Return free CPU cores and RAM (MB) on this node, as last sampled.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import time
+from typing import Any, Final
+
+import psutil
+
+from .._110_supporting_utilities import (
+    get_node_local_cache, get_long_infoname)
+from .system_resources_info_getters import (
+    _probe_unused_cpu_cores, _probe_unused_ram_mb)
+
+_SAMPLING_INTERVAL_SECONDS: Final[float] = 1.0
+_PROCESS_REUSE_SECONDS: Final[float] = 0.2
+_SMOOTHING_TIME_CONSTANT_SECONDS: Final[float] = 5.0
+
+_NODE_RESOURCES_CACHE_NAME: Final[str] = "node_resources"
+_NODE_RESOURCES_KEY: Final[str] = "latest_reading"
+_READING_FORMAT_VERSION: Final[int] = 1
+
+# Latest reading seen by this process: (monotonic time of read, reading).
+_process_reading: tuple[float, dict[str, Any]] | None = None
+
+
+def _get_busy_cpu_fraction(previous_cpu_times: list[float] | None
+        , cpu_times: Any) -> float | None:
+    """Compute the busy CPU fraction between two cpu_times() snapshots.
+
+    Args:
+        previous_cpu_times: An earlier psutil.cpu_times() snapshot as a list,
+            possibly taken by another process on this node.
+        cpu_times: The current psutil.cpu_times() snapshot.
+
+    Returns:
+        float | None: The fraction of CPU time spent busy between the two
+        snapshots, or None if it can't be determined.
+    """
+    if not previous_cpu_times or len(previous_cpu_times) != len(cpu_times):
+        return None
+    total_delta = sum(cpu_times) - sum(previous_cpu_times)
+    if total_delta <= 0:
+        return None
+    idle_index = cpu_times._fields.index("idle")
+    idle_delta = cpu_times.idle - previous_cpu_times[idle_index]
+    return min(max(1 - idle_delta / total_delta, 0.0), 1.0)
+
+
+def _has_load_average() -> bool:
+    """Check whether the OS reports load averages."""
+    return os.name != "nt" and hasattr(os, "getloadavg")
+
+
+def _is_valid_reading(reading: Any) -> bool:
+    """Check whether a published reading has the expected format."""
+    return (isinstance(reading, dict)
+        and reading.get("format_version") == _READING_FORMAT_VERSION)
+
+
+def _take_sample(previous: dict[str, Any] | None) -> dict[str, Any]:
+    """Sample free resources and update the smoothed values.
+
+    Args:
+        previous: The previous reading on this node, or None.
+
+    Returns:
+        dict: A new reading with raw and smoothed values.
+    """
+    now = time.time()
+    cpu_times = None
+    unused_cpu_cores = None
+    if not _has_load_average():
+        # Without load averages, measure CPU usage since the previous
+        # sample instead of blocking to sample it.
+        current_cpu_times = psutil.cpu_times()
+        cpu_times = list(current_cpu_times)
+        busy_fraction = None
+        if previous is not None:
+            busy_fraction = _get_busy_cpu_fraction(
+                previous.get("cpu_times"), current_cpu_times)
+        if busy_fraction is not None:
+            cpu_count = psutil.cpu_count(logical=True) or 1
+            unused_cpu_cores = cpu_count * (1 - busy_fraction)
+    if unused_cpu_cores is None:
+        unused_cpu_cores = _probe_unused_cpu_cores()
+    unused_ram_mb = _probe_unused_ram_mb()
+
+    smoothed_cpu_cores = unused_cpu_cores
+    smoothed_ram_mb = unused_ram_mb
+    if previous is not None:
+        elapsed = now - previous["timestamp"]
+        if 0 <= elapsed <= 10 * _SMOOTHING_TIME_CONSTANT_SECONDS:
+            weight = 1 - math.exp(-elapsed / _SMOOTHING_TIME_CONSTANT_SECONDS)
+            smoothed_cpu_cores = previous["smoothed_unused_cpu_cores"] + (
+                weight * (unused_cpu_cores
+                    - previous["smoothed_unused_cpu_cores"]))
+            smoothed_ram_mb = previous["smoothed_unused_ram_mb"] + (
+                weight * (unused_ram_mb - previous["smoothed_unused_ram_mb"]))
+
+    return dict(format_version=_READING_FORMAT_VERSION
+        , timestamp=now
+        , unused_cpu_cores=float(unused_cpu_cores)
+        , unused_ram_mb=float(unused_ram_mb)
+        , smoothed_unused_cpu_cores=float(smoothed_cpu_cores)
+        , smoothed_unused_ram_mb=float(smoothed_ram_mb)
+        , cpu_times=cpu_times)
+
+
+def _get_latest_reading() -> dict[str, Any]:
+    """Return a recent reading, sampling the node only if it is stale.
+
+    Returns:
+        dict: The latest reading of free resources on this node.
+    """
+    global _process_reading
+    now = time.monotonic()
+    if (_process_reading is not None
+            and now - _process_reading[0] < _PROCESS_REUSE_SECONDS):
+        return _process_reading[1]
+
+    node_cache = get_node_local_cache(_NODE_RESOURCES_CACHE_NAME)
+    reading = None
+    if node_cache is not None:
+        try:
+            reading = node_cache.get(_NODE_RESOURCES_KEY)
+        except Exception:
+            reading = None
+    if not _is_valid_reading(reading):
+        reading = _process_reading[1] if _process_reading else None
+
+    age = None if reading is None else time.time() - reading["timestamp"]
+    if age is None or not 0 <= age < _SAMPLING_INTERVAL_SECONDS:
+        reading = _take_sample(reading)
+        if node_cache is not None:
+            try:
+                node_cache[_NODE_RESOURCES_KEY] = reading
+            except Exception:
+                pass  # Publishing is best-effort
+
+    _process_reading = (now, reading)
+    return reading
+
+
+def get_node_resources(smoothed: bool = True) -> dict[str, float]:
+    """Return the free CPU cores and RAM on this node, as last sampled.
+
+    The node is sampled at most about once per second, no matter how many
+    processes ask; see the module docstring.
+
+    Args:
+        smoothed: If True, return exponentially smoothed values (a time
+            constant of a few seconds); otherwise, the latest raw sample.
+
+    Returns:
+        dict[str, float]: "unused_cpu_cores" (logical cores) and
+        "unused_ram_mb".
+
+    Raises:
+        TypeError: If smoothed is not a bool.
+    """
+    if not isinstance(smoothed, bool):
+        raise TypeError(
+            f"smoothed must be a bool, got {get_long_infoname(smoothed)}")
+    reading = _get_latest_reading()
+    prefix = "smoothed_" if smoothed else ""
+    return dict(unused_cpu_cores=reading[prefix + "unused_cpu_cores"]
+        , unused_ram_mb=reading[prefix + "unused_ram_mb"])
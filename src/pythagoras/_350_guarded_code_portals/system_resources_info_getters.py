@@ -2,13 +2,17 @@
 
 Provides functions to check unused RAM, CPU cores, and NVIDIA GPU capacity.
 Used by requirements to ensure sufficient resources before execution.
+
+Free RAM and CPU cores are read from the node's shared, smoothed resource
+readings (see get_node_resources); the private _probe_* functions query the
+OS directly and are what the node resources sampler uses to take samples.
 """
 import os
 import psutil
 
 
-def get_unused_ram_mb() -> int:
-    """Get the currently available RAM on the system in megabytes (MB).
+def _probe_unused_ram_mb() -> int:
+    """Query the OS for the currently available RAM in megabytes (MB).
 
     Returns:
         Integer number of megabytes of RAM currently available to user
@@ -22,8 +26,8 @@ def get_unused_ram_mb() -> int:
     return int(free_ram)
 
 
-def get_unused_cpu_cores() -> float:
-    """Estimate currently unused logical CPU capacity in units of CPU cores.
+def _probe_unused_cpu_cores() -> float:
+    """Query the OS for unused logical CPU capacity in units of CPU cores.
 
     On POSIX systems with load average support, uses the 1-minute load
     average: max(logical_cores - load1, 0). On other systems, samples CPU
@@ -49,6 +53,39 @@ def get_unused_cpu_cores() -> float:
         return cnt * (1 - usage / 100.0)
 
 
+def get_unused_ram_mb() -> int:
+    """Get the currently available RAM on the system in megabytes (MB).
+
+    Returns:
+        Integer number of megabytes of RAM available to user processes,
+        rounded down, as smoothed over the last few seconds.
+
+    Note:
+        The value comes from the node's shared resource readings (see
+        get_node_resources), which are sampled at most about once per
+        second for all processes on the node.
+    """
+    from .node_resources_sampler import get_node_resources
+    return int(get_node_resources()["unused_ram_mb"])
+
+
+def get_unused_cpu_cores() -> float:
+    """Estimate currently unused logical CPU capacity in units of CPU cores.
+
+    Returns:
+        Non-negative float representing approximate available logical CPU
+        cores, as smoothed over the last few seconds. For example, 2.5
+        means roughly two and a half cores free.
+
+    Note:
+        The value comes from the node's shared resource readings (see
+        get_node_resources), so momentary spikes don't flip the outcome
+        of requirements that use it, and calls don't block.
+    """
+    from .node_resources_sampler import get_node_resources
+    return get_node_resources()["unused_cpu_cores"]
+
+
 def get_unused_nvidia_gpus() -> float:
     """Estimate the total unused NVIDIA GPU capacity across all devices.
 
@@ -14,6 +14,8 @@ Main Exports
 - PureFn: Wrapped pure function with caching and address-based retrieval.
 - PureFnExecutionResultAddr: Address uniquely identifying a cached result.
 - pure: Decorator to create pure functions.
+- AddressGrid: Lazily built result addresses of calls over a parameter grid.
+- AddressList: Compactly stored result addresses returned by swarm_each().
 
 Utilities
 ---------
@@ -21,5 +23,6 @@ Utilities
 """
 
 from .pure_core_classes import *
+from .lazy_grids import *
 from .recursion_requirement import *
 from .pure_decorator import *
@@ -0,0 +1,248 @@
+"""Lazily materialized result addresses for large batches of calls.
+
+Expanding a grid into a list of keyword-argument dicts and building the
+result address of every call upfront hashes and stores each argument value
+once per grid point, and keeps every address in memory. For grids with
+millions of points, this exhausts memory and takes hours.
+
+An AddressGrid packs each distinct value of each axis once, when the grid
+is created, and builds the address of a call only when it is accessed:
+building it hashes just the point's small mapping of value addresses and
+its call signature. Requests for the calls are submitted in chunks of
+_SUBMISSION_CHUNK_SIZE addresses, so submission uses bounded memory
+regardless of the size of the grid, and the storage operations within
+a chunk are issued concurrently (see PureCodePortal.request_many).
+
+Calls given as an arbitrary stream of argument sets can't be rebuilt
+from a few axes, so an AddressList keeps just the hash signature of each
+address and rebuilds address objects on access, instead of keeping the
+objects themselves along with their cached arguments.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+from itertools import islice, product
+from typing import TYPE_CHECKING, Any, Final, Iterable, Iterator
+
+from .._110_supporting_utilities import get_long_infoname
+from .._220_data_portals import ValueAddr
+
+if TYPE_CHECKING:
+    from .pure_core_classes import (
+        PureCodePortal, PureFn, PureFnExecutionResultAddr)
+
+_SUBMISSION_CHUNK_SIZE: Final[int] = 1000
+
+
+def _normalize_index(index: Any, length: int) -> int:
+    """Validate an index into a sequence and make it non-negative.
+
+    Raises:
+        TypeError: If index is not an int.
+        IndexError: If index is out of range.
+    """
+    if isinstance(index, bool) or not isinstance(index, int):
+        raise TypeError(f"Grid indices must be ints, "
+                        f"got {get_long_infoname(index)}")
+    if index < 0:
+        index += length
+    if not 0 <= index < length:
+        raise IndexError(f"Grid index {index} is out of range "
+                         f"for an axis of length {length}")
+    return index
+
+
+class AddressGrid(Sequence):
+    """Result addresses of the calls over a parameter grid, built on access.
+
+    Works as a read-only sequence of PureFnExecutionResultAddr objects in
+    Cartesian product order. A grid point can also be accessed by its
+    coordinates, one index per parameter: for a grid dict(x=[...], y=[...]),
+    grid[i, j] is the address of the call with the i-th value of x and
+    the j-th value of y. Addresses are not kept, so every access builds
+    a new (equal) address object.
+    """
+
+    _fn: PureFn
+    _names: tuple[str, ...]
+    _axes: tuple[tuple[ValueAddr, ...], ...]
+    _shape: tuple[int, ...]
+    _size: int
+
+    def __init__(self, fn: PureFn, grid_of_kwargs: dict[str, Iterable[Any]]):
+        """Pack the values of a parameter grid.
+
+        Args:
+            fn: The pure function to be called over the grid.
+            grid_of_kwargs: Mapping of parameter names to lists of values.
+
+        Raises:
+            TypeError: If grid_of_kwargs is not a dict.
+        """
+        if not isinstance(grid_of_kwargs, dict):
+            raise TypeError(f"grid_of_kwargs must be a dict, "
+                            f"got {get_long_infoname(grid_of_kwargs)}")
+        self._fn = fn
+        with fn.portal:
+            self._names = tuple(grid_of_kwargs.keys())
+            self._axes = tuple(tuple(ValueAddr(value) for value in values)
+                for values in grid_of_kwargs.values())
+        self._shape = tuple(len(axis) for axis in self._axes)
+        self._size = math.prod(self._shape)
+
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """Number of values of each parameter, in the grid's order."""
+        return self._shape
+
+
+    def __len__(self) -> int:
+        """Return the number of grid points."""
+        return self._size
+
+
+    def __getitem__(self, index: int | slice | tuple[int, ...]
+            ) -> PureFnExecutionResultAddr | list[PureFnExecutionResultAddr]:
+        """Build the address(es) of the call(s) at a position in the grid.
+
+        Args:
+            index: Position in Cartesian product order, a slice of such
+                positions, or a tuple of coordinates, one per parameter.
+
+        Returns:
+            The result address, or a list of addresses for a slice.
+
+        Raises:
+            TypeError: If an index is not an int.
+            IndexError: If an index is out of range, or the number of
+                coordinates does not match the number of parameters.
+        """
+        if isinstance(index, slice):
+            return [self._build_address(self._unravel(i))
+                for i in range(*index.indices(self._size))]
+        if isinstance(index, tuple):
+            if len(index) != len(self._shape):
+                raise IndexError(f"Expected {len(self._shape)} coordinates, "
+                                 f"got {len(index)}")
+            coordinates = tuple(_normalize_index(i, n)
+                for i, n in zip(index, self._shape))
+            return self._build_address(coordinates)
+        return self._build_address(
+            self._unravel(_normalize_index(index, self._size)))
+
+
+    def __iter__(self) -> Iterator[PureFnExecutionResultAddr]:
+        """Yield the addresses of all calls in Cartesian product order."""
+        for coordinates in product(*(range(n) for n in self._shape)):
+            yield self._build_address(coordinates)
+
+
+    def _unravel(self, index: int) -> tuple[int, ...]:
+        """Convert a position in Cartesian product order to coordinates."""
+        coordinates = []
+        for n in reversed(self._shape):
+            index, coordinate = divmod(index, n)
+            coordinates.append(coordinate)
+        return tuple(reversed(coordinates))
+
+
+    def _build_address(self, coordinates: tuple[int, ...]
+            ) -> PureFnExecutionResultAddr:
+        """Build the result address of the call at the given coordinates."""
+        packed_kwargs = {name: axis[i]
+            for name, axis, i in zip(self._names, self._axes, coordinates)}
+        return self._fn.get_address(**packed_kwargs)
+
+
+class AddressList(Sequence):
+    """Result addresses of calls of one function, stored compactly.
+
+    Works as a read-only sequence of PureFnExecutionResultAddr objects.
+    Only the hash signature of each address is kept, so every access
+    builds a new (equal) address object, with the function attached.
+    """
+
+    _fn: PureFn
+    _address_type: type[PureFnExecutionResultAddr] | None
+    _descriptor: str | None
+    _hash_signatures: list[str]
+
+    def __init__(self, fn: PureFn):
+        """Create an empty list of result addresses of a function.
+
+        Args:
+            fn: The pure function whose calls are addressed.
+        """
+        self._fn = fn
+        self._address_type = None
+        self._descriptor = None
+        self._hash_signatures = []
+
+
+    def __len__(self) -> int:
+        """Return the number of addresses."""
+        return len(self._hash_signatures)
+
+
+    def __getitem__(self, index: int | slice
+            ) -> PureFnExecutionResultAddr | list[PureFnExecutionResultAddr]:
+        """Build the address(es) at a position in the list.
+
+        Args:
+            index: Position of an address, or a slice of positions.
+
+        Returns:
+            The result address, or a list of addresses for a slice.
+        """
+        if isinstance(index, slice):
+            return [self._build_address(hash_signature)
+                for hash_signature in self._hash_signatures[index]]
+        return self._build_address(self._hash_signatures[index])
+
+
+    def _append(self, address: PureFnExecutionResultAddr) -> None:
+        """Add the address of a call of the function to the end."""
+        if self._address_type is None:
+            self._address_type = type(address)
+            self._descriptor = address.descriptor
+        self._hash_signatures.append(address.hash_signature)
+
+
+    def _build_address(self, hash_signature: str
+            ) -> PureFnExecutionResultAddr:
+        """Rebuild a result address from its hash signature."""
+        address = self._address_type.from_strings(
+            descriptor=self._descriptor, hash_signature=hash_signature)
+        address._set_cached_properties(fn=self._fn)
+        return address
+
+
+def _request_in_chunks(portal: PureCodePortal
+        , addresses: Iterable[PureFnExecutionResultAddr], priority: int
+        ) -> None:
+    """Request execution of a stream of calls, one chunk at a time.
+
+    Calls within a chunk are requested in random order.
+    """
+    iterator = iter(addresses)
+    while chunk := list(islice(iterator, _SUBMISSION_CHUNK_SIZE)):
+        portal.entropy_infuser.shuffle(chunk)
+        portal.request_many(chunk, priority)
+
+
+def _request_grid(portal: PureCodePortal, grid: AddressGrid
+        , priority: int) -> None:
+    """Request execution of all calls in a grid, one chunk at a time.
+
+    Chunks are taken from random parts of the grid, and calls within
+    a chunk are requested in random order.
+    """
+    starts = list(range(0, len(grid), _SUBMISSION_CHUNK_SIZE))
+    portal.entropy_infuser.shuffle(starts)
+    for start in starts:
+        chunk = grid[start:start + _SUBMISSION_CHUNK_SIZE]
+        portal.entropy_infuser.shuffle(chunk)
+        portal.request_many(chunk, priority)
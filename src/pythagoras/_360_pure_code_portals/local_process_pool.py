@@ -0,0 +1,106 @@
+"""Local process-pool parallelism for synchronous batch calls of pure functions.
+
+PureFn.run_each() and the methods built on it execute their calls one by
+one in the calling process. With n_jobs > 1 they execute the cache misses
+in a pool of local processes instead. Each pool process reconstructs the
+caller's portal from its parameters (see PureCodePortal.
+_get_local_pool_jsparams), so the calls, their arguments and their results
+are shared through the portal's storage: the parent only sends result
+addresses and reads the results back. Cached calls are never dispatched.
+
+Misses are dispatched in chunks, several per process for load balancing;
+calls of batch functions (see PureFn.batch) are split into one chunk per
+process, each executed as one vectorized call.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import TYPE_CHECKING, Any, Final
+
+import mixinforge
+
+from .._110_supporting_utilities import get_long_infoname
+
+if TYPE_CHECKING:
+    from .pure_core_classes import PureCodePortal, PureFnExecutionResultAddr
+
+_CHUNKS_PER_JOB: Final[int] = 4
+
+_pool_portal: PureCodePortal | None = None
+
+
+def _resolve_n_jobs(n_jobs: Any) -> int:
+    """Validate n_jobs and return the number of processes to use.
+
+    Args:
+        n_jobs: A positive number of processes, or -1 for one process
+            per CPU core.
+
+    Returns:
+        int: The number of processes, at least 1.
+
+    Raises:
+        TypeError: If n_jobs is not an int.
+        ValueError: If n_jobs is neither positive nor -1.
+    """
+    if isinstance(n_jobs, bool) or not isinstance(n_jobs, int):
+        raise TypeError(f"n_jobs must be an int, "
+                        f"got {get_long_infoname(n_jobs)}")
+    if n_jobs == -1:
+        return os.cpu_count() or 1
+    if n_jobs < 1:
+        raise ValueError(f"n_jobs must be positive or -1, got {n_jobs}")
+    return n_jobs
+
+
+def _initialize_pool_process(portal_init_jsparams: str) -> None:
+    """Reconstruct the caller's portal in a pool process."""
+    global _pool_portal
+    _pool_portal = mixinforge.loadjs(portal_init_jsparams)
+
+
+def _execute_chunk(addresses: list[PureFnExecutionResultAddr]) -> None:
+    """Execute a chunk of calls of one function in a pool process."""
+    with _pool_portal:
+        fn = addresses[0].fn
+        if fn.batch:
+            fn._execute_vectorized(addresses)
+            return
+        for address in addresses:
+            address.execute()
+
+
+def _execute_in_local_pool(portal: PureCodePortal
+        , addresses: list[PureFnExecutionResultAddr], n_jobs: int) -> None:
+    """Execute the uncached calls among addresses in local processes.
+
+    Args:
+        portal: The portal of the caller.
+        addresses: Result addresses of calls of one function.
+        n_jobs: Number of processes, as returned by _resolve_n_jobs.
+
+    Raises:
+        Exception: The first exception raised by a call, re-raised in
+            the caller's process.
+    """
+    addresses = list(dict.fromkeys(addresses))
+    misses = [a for a, is_ready in zip(addresses, portal.ready_many(addresses))
+        if not is_ready]
+    if len(misses) < 2:
+        for address in misses:
+            address.execute()
+        return
+    portal.entropy_infuser.shuffle(misses)
+    n_chunks = n_jobs if misses[0].fn.batch else n_jobs * _CHUNKS_PER_JOB
+    n_chunks = min(n_chunks, len(misses))
+    chunks = [misses[i::n_chunks] for i in range(n_chunks)]
+    with ProcessPoolExecutor(max_workers=min(n_jobs, n_chunks)
+            , mp_context=get_context("spawn")
+            , initializer=_initialize_pool_process
+            , initargs=(portal._get_local_pool_jsparams(),)) as pool:
+        futures = [pool.submit(_execute_chunk, chunk) for chunk in chunks]
+        for future in futures:
+            future.result()
@@ -19,11 +19,16 @@ checks are tracked, not dependencies or environment.
 
 from __future__ import annotations
 
+import os
+import random
 import time
 
-from typing import Callable, Any, Final
+from contextlib import ExitStack
+from typing import Callable, Any, Final, Iterable, Iterator
 
 
+import mixinforge
+import psutil
 from persidict import WriteOnceDict
 
 from .._210_basic_portals import *
@@ -34,8 +39,11 @@ from .._220_data_portals import HashAddr, ValueAddr
 
 from .._350_guarded_code_portals import *
 from .._310_ordinary_code_portals.ordinary_portal_core_classes import _expand_grid
-from .._110_supporting_utilities import get_long_infoname
-from copy import copy
+from .local_process_pool import _execute_in_local_pool, _resolve_n_jobs
+from .lazy_grids import (AddressGrid, AddressList, _request_grid
+    , _request_in_chunks)
+from .storage_threads import _map_storage_operation
+from .._110_supporting_utilities import get_long_infoname, get_node_signature
 from functools import cached_property
 import pandas as pd
 
@@ -53,6 +61,185 @@ def get_noncurrent_pure_portals() -> list[PureCodePortal]:
 
 _CACHED_EXECUTION_RESULTS_TXT: Final[str] = "Cached execution results"
 _EXECUTION_QUEUE_SIZE_TXT: Final[str] = "Execution queue size"
+_DEAD_LETTERS_TXT: Final[str] = "Dead-lettered requests"
+
+_MAX_EXECUTION_ATTEMPTS_SETTING: Final[str] = "max_execution_attempts"
+_DEFAULT_MAX_EXECUTION_ATTEMPTS: Final[int] = 5
+_DEFAULT_EXECUTION_TIME: Final[float] = 10.0
+
+_WORK_HELPING_SETTING: Final[str] = "work_helping"
+_WORK_HELPING_GRACE_PERIOD_SECONDS: Final[float] = 1.0
+
+_DEFAULT_PRIORITY: Final[int] = 0
+_REQUEST_PARTITION_TTL_SECONDS: Final[float] = 300.0
+
+
+def _validate_priority(priority: Any) -> None:
+    """Validate the priority of an execution request.
+
+    Raises:
+        TypeError: If priority is not an int.
+    """
+    if isinstance(priority, bool) or not isinstance(priority, int):
+        raise TypeError(f"priority must be an int, "
+                        f"got {get_long_infoname(priority)}")
+
+
+def _validate_result_addresses(addresses: Any
+        ) -> list[PureFnExecutionResultAddr]:
+    """Validate an iterable of result addresses and return them as a list.
+
+    Raises:
+        TypeError: If addresses is not an iterable of
+            PureFnExecutionResultAddr objects.
+    """
+    if not isinstance(addresses, Iterable):
+        raise TypeError(f"addresses must be an iterable, "
+                        f"got {get_long_infoname(addresses)}")
+    addresses = list(addresses)
+    for address in addresses:
+        if not isinstance(address, PureFnExecutionResultAddr):
+            raise TypeError(f"Each address must be a "
+                            f"PureFnExecutionResultAddr, "
+                            f"got {get_long_infoname(address)}")
+    return addresses
+
+
+def _select_unready(portal: PureCodePortal
+        , addresses: list[PureFnExecutionResultAddr]
+        ) -> list[PureFnExecutionResultAddr]:
+    """Return the distinct addresses whose results are not available yet."""
+    addresses = list(dict.fromkeys(addresses))
+    ready = portal.ready_many(addresses)
+    return [a for a, is_ready in zip(addresses, ready) if not is_ready]
+
+
+def _get_process_start_time(pid: int) -> float | None:
+    """Return the start time of a process, or None if it is not running."""
+    try:
+        return psutil.Process(pid).create_time()
+    except psutil.Error:
+        return None
+
+
+def _execution_is_in_progress(summary: dict) -> bool:
+    """Check whether an attempt summary shows a still running execution.
+
+    An execution on this node is running while its process is alive.
+    Processes on other nodes can't be checked, so their executions are
+    considered running for as long as the retry backoff lasts.
+
+    Args:
+        summary: The attempt summary of a call.
+    """
+    if not summary.get("running", False):
+        return False
+    if summary["node"] == get_node_signature():
+        return (_get_process_start_time(summary["pid"])
+            == summary["process_start_time"])
+    return (time.time() - summary["last_attempt_at"]
+        < _DEFAULT_EXECUTION_TIME * (2 ** summary["count"]))
+
+
+# Within a partition, requests are spread over shards named by the last
+# characters of their hash signatures, so that a random request can be
+# found by listing one small shard instead of the whole partition.
+_QUEUE_SHARD_ALPHABET: Final[str] = "0123456789abcdefghijklmnopqrstuv"
+_QUEUE_SHARD_LENGTH: Final[int] = 2
+_N_QUEUE_SHARDS: Final[int] = len(_QUEUE_SHARD_ALPHABET) ** _QUEUE_SHARD_LENGTH
+_EXACT_QUEUE_COUNT_LIMIT: Final[int] = 1000
+_QUEUE_SIZE_PROBES: Final[int] = 16
+
+
+def _get_request_partition(fn: PureFn, priority: int) -> tuple[str, str]:
+    """Return the queue partition for requests of a function at a priority."""
+    return (f"priority_{priority}", fn.hash_signature)
+
+
+def _get_request_queue_key(partition: tuple[str, ...]
+        , address: PureFnExecutionResultAddr) -> tuple[str, ...]:
+    """Return the key of a request in the request queue."""
+    shard = address.hash_signature[-_QUEUE_SHARD_LENGTH:]
+    return (*partition, shard, *address.strings)
+
+
+def _get_random_queue_shard() -> str:
+    """Return the name of a random shard of a request queue partition."""
+    return "".join(random.choices(
+        _QUEUE_SHARD_ALPHABET, k=_QUEUE_SHARD_LENGTH))
+
+
+def _estimate_partition_size(partition_queue: PersiDict) -> int:
+    """Count requests in a queue partition, estimating if there are many.
+
+    Small partitions are counted exactly. Larger ones are estimated from
+    the sizes of a few random shards, so the cost stays bounded.
+
+    Args:
+        partition_queue: The sub-dictionary of one request queue partition.
+
+    Returns:
+        int: The (approximate) number of requests in the partition.
+    """
+    n_keys = 0
+    for _ in partition_queue.keys():
+        n_keys += 1
+        if n_keys > _EXACT_QUEUE_COUNT_LIMIT:
+            break
+    else:
+        return n_keys
+    n_sampled = sum(len(partition_queue.get_subdict(_get_random_queue_shard()))
+        for _ in range(_QUEUE_SIZE_PROBES))
+    return round(n_sampled * _N_QUEUE_SHARDS / _QUEUE_SIZE_PROBES)
+
+_MAX_CONCURRENCY_SETTING: Final[str] = "max_concurrency"
+_MAX_PORTAL_CONCURRENCY_SETTING: Final[str] = "max_portal_concurrency"
+_MAX_WALL_TIME_SETTING: Final[str] = "max_wall_time"
+_MAX_RSS_MB_SETTING: Final[str] = "max_rss_mb"
+_SWARM_LIMIT_SETTINGS: Final[tuple[str, ...]] = (_MAX_CONCURRENCY_SETTING
+    , _MAX_PORTAL_CONCURRENCY_SETTING, _MAX_WALL_TIME_SETTING
+    , _MAX_RSS_MB_SETTING)
+
+
+def _validate_concurrency_limit(name: str, limit: Any) -> None:
+    """Validate a per-function concurrency limit.
+
+    Args:
+        name: Parameter name used in error messages.
+        limit: None (no limit), KEEP_CURRENT, or a positive int.
+
+    Raises:
+        TypeError: If limit is not None, KEEP_CURRENT, or an int.
+        ValueError: If limit is not positive.
+    """
+    if limit is None or limit is KEEP_CURRENT:
+        return
+    if isinstance(limit, bool) or not isinstance(limit, int):
+        raise TypeError(f"{name} must be a positive int or None, "
+                        f"got {get_long_infoname(limit)}")
+    if limit < 1:
+        raise ValueError(f"{name} must be a positive int, got {limit}")
+
+
+def _validate_execution_limit(name: str, limit: Any) -> None:
+    """Validate a per-execution wall time or memory limit.
+
+    Args:
+        name: Parameter name used in error messages.
+        limit: None (no limit), KEEP_CURRENT, or a positive number.
+
+    Raises:
+        TypeError: If limit is not None, KEEP_CURRENT, or a number.
+        ValueError: If limit is not a positive number.
+    """
+    if limit is None or limit is KEEP_CURRENT:
+        return
+    if isinstance(limit, bool) or not isinstance(limit, (int, float)):
+        raise TypeError(f"{name} must be a positive number or None, "
+                        f"got {get_long_infoname(limit)}")
+    if not limit > 0:
+        raise ValueError(f"{name} must be a positive number, got {limit}")
+
 
 class PureCodePortal(GuardedCodePortal):
     """Portal managing execution and persistent caching for pure functions.
@@ -61,14 +248,24 @@ class PureCodePortal(GuardedCodePortal):
     coordination:
     - execution_results: Append-only cache of HashAddr for function outputs
     - execution_requests: Mutable queue tracking pending execution requests
+      and their priorities
+    - request_queue: Index of pending requests, partitioned by priority and
+      function and sharded by hash, from which swarm workers pick requests
+    - request_partitions: Registry of the request_queue partitions in use
+    - attempt_summaries: Number and time of execution attempts per call
+    - dead_letters: Requests that failed too many times to be retried
     """
 
     _execution_results: PersiDict | None
     _execution_requests: PersiDict | None
+    _request_queue: PersiDict | None
+    _request_partitions: PersiDict | None
+    _attempt_summaries: PersiDict | None
+    _dead_letters: PersiDict | None
 
     def __init__(self
             , root_dict: PersiDict | str | None = None
-            , verbose_logging: bool | Joker = KEEP_CURRENT
+            , verbose_logging: bool | float | Joker = KEEP_CURRENT
             ):
         """Initialize a PureCodePortal instance.
 
@@ -98,6 +295,29 @@ class PureCodePortal(GuardedCodePortal):
         execution_requests = type(self._root_dict)(**requests_dict_params)
         self._execution_requests = execution_requests
 
+        queue_dict_prototype = self._root_dict.get_subdict("request_queue")
+        queue_dict_params = queue_dict_prototype.get_params()
+        queue_dict_params.update(append_only=False, serialization_format="pkl")
+        self._request_queue = type(self._root_dict)(**queue_dict_params)
+
+        partitions_dict_prototype = self._root_dict.get_subdict(
+            "request_partitions")
+        partitions_dict_params = partitions_dict_prototype.get_params()
+        partitions_dict_params.update(append_only=False, serialization_format="pkl")
+        self._request_partitions = type(self._root_dict)(**partitions_dict_params)
+
+        summaries_dict_prototype = self._root_dict.get_subdict(
+            "attempt_summaries")
+        summaries_dict_params = summaries_dict_prototype.get_params()
+        summaries_dict_params.update(append_only=False, serialization_format="pkl")
+        self._attempt_summaries = type(self._root_dict)(**summaries_dict_params)
+
+        dead_letters_dict_prototype = self._root_dict.get_subdict(
+            "dead_letters")
+        dead_letters_dict_params = dead_letters_dict_prototype.get_params()
+        dead_letters_dict_params.update(append_only=False, serialization_format="pkl")
+        self._dead_letters = type(self._root_dict)(**dead_letters_dict_params)
+
 
     def __post_init__(self) -> None:
         """Finalize initialization after all __init__ methods complete."""
@@ -109,14 +329,16 @@ class PureCodePortal(GuardedCodePortal):
 
         Returns:
             DataFrame containing base portal parameters, cached result count,
-            and queued execution request count.
+            queued execution request count, and dead-lettered request count.
         """
         all_params = [super().describe()]
 
         all_params.append(_describe_persistent_characteristic(
             _CACHED_EXECUTION_RESULTS_TXT, len(self._execution_results)))
         all_params.append(_describe_persistent_characteristic(
-            _EXECUTION_QUEUE_SIZE_TXT, len(self._execution_requests)))
+            _EXECUTION_QUEUE_SIZE_TXT, self._estimate_queue_size()))
+        all_params.append(_describe_persistent_characteristic(
+            _DEAD_LETTERS_TXT, len(self._dead_letters)))
 
         result = pd.concat(all_params)
         result.reset_index(drop=True, inplace=True)
@@ -130,9 +352,301 @@ class PureCodePortal(GuardedCodePortal):
         """
         self._execution_results = None
         self._execution_requests = None
+        self._request_queue = None
+        self._request_partitions = None
+        self._attempt_summaries = None
+        self._dead_letters = None
         super()._clear()
 
 
+    def _estimate_queue_size(self) -> int:
+        """Return the (approximate) number of pending execution requests.
+
+        Counts the request queue partition by partition, without listing
+        large partitions in full; see _estimate_partition_size.
+        """
+        return sum(_estimate_partition_size(
+                self._request_queue.get_subdict(partition))
+            for partition in self._request_partitions.keys())
+
+
+    def _enqueue_request(self, address: PureFnExecutionResultAddr
+            , priority: int = _DEFAULT_PRIORITY) -> None:
+        """Record an execution request and index it for swarm workers.
+
+        Args:
+            address: The result address of the requested call.
+            priority: Priority of the request; see PureFn.swarm_each.
+        """
+        partition = _get_request_partition(address.fn, priority)
+        self._register_request_partition(partition, priority)
+        self._write_request(address, partition, priority)
+
+
+    def ready_many(self, addresses: Iterable[PureFnExecutionResultAddr]
+            ) -> list[bool]:
+        """Check which of many execution results are available.
+
+        Bulk counterpart of PureFnExecutionResultAddr.ready for this portal:
+        results are looked up here first, then in other known portals, from
+        which found results are imported into this portal. The lookups and
+        the imports are issued concurrently.
+
+        Args:
+            addresses: Result addresses of the calls to check.
+
+        Returns:
+            list[bool]: Whether each result is available, in input order.
+
+        Raises:
+            TypeError: If an item is not a PureFnExecutionResultAddr.
+        """
+        addresses = _validate_result_addresses(addresses)
+        ready = [hasattr(a, "_ready_cache") for a in addresses]
+        unknown = [i for i, is_ready in enumerate(ready) if not is_ready]
+        with self:
+            for portal in [self, *get_noncurrent_pure_portals()]:
+                if not unknown:
+                    break
+                found = _map_storage_operation(
+                    lambda i: addresses[i] in portal._execution_results
+                    , unknown)
+                hits = [i for i, f in zip(unknown, found) if f]
+                if portal is not self:
+                    _map_storage_operation(
+                        lambda i: self._import_result(portal, addresses[i])
+                        , hits)
+                for i in hits:
+                    addresses[i]._ready_cache = True
+                    ready[i] = True
+                unknown = [i for i, f in zip(unknown, found) if not f]
+        return ready
+
+
+    def request_many(self, addresses: Iterable[PureFnExecutionResultAddr]
+            , priority: int | None = None) -> None:
+        """Request execution of many calls at once.
+
+        Bulk counterpart of PureFnExecutionResultAddr.request_execution():
+        calls with available results (see ready_many) are not requested,
+        and their pending requests are dropped from all known portals.
+        The storage operations are issued concurrently.
+
+        Args:
+            addresses: Result addresses of the calls to request.
+            priority: Priority of the requests (see PureFn.swarm_each), or
+                None to keep the priority of existing requests and use the
+                default priority for new ones.
+
+        Raises:
+            TypeError: If an item is not a PureFnExecutionResultAddr,
+                or priority is neither an int nor None.
+        """
+        if priority is not None:
+            _validate_priority(priority)
+        addresses = _validate_result_addresses(addresses)
+        with self:
+            for address in addresses:
+                _ = address.fn  # Storage threads can't load functions
+            ready = self.ready_many(addresses)
+            done = [a for a, is_ready in zip(addresses, ready) if is_ready]
+            for portal in get_all_known_pure_code_portals():
+                _map_storage_operation(portal._dequeue_request, done)
+            self._enqueue_requests([a for a, is_ready
+                in zip(addresses, ready) if not is_ready], priority)
+
+
+    def _import_result(self, source: PureCodePortal
+            , address: PureFnExecutionResultAddr) -> None:
+        """Copy an execution result from another portal into this one."""
+        result_addr = source._execution_results[address]
+        self._execution_results[address] = result_addr
+        if result_addr not in self.global_value_store:
+            self.global_value_store[result_addr] = (
+                source.global_value_store[result_addr])
+
+
+    def _enqueue_requests(self, addresses: list[PureFnExecutionResultAddr]
+            , priority: int | None) -> None:
+        """Record many execution requests, issuing the writes concurrently.
+
+        Works like request_execution(priority) for each address, except
+        that it doesn't check for available results.
+
+        Args:
+            addresses: Result addresses of the requested calls, with
+                their functions already loaded.
+            priority: Priority of the requests, or None to keep the
+                priority of existing requests; see request_many.
+        """
+        existing = _map_storage_operation(
+            lambda a: self._execution_requests.get(a, None), addresses)
+        if priority is None:
+            to_move = []
+            to_write = [a for a, old in zip(addresses, existing) if old is None]
+            priority = _DEFAULT_PRIORITY
+        else:
+            to_move = [a for a, old in zip(addresses, existing)
+                if old not in (None, priority)]
+            to_write = addresses
+        partitions = [_get_request_partition(a.fn, priority) for a in to_write]
+        for partition in dict.fromkeys(partitions):
+            self._register_request_partition(partition, priority)
+        _map_storage_operation(self._dequeue_request, to_move)
+        _map_storage_operation(
+            lambda item: self._write_request(*item, priority)
+            , list(zip(to_write, partitions)))
+
+
+    def _register_request_partition(self, partition: tuple[str, str]
+            , priority: int) -> None:
+        """Add a queue partition to the registry, or refresh its entry."""
+        try:
+            age = time.time() - self._request_partitions.timestamp(partition)
+        except KeyError:
+            age = None
+        if age is None or age > _REQUEST_PARTITION_TTL_SECONDS / 5:
+            self._request_partitions[partition] = dict(priority=priority)
+
+
+    def _write_request(self, address: PureFnExecutionResultAddr
+            , partition: tuple[str, str], priority: int) -> None:
+        """Write an execution request and its entry in the request queue."""
+        # The request goes first: workers drop index entries without one
+        self._execution_requests[address] = priority
+        self._request_queue[_get_request_queue_key(partition, address)] = True
+
+
+    def _dequeue_request(self, address: PureFnExecutionResultAddr
+            ) -> int | None:
+        """Remove an execution request and its index entry.
+
+        Args:
+            address: The result address of the requested call.
+
+        Returns:
+            int | None: Priority of the removed request, or None if
+            the call was not requested in this portal.
+        """
+        priority = self._execution_requests.get(address, None)
+        if priority is None:
+            return None
+        if isinstance(priority, bool):  # Requests recorded as plain flags
+            priority = _DEFAULT_PRIORITY
+        partition = _get_request_partition(address.fn, priority)
+        self._request_queue.delete_if_exists(
+            _get_request_queue_key(partition, address))
+        self._execution_requests.delete_if_exists(address)
+        return priority
+
+
+    @property
+    def max_execution_attempts(self) -> int:
+        """Number of failed attempts after which a request is dead-lettered.
+
+        Configured via the "max_execution_attempts" portal setting.
+
+        Raises:
+            TypeError: If the stored setting is not a non-negative int.
+        """
+        limit = self.get_effective_setting(
+            _MAX_EXECUTION_ATTEMPTS_SETTING, _DEFAULT_MAX_EXECUTION_ATTEMPTS)
+        if isinstance(limit, bool) or not isinstance(limit, int) or limit < 0:
+            raise TypeError(
+                "max_execution_attempts must be a non-negative int, "
+                f"got {get_long_infoname(limit)}")
+        return limit
+
+
+    @property
+    def work_helping(self) -> bool:
+        """Whether callers waiting for a result execute pending requests.
+
+        Configured via the "work_helping" portal setting (off by default).
+        When it is on, get() that has waited for a short grace period
+        executes the awaited request itself, unless a worker is already
+        executing it, or else executes another pending request.
+
+        Raises:
+            TypeError: If the stored setting is not a bool.
+        """
+        enabled = self.get_effective_setting(_WORK_HELPING_SETTING, False)
+        if not isinstance(enabled, bool):
+            raise TypeError(f"work_helping must be a bool, "
+                            f"got {get_long_infoname(enabled)}")
+        return enabled
+
+
+    def _get_local_pool_jsparams(self) -> str:
+        """Serialize the portal for processes of a local process pool.
+
+        Returns:
+            str: Parameters to reconstruct the portal with mixinforge.loadjs.
+        """
+        return mixinforge.dumpjs(self)
+
+
+    def _execute_pending_request(self) -> bool:
+        """Execute a pending request on behalf of a caller waiting for a result.
+
+        This portal has no scheduler to pick requests with, so it does
+        nothing; SwarmingPortal overrides the method.
+
+        Returns:
+            bool: Whether any request was executed.
+        """
+        return False
+
+
+    def get_dead_letters(self) -> pd.DataFrame:
+        """List requests that were given up on after repeated failures.
+
+        Returns:
+            pandas.DataFrame: One row per dead-lettered request with its
+            result address, function name, number of attempts, and the
+            times of the last attempt and of dead-lettering.
+        """
+        columns = ["address", "fn_name", "attempts"
+            , "last_attempt_at", "dead_lettered_at"]
+        with self:
+            records = [record for record in self._dead_letters.values()
+                if isinstance(record, dict)]
+        rows = [dict(address=r["address"], fn_name=r["fn_name"]
+            , attempts=r["count"], last_attempt_at=r["last_attempt_at"]
+            , dead_lettered_at=r["dead_lettered_at"]) for r in records]
+        return pd.DataFrame(rows, columns=columns)
+
+
+    def requeue_dead_letters(self
+            , addresses: list[PureFnExecutionResultAddr] | None = None
+            ) -> int:
+        """Give dead-lettered requests a fresh set of execution attempts.
+
+        Args:
+            addresses: Result addresses of the requests to requeue,
+                or None to requeue all dead-lettered requests.
+
+        Returns:
+            int: Number of requests put back into the execution queue.
+        """
+        with self:
+            if addresses is None:
+                addresses = [record["address"]
+                    for record in self._dead_letters.values()
+                    if isinstance(record, dict)]
+            n_requeued = 0
+            for address in addresses:
+                record = self._dead_letters.get(address, None)
+                if record is None:
+                    continue
+                self._attempt_summaries.delete_if_exists(address)
+                self._enqueue_request(address
+                    , record.get("priority", _DEFAULT_PRIORITY))
+                self._dead_letters.delete_if_exists(address)
+                n_requeued += 1
+            return n_requeued
+
+
 class PureFnCallSignature(GuardedFnCallSignature):
     """Signature identifying a specific call to a pure function.
 
@@ -175,9 +689,14 @@ class PureFn(GuardedFn):
     def __init__(self, fn: Callable | str
                  , requirements: list[AutonomousFn] | list[Callable] | None = None
                  , result_checks: list[AutonomousFn] | list[Callable] | None = None
-                 , verbose_logging: bool | Joker | ReuseFlag = KEEP_CURRENT
+                 , verbose_logging: bool | float | Joker | ReuseFlag = KEEP_CURRENT
                  , fixed_kwargs: dict | None = None
-                 , portal: PureCodePortal | None |ReuseFlag = None):
+                 , portal: PureCodePortal | None |ReuseFlag = None
+                 , max_concurrency: int | None | Joker = KEEP_CURRENT
+                 , max_portal_concurrency: int | None | Joker = KEEP_CURRENT
+                 , max_wall_time: float | None | Joker = KEEP_CURRENT
+                 , max_rss_mb: float | None | Joker = KEEP_CURRENT
+                 , batch: bool | None = None):
         """Construct a PureFn wrapper.
 
         Args:
@@ -198,7 +717,40 @@ class PureFn(GuardedFn):
                 - USE_FROM_OTHER to inherit the portal from ``fn`` when ``fn``
                   is an existing PureFn
                 - None to infer a suitable portal when the function is executed
+
+            max_concurrency: Maximum number of executions of this function
+                that swarm workers run at the same time on one node, or None
+                for no limit. KEEP_CURRENT inherits the value from ``fn``
+                when ``fn`` is an existing PureFn.
+            max_portal_concurrency: Maximum number of executions of this
+                function that swarm workers run at the same time across
+                all nodes of the portal, or None for no limit.
+            max_wall_time: Seconds a swarm worker lets one execution of this
+                function run before killing it, or None for no limit.
+            max_rss_mb: Memory (resident set size, MB) a swarm worker lets
+                one execution of this function use before killing it,
+                or None for no limit.
+            batch: Whether the wrapped function is vectorized: it gets a
+                list of values for each of its arguments (one value per
+                call) and returns a list of results, one per call. Each
+                call is still cached under its own result address. None
+                inherits the flag from ``fn`` when ``fn`` is an existing
+                PureFn, and means False otherwise.
+
+        Raises:
+            TypeError: If a swarm limit or batch has a wrong type.
+            ValueError: If a swarm limit is not positive.
         """
+        if batch is None:
+            batch = fn.batch if isinstance(fn, PureFn) else False
+        if not isinstance(batch, bool):
+            raise TypeError(f"batch must be a bool, "
+                            f"got {get_long_infoname(batch)}")
+        _validate_concurrency_limit("max_concurrency", max_concurrency)
+        _validate_concurrency_limit(
+            "max_portal_concurrency", max_portal_concurrency)
+        _validate_execution_limit("max_wall_time", max_wall_time)
+        _validate_execution_limit("max_rss_mb", max_rss_mb)
         super().__init__(fn=fn
                          , portal = portal
                          , fixed_kwargs=fixed_kwargs
@@ -206,6 +758,127 @@ class PureFn(GuardedFn):
                          , requirements=requirements
                          , result_checks=result_checks)
 
+        for key, limit in ((_MAX_CONCURRENCY_SETTING, max_concurrency)
+                , (_MAX_PORTAL_CONCURRENCY_SETTING, max_portal_concurrency)
+                , (_MAX_WALL_TIME_SETTING, max_wall_time)
+                , (_MAX_RSS_MB_SETTING, max_rss_mb)):
+            if limit is KEEP_CURRENT and isinstance(fn, PureFn):
+                limit = fn._auxiliary_config_params_at_init.get(
+                    key, KEEP_CURRENT)
+            self._auxiliary_config_params_at_init[key] = limit
+        self._batch = batch
+
+
+    def __getstate__(self):
+        """Return state for pickling.
+
+        The batch flag changes what the wrapped code receives and returns,
+        so it is part of the function's identity; plain functions keep
+        the state (and hash signature) they had before the flag existed.
+        """
+        state = super().__getstate__()
+        if self._batch:
+            state["batch"] = True
+        return state
+
+
+    def __setstate__(self, state):
+        """Restore state from unpickling."""
+        super().__setstate__(state)
+        self._batch = state.get("batch", False)
+
+
+    @property
+    def batch(self) -> bool:
+        """Whether the wrapped function is vectorized over lists of calls."""
+        return self._batch
+
+
+    def _build_invocation_plan(self, portal):
+        """Extend the invocation plan with the code of vectorized calls.
+
+        For a batch function, single calls run the wrapped function on
+        one-element lists and unpack its one-element result, while
+        plan.vectorized_code calls it with lists of argument values as is.
+
+        Args:
+            portal: The portal the function is executed in.
+
+        Returns:
+            The invocation plan.
+        """
+        plan = super()._build_invocation_plan(portal)
+        if self._batch:
+            plan.vectorized_code = plan.compiled_code
+            plan.compiled_code = self._single_call_code
+        return plan
+
+
+    @cached_property
+    def _single_call_code(self) -> Any:
+        """Code running a batch function for one set of arguments."""
+        result = self._result_var_name
+        return self._compile_with_trailer(
+            f"{result} = {self._tmp_fn_name}(**{{name: [value] "
+            f"for name, value in {self._kwargs_var_name}.items()}})\n"
+            f"({result},) = {result}")
+
+
+    def _first_visit_to_portal(self, portal: DataPortal) -> None:
+        """Register the function and share its swarm limits.
+
+        Concurrency, wall time and memory limits are enforced by swarm
+        workers on every node, so besides the node settings they are also
+        stored in the function's global portal settings.
+        """
+        super()._first_visit_to_portal(portal)
+        global_settings = self._get_global_portal_settings(portal)
+        for key in _SWARM_LIMIT_SETTINGS:
+            global_settings[key] = self._auxiliary_config_params_at_init.get(
+                key, KEEP_CURRENT)
+
+
+    @property
+    def max_concurrency(self) -> int | None:
+        """Max concurrent swarm executions of this function per node, or None."""
+        return self._get_concurrency_limit(_MAX_CONCURRENCY_SETTING)
+
+
+    @property
+    def max_portal_concurrency(self) -> int | None:
+        """Max concurrent swarm executions of this function portal-wide, or None."""
+        return self._get_concurrency_limit(_MAX_PORTAL_CONCURRENCY_SETTING)
+
+
+    def _get_concurrency_limit(self, key: str) -> int | None:
+        """Resolve a concurrency limit setting, treating missing values as None."""
+        limit = self.get_effective_setting(key)
+        if limit is KEEP_CURRENT:
+            return None
+        _validate_concurrency_limit(key, limit)
+        return limit
+
+
+    @property
+    def max_wall_time(self) -> float | None:
+        """Seconds a swarm worker lets one execution run, or None."""
+        return self._get_execution_limit(_MAX_WALL_TIME_SETTING)
+
+
+    @property
+    def max_rss_mb(self) -> float | None:
+        """Memory (MB) a swarm worker lets one execution use, or None."""
+        return self._get_execution_limit(_MAX_RSS_MB_SETTING)
+
+
+    def _get_execution_limit(self, key: str) -> float | None:
+        """Resolve a wall time or memory limit, treating missing values as None."""
+        limit = self.get_effective_setting(key)
+        if limit is KEEP_CURRENT:
+            return None
+        _validate_execution_limit(key, limit)
+        return limit
+
 
     def get_address(self, **kwargs) -> PureFnExecutionResultAddr:
         """Build an address for the result of a call with the given arguments.
@@ -265,97 +938,262 @@ class PureFn(GuardedFn):
             return result_address
 
 
-    def execute(self, **kwargs) -> Any:
+    def _invoke(self, plan, kwargs, packed_kwargs) -> Any:
         """Execute the function and return the result value.
 
         Returns the cached result if available, otherwise executes and caches.
+        The arguments are packed once here and passed down to the lower
+        layers, which reuse them instead of packing again.
 
         Args:
-            **kwargs: Keyword arguments for the function call.
+            plan: The invocation plan for the active portal.
+            kwargs: Keyword arguments for the function call.
+            packed_kwargs: The packed arguments, or None to pack them here.
 
         Returns:
             The computed or cached result value.
         """
-
-        with self.portal as portal:
+        portal = plan.portal
+        if packed_kwargs is None:
             packed_kwargs = KwArgs(**kwargs).pack()
-            output_address = PureFnExecutionResultAddr(
-                fn=self, arguments=packed_kwargs)
+        output_address = PureFnExecutionResultAddr(
+            fn=self, arguments=packed_kwargs)
+
+        if output_address.ready:
+            return output_address.get()
+
+        output_address.request_execution()
+        output_address._register_execution_attempt(portal)
+        unpacked_kwargs = KwArgs(**packed_kwargs).unpack()
+        try:
+            result = super()._invoke(plan, unpacked_kwargs, packed_kwargs)
+        except BaseException:
+            output_address._register_execution_stop(portal)
+            raise
+        self._store_result(portal, output_address, result)
+        return output_address.get()
 
-            if output_address.ready:
-                return output_address.get()
 
-            output_address.request_execution()
-            unpacked_kwargs = KwArgs(**packed_kwargs).unpack()
-            result = super().execute(**unpacked_kwargs)
+    def _store_result(self, portal: PureCodePortal
+            , output_address: PureFnExecutionResultAddr, result: Any) -> None:
+        """Cache the result of a call and retire its execution request.
+
+        Args:
+            portal: The portal executing the call.
+            output_address: The result address of the call.
+            result: The value returned by the call.
+        """
+        try:
+            result_addr = ValueAddr(result)
+            portal._execution_results[output_address] = result_addr
+        except Exception:
+            # Looks like another worker won the race.
+            output_address._invalidate_cache()
+            if not output_address.ready:
+                raise RuntimeError(f"Race condition detected in {self.name}, "
+                    f"result not found for address {output_address}",
+                    "portal may be in an inconsistent state")
+
+        output_address.drop_execution_request()
+        portal._attempt_summaries.delete_if_exists(output_address)
+
+
+    def _execute_vectorized(self
+            , addresses: list[PureFnExecutionResultAddr]) -> None:
+        """Execute the pending calls among addresses in one vectorized call.
+
+        Works for batch functions only. Cached calls are skipped. The
+        wrapped function is called once, with a list of values for each
+        argument, and each of the returned results is cached under its
+        own address. Each pending call is logged under its own signature,
+        with its own arguments and result; the execution records of all of
+        them share the output and timing of the vectorized call. Calls with differing argument names or with
+        requirements that don't pass right away are executed one by one.
+
+        Args:
+            addresses: Result addresses of calls of this function.
+
+        Raises:
+            FunctionError: If the function does not return one result per
+                call, or result checks fail.
+        """
+        with self.portal as portal:
+            pending = _select_unready(portal, addresses)
+            if len(pending) < 2:
+                for address in pending:
+                    address.execute()
+                return
+            plan = self._get_invocation_plan(portal)
+            list_of_packed_kwargs = [
+                a.call_signature.packed_kwargs for a in pending]
+            list_of_kwargs = [
+                KwArgs(**packed).unpack() for packed in list_of_packed_kwargs]
+            names = list_of_kwargs[0].keys()
+            if (any(kwargs.keys() != names for kwargs in list_of_kwargs)
+                    or plan.requirements and any(
+                        self._check_requirements(plan, packed)
+                            is not NO_OBJECTIONS
+                        for packed in list_of_packed_kwargs)):
+                for address in pending:
+                    address.execute()
+                return
+
+            for address in pending:
+                address.request_execution()
+                address._register_execution_attempt(portal)
+            columns = {name: [kwargs[name] for kwargs in list_of_kwargs]
+                for name in names}
+            fixed_kwargs = plan.fixed_kwargs
+            if fixed_kwargs:
+                overlapping_keys = columns.keys() & fixed_kwargs.keys()
+                if len(overlapping_keys) != 0:
+                    raise ValueError(f"Overlapping kwargs with fixed kwargs: "
+                                     f"{sorted(overlapping_keys)}")
+                columns.update({name: [value] * len(pending)
+                    for name, value in fixed_kwargs.items()})
 
             try:
-                result_addr = ValueAddr(result)
-                portal._execution_results[output_address] = result_addr
-            except Exception:
-                # Looks like another worker won the race.
-                output_address._invalidate_cache()
-                if not output_address.ready:
-                    raise RuntimeError(f"Race condition detected in {self.name}, "
-                        f"result not found for address {output_address}",
-                        "portal may be in an inconsistent state")
-
-            output_address.drop_execution_request()
-            return output_address.get()
+                with ExitStack() as frames_stack:
+                    frames = []
+                    for kwargs, packed in zip(
+                            list_of_kwargs, list_of_packed_kwargs):
+                        if fixed_kwargs:
+                            kwargs = {**kwargs, **fixed_kwargs}
+                            packed = PackedKwArgs(
+                                **packed, **plan.packed_fixed_kwargs)
+                        frame = frames_stack.enter_context(
+                            LoggingFnExecutionFrame(self.get_signature(packed)))
+                        frame._register_execution_inputs(kwargs)
+                        frames.append(frame)
+                    names_dict = plan.available_names.copy()
+                    names_dict[self._kwargs_var_name] = columns
+                    exec(plan.vectorized_code, names_dict)
+                    results = list(names_dict[self._result_var_name])
+                    if len(results) != len(pending):
+                        raise FunctionError(f"Batch function {self.name} "
+                            f"returned {len(results)} results "
+                            f"for {len(pending)} calls")
+                    for packed, result in zip(list_of_packed_kwargs, results):
+                        if (plan.result_checks and self._check_result(
+                                plan, packed, result) is not NO_OBJECTIONS):
+                            raise FunctionError(f"Result checks failed "
+                                                f"for function {self.name}")
+                    for frame, result in zip(frames, results):
+                        frame._register_execution_result(result)
+            except BaseException:
+                for address in pending:
+                    address._register_execution_stop(portal)
+                raise
+
+            for address, result in zip(pending, results):
+                self._store_result(portal, address, result)
 
 
     def swarm_each(
             self
-            , list_of_kwargs:list[dict[str, Any]]
-            ) -> list[PureFnExecutionResultAddr]:
+            , list_of_kwargs: Iterable[dict[str, Any]]
+            , priority: int = _DEFAULT_PRIORITY
+            ) -> AddressList:
         """Queue background execution for each set of keyword arguments.
 
+        Swarm workers favor requests with higher priority: among pending
+        requests, each priority level gets a share of worker picks that is
+        several times larger than the share of the level below it, so lower
+        levels still make progress. Within a level, functions get equal
+        shares regardless of how many requests each of them has queued.
+
+        Argument sets are consumed as a stream: requests are submitted in
+        chunks while list_of_kwargs is being iterated, so it can be a
+        generator of arbitrary length. Only the hash signatures of the
+        result addresses are kept; see AddressList.
+
         Args:
-            list_of_kwargs: List of keyword-argument dicts, one per call.
+            list_of_kwargs: Iterable of keyword-argument dicts, one per call.
+            priority: Priority of the requests; higher is more urgent.
+                Requests queued by swarm() have priority 0.
 
         Returns:
-            Result addresses in the same order as input.
+            Result addresses in the same order as input, built on access.
+
+        Raises:
+            TypeError: If list_of_kwargs is not an iterable of dicts or
+                priority is not an int.
         """
-        if not isinstance(list_of_kwargs, (list, tuple)):
-            raise TypeError(f"list_of_kwargs must be a list or tuple, got {get_long_infoname(list_of_kwargs)}")
-        for kwargs in list_of_kwargs:
-            if not isinstance(kwargs, dict):
-                raise TypeError(f"Each item in list_of_kwargs must be a dict, got {get_long_infoname(kwargs)}")
-        with self.portal:
-            list_to_return = []
-            list_to_swarm = []
+        _validate_priority(priority)
+        addresses = AddressList(self)
+
+        def build_addresses() -> Iterator[PureFnExecutionResultAddr]:
+            for new_addr in self._iter_addresses(list_of_kwargs):
+                addresses._append(new_addr)
+                yield new_addr
+
+        with self.portal as portal:
+            _request_in_chunks(portal, build_addresses(), priority)
+        return addresses
+
+
+    def _iter_addresses(self, list_of_kwargs: Iterable[dict[str, Any]]
+            ) -> Iterator[PureFnExecutionResultAddr]:
+        """Validate argument sets and build their result addresses lazily.
+
+        Raises:
+            TypeError: If list_of_kwargs is not an iterable of dicts.
+        """
+        if (not isinstance(list_of_kwargs, Iterable)
+                or isinstance(list_of_kwargs, (str, bytes, dict))):
+            raise TypeError(f"list_of_kwargs must be an iterable of dicts, got {get_long_infoname(list_of_kwargs)}")
+
+        def build_addresses() -> Iterator[PureFnExecutionResultAddr]:
             for kwargs in list_of_kwargs:
-                new_addr = PureFnExecutionResultAddr(self, kwargs)
-                list_to_return.append(new_addr)
-                list_to_swarm.append(new_addr)
-            self.portal.entropy_infuser.shuffle(list_to_swarm)
-            for an_addr in list_to_swarm:
-                an_addr.request_execution()
-        return list_to_return
+                if not isinstance(kwargs, dict):
+                    raise TypeError(f"Each item in list_of_kwargs must be a dict, got {get_long_infoname(kwargs)}")
+                yield PureFnExecutionResultAddr(self, kwargs)
+
+        return build_addresses()
 
 
     def run_each(
             self
             , list_of_kwargs:list[dict[str, Any]]
+            , n_jobs: int = 1
             ) -> list[PureFnExecutionResultAddr]:
         """Execute each set of keyword arguments synchronously in shuffled order.
 
+        Calls of a batch function are executed together, in one vectorized
+        call of the wrapped function.
+
         Args:
             list_of_kwargs: List of keyword-argument dicts, one per call.
+            n_jobs: Number of local processes executing the calls that are
+                not cached yet, or -1 for one process per CPU core. With
+                n_jobs=1, the calls are executed in the calling process.
 
         Returns:
             Result addresses in the same order as input.
+
+        Raises:
+            TypeError: If n_jobs is not an int.
+            ValueError: If n_jobs is neither positive nor -1.
         """
-        with self.portal:
-            addrs = self.swarm_each(list_of_kwargs)
-            addrs_workspace = copy(addrs)
+        n_jobs = _resolve_n_jobs(n_jobs)
+        with self.portal as portal:
+            addrs = list(self._iter_addresses(list_of_kwargs))
+            _request_in_chunks(portal, addrs, _DEFAULT_PRIORITY)
+            if n_jobs > 1:
+                _execute_in_local_pool(portal, addrs, n_jobs)
+                return addrs
+            if self._batch:
+                self._execute_vectorized(addrs)
+                return addrs
+            addrs_workspace = _select_unready(portal, addrs)
             self.portal.entropy_infuser.shuffle(addrs_workspace)
             for an_addr in addrs_workspace:
                 an_addr.execute()
         return addrs
 
 
-    def execute_each(self, list_of_kwargs: list[dict[str, Any]]) -> list[Any]:
+    def execute_each(self, list_of_kwargs: list[dict[str, Any]]
+            , n_jobs: int = 1) -> list[Any]:
         """Execute the function for each set of keyword arguments.
 
         Overrides OrdinaryFn.execute_each to leverage PureFn's caching and
@@ -363,58 +1201,73 @@ class PureFn(GuardedFn):
 
         Args:
             list_of_kwargs: List of keyword-argument dicts, one per call.
+            n_jobs: Number of local processes; see run_each.
 
         Returns:
             List of results in the same order as input.
         """
         with self.portal:
-            addrs = self.run_each(list_of_kwargs)
+            addrs = self.run_each(list_of_kwargs, n_jobs=n_jobs)
             return [a.get() for a in addrs]
 
 
     def swarm_grid(
             self
             , grid_of_kwargs: dict[str, list[Any]]
-            ) -> list[PureFnExecutionResultAddr]:
+            , priority: int = _DEFAULT_PRIORITY
+            ) -> AddressGrid:
         """Queue background execution for each combination in a parameter grid.
 
+        The grid is never expanded in memory: each distinct parameter value
+        is hashed once, and requests are submitted in chunks.
+
         Args:
             grid_of_kwargs: Mapping of parameter names to lists of values.
+            priority: Priority of the requests; see swarm_each.
 
         Returns:
-            Result addresses in Cartesian product order.
+            Result addresses in Cartesian product order, built on access
+            and also indexable by grid coordinates; see AddressGrid.
         """
-        with self.portal:
-            return self.swarm_each(_expand_grid(grid_of_kwargs))
+        _validate_priority(priority)
+        with self.portal as portal:
+            grid = AddressGrid(self, grid_of_kwargs)
+            _request_grid(portal, grid, priority)
+            return grid
 
 
     def run_grid(
             self
             , grid_of_kwargs: dict[str, list[Any]]
+            , n_jobs: int = 1
             ) -> list[PureFnExecutionResultAddr]:
         """Execute each combination in a parameter grid synchronously.
 
         Args:
             grid_of_kwargs: Mapping of parameter names to lists of values.
+            n_jobs: Number of local processes; see run_each.
 
         Returns:
             Result addresses in Cartesian product order.
         """
         with self.portal:
-            return self.run_each(_expand_grid(grid_of_kwargs))
+            return self.run_each(_expand_grid(grid_of_kwargs), n_jobs=n_jobs)
 
 
-    def execute_grid(self, grid_of_kwargs: dict[str, list[Any]]) -> list[Any]:
+    def execute_grid(self, grid_of_kwargs: dict[str, list[Any]]
+            , n_jobs: int = 1) -> list[Any]:
         """Execute the function for each combination in a parameter grid.
 
         Args:
             grid_of_kwargs: Mapping of parameter names to lists of values.
+            n_jobs: Number of local processes; see run_each.
 
         Returns:
             List of results in Cartesian product order.
         """
         with self.portal:
-            return self.execute_each(_expand_grid(grid_of_kwargs))
+            return self.execute_each(_expand_grid(grid_of_kwargs)
+                , n_jobs=n_jobs)
 
 
     @property
@@ -565,6 +1418,22 @@ class PureFnExecutionResultAddr(HashAddr):
         return False
 
 
+    @classmethod
+    def _all_ready(cls, addresses: list[PureFnExecutionResultAddr]) -> bool:
+        """Check whether all given results are available, in bulk.
+
+        Addresses are checked with PureCodePortal.ready_many, grouped
+        by the portals of their functions.
+        """
+        addresses_by_portal: dict[PureCodePortal, list] = {}
+        for address in addresses:
+            if not hasattr(address, "_ready_cache"):
+                addresses_by_portal.setdefault(
+                    address.fn.portal, []).append(address)
+        return all(all(portal.ready_many(portal_addresses))
+            for portal, portal_addresses in addresses_by_portal.items())
+
+
     def execute(self):
         """Execute the function and store the result.
 
@@ -578,23 +1447,37 @@ class PureFnExecutionResultAddr(HashAddr):
             return self._result_cache
 
 
-    def request_execution(self):
+    def request_execution(self, priority: int | None = None):
         """Request execution without blocking.
 
         Records a request in the current portal for external workers to process.
+
+        Args:
+            priority: Priority of the request (see PureFn.swarm_each), or None
+                to keep the priority of an existing request and use the
+                default priority for a new one.
         """
+        if priority is not None:
+            _validate_priority(priority)
         with self.fn.portal as portal:
             if self.ready:
                 self.drop_execution_request()
-            else:
-                portal._execution_requests[self] = True
+                return
+            if priority is None:
+                if self in portal._execution_requests:
+                    return
+                priority = _DEFAULT_PRIORITY
+            elif portal._execution_requests.get(self, None) not in (
+                    None, priority):
+                portal._dequeue_request(self)
+            portal._enqueue_request(self, priority)
 
 
     def drop_execution_request(self):
         """Remove execution request from all known portals."""
         for portal in get_all_known_pure_code_portals():
             with portal:
-                portal._execution_requests.delete_if_exists(self)
+                portal._dequeue_request(self)
 
 
     @property
@@ -611,8 +1494,11 @@ class PureFnExecutionResultAddr(HashAddr):
             if self in current_portal._execution_requests:
                 return True
             for another_portal in get_noncurrent_pure_portals():
-                if self in another_portal._execution_requests:
-                    current_portal._execution_requests[self] = True
+                priority = another_portal._execution_requests.get(self, None)
+                if priority is not None:
+                    if isinstance(priority, bool):
+                        priority = _DEFAULT_PRIORITY
+                    current_portal._enqueue_request(self, priority)
                     # TODO: Review how timestamps should work here
                     return True
         return False
@@ -622,7 +1508,12 @@ class PureFnExecutionResultAddr(HashAddr):
         """Retrieve the result value, waiting with exponential backoff if needed.
 
         Does not execute the function directly; requests execution and waits
-        for an external worker to compute the result.
+        for an external worker to compute the result. If the portal's
+        work_helping setting is on and no result arrives within a short
+        grace period, the caller helps instead of sleeping: it executes the
+        awaited request itself unless a worker is already executing it, or
+        else executes another pending request (see _help_while_waiting).
+        A helping caller may overrun the timeout by one execution.
 
         Args:
             timeout: Maximum wait time in seconds, or None to wait indefinitely.
@@ -660,6 +1551,13 @@ class PureFnExecutionResultAddr(HashAddr):
                     self._result_cache = portal.global_value_store[result_addr]
                     self.drop_execution_request()
                     return self._result_cache
+                elif (time.time() - start_time
+                        >= _WORK_HELPING_GRACE_PERIOD_SECONDS
+                        and portal.work_helping
+                        and self._help_while_waiting(portal)):
+                    if stop_time is not None and time.time() > stop_time:
+                        if not self.ready:
+                            raise TimeoutError
                 else:
                     time.sleep(backoff_period)
                     backoff_period *= 2.0
@@ -673,6 +1571,32 @@ class PureFnExecutionResultAddr(HashAddr):
                     backoff_period = max(1.0, backoff_period)
 
 
+    def _help_while_waiting(self, portal: PureCodePortal) -> bool:
+        """Do useful work while waiting for this call's result.
+
+        Executes the call inline if it needs execution and no other
+        process is executing it, or a prerequisite call its requirements
+        ask for first. Otherwise executes another pending request, if
+        the portal can pick one. Failures of the awaited call propagate
+        to the caller, failures of other requests don't.
+
+        Args:
+            portal: The portal of the waiting caller.
+
+        Returns:
+            bool: Whether anything was executed.
+        """
+        if not self._execution_in_progress(portal) and self.needs_execution:
+            requirement_result = self.can_be_executed
+            if requirement_result is NO_OBJECTIONS:
+                self.execute()
+                return True
+            if isinstance(requirement_result, PureFnCallSignature):
+                requirement_result.execute()
+                return True
+        return portal._execute_pending_request()
+
+
     @property
     def can_be_executed(self) -> PureFnCallSignature | NoObjectionsFlag | None:
         """Whether execution can proceed.
@@ -687,37 +1611,96 @@ class PureFnExecutionResultAddr(HashAddr):
             return self.fn.can_be_executed(self.kwargs)
 
 
+    def _register_execution_attempt(self, portal: PureCodePortal) -> None:
+        """Count an execution attempt in the call's attempt summary.
+
+        The summary is a single small record, so it is replaced in one
+        write; concurrent attempts may occasionally be counted once.
+        It also serves as a lease on the call: it names the process that
+        runs the execution and stays marked as running until the execution
+        fails (on success, the summary is deleted).
+
+        Args:
+            portal: The portal executing the call.
+        """
+        summary = portal._attempt_summaries.get(self, None)
+        count = 0 if summary is None else summary["count"]
+        pid = os.getpid()
+        portal._attempt_summaries[self] = dict(
+            count=count + 1, last_attempt_at=time.time()
+            , running=True, node=get_node_signature(), pid=pid
+            , process_start_time=_get_process_start_time(pid))
+
+
+    def _register_execution_stop(self, portal: PureCodePortal) -> None:
+        """Mark the call's failed execution as no longer running.
+
+        Args:
+            portal: The portal executing the call.
+        """
+        summary = portal._attempt_summaries.get(self, None)
+        if summary is not None and summary.get("running", False):
+            portal._attempt_summaries[self] = dict(summary, running=False)
+
+
+    def _execution_in_progress(self, portal: PureCodePortal) -> bool:
+        """Check whether some process is executing the call right now."""
+        summary = portal._attempt_summaries.get(self, None)
+        return summary is not None and _execution_is_in_progress(summary)
+
+
+    def _dead_letter_if_exhausted(self, portal: PureCodePortal) -> bool:
+        """Move the request to the dead-letter store if it failed too often.
+
+        Swarm workers call this for the requests they pick, before checking
+        needs_execution. The attempt summary is read and the request moved
+        without any lock, so a concurrent attempt that starts in between
+        may still run once after the request is dead-lettered.
+
+        Args:
+            portal: The portal with the request and its attempt summary.
+
+        Returns:
+            bool: Whether the request has exceeded the portal's
+            max_execution_attempts and was dead-lettered.
+        """
+        summary = portal._attempt_summaries.get(self, None)
+        if summary is None or summary["count"] <= portal.max_execution_attempts:
+            return False
+        priority = portal._dequeue_request(self)
+        portal._dead_letters[self] = dict(summary
+            , address=self, fn_name=self.fn.name
+            , priority=priority if priority is not None else _DEFAULT_PRIORITY
+            , dead_lettered_at=time.time())
+        return True
+
+
     @property
     def needs_execution(self) -> bool:
         """Whether this call is a good candidate for execution.
 
         Returns False if the result is cached, another worker is processing it,
         or too many attempts have failed. Uses exponential backoff to avoid
-        repeatedly executing failing calls.
+        repeatedly executing failing calls. Only reads the portal's storage:
+        requests that exceed max_execution_attempts are moved to the
+        dead-letter store by _dead_letter_if_exhausted.
 
         Returns:
             True if execution should be attempted; False otherwise.
         """
-        _DEFAULT_EXECUTION_TIME = 10  # TODO: move to portal config
-        _MAX_EXECUTION_ATTEMPTS = 5   # TODO: move to portal config
-
         if self.ready:
             return False
-        with self.fn.portal:
-            past_attempts = self.call_signature.execution_attempts
-            n_past_attempts = len(past_attempts)
-            if n_past_attempts == 0:
+        with self.fn.portal as portal:
+            summary = portal._attempt_summaries.get(self, None)
+            if summary is None:
                 return True
-            if n_past_attempts > _MAX_EXECUTION_ATTEMPTS:
-                # TODO: log this event. Should we have a dead-letter queue?
+            n_past_attempts = summary["count"]
+            if n_past_attempts > portal.max_execution_attempts:
                 return False
-            most_recent_timestamp = max(
-                past_attempts.timestamp(a) for a in past_attempts)
-            current_timestamp = time.time()
-            if (current_timestamp - most_recent_timestamp
-                    > _DEFAULT_EXECUTION_TIME*(2**n_past_attempts)):
-                return True
-            return False
+            if _execution_is_in_progress(summary):
+                return False
+            return (time.time() - summary["last_attempt_at"]
+                > _DEFAULT_EXECUTION_TIME*(2**n_past_attempts))
 
 
 def get_all_known_pure_code_portals() -> set[PureCodePortal]:
@@ -14,10 +14,12 @@ are tracked, not dependencies or environment.
 
 from typing import Callable, Any
 
+from .._110_supporting_utilities import get_long_infoname
 from .._310_ordinary_code_portals import ReuseFlag
 from .._350_guarded_code_portals import guarded, ExtensionFn
 from .._360_pure_code_portals.pure_core_classes import (
-    PureCodePortal, PureFn)
+    PureCodePortal, PureFn, _validate_concurrency_limit,
+    _validate_execution_limit)
 
 from persidict import KEEP_CURRENT, Joker
 
@@ -35,8 +37,13 @@ class pure(guarded):
                  , requirements: list[ExtensionFn] | None = None
                  , result_checks: list[ExtensionFn] | None = None
                  , fixed_kwargs: dict[str, Any] | None = None
-                 , verbose_logging: bool | Joker | ReuseFlag = KEEP_CURRENT
+                 , verbose_logging: bool | float | Joker | ReuseFlag = KEEP_CURRENT
                  , portal: PureCodePortal | None | ReuseFlag = None
+                 , max_concurrency: int | None | Joker = KEEP_CURRENT
+                 , max_portal_concurrency: int | None | Joker = KEEP_CURRENT
+                 , max_wall_time: float | None | Joker = KEEP_CURRENT
+                 , max_rss_mb: float | None | Joker = KEEP_CURRENT
+                 , batch: bool | None = None
                  ):
         """Initialize the pure decorator.
 
@@ -57,12 +64,45 @@ class pure(guarded):
                 - USE_FROM_OTHER to inherit the portal from the wrapped function
                   (only valid when wrapping an existing PureFn)
                 - None to infer from context at execution time
+
+            max_concurrency: Maximum number of executions of the function
+                that swarm workers run at the same time on one node,
+                or None for no limit.
+            max_portal_concurrency: Maximum number of executions of the
+                function that swarm workers run at the same time across
+                all nodes, or None for no limit.
+            max_wall_time: Seconds a swarm worker lets one execution of the
+                function run before killing it, or None for no limit.
+            max_rss_mb: Memory (MB) a swarm worker lets one execution of the
+                function use before killing it, or None for no limit.
+            batch: Whether the function is vectorized: it gets a list of
+                values for each argument and returns a list of results,
+                one per call. Pythagoras still caches every call separately
+                and groups pending calls into batches when executing them.
+                None keeps the flag of an already wrapped PureFn.
+
+        Raises:
+            TypeError: If a swarm limit or batch has a wrong type.
+            ValueError: If a swarm limit is not positive.
         """
         super().__init__(portal=portal
                        , verbose_logging=verbose_logging
                        , fixed_kwargs=fixed_kwargs
                        , requirements=requirements
                        , result_checks=result_checks)
+        _validate_concurrency_limit("max_concurrency", max_concurrency)
+        _validate_concurrency_limit(
+            "max_portal_concurrency", max_portal_concurrency)
+        self._max_concurrency = max_concurrency
+        self._max_portal_concurrency = max_portal_concurrency
+        _validate_execution_limit("max_wall_time", max_wall_time)
+        _validate_execution_limit("max_rss_mb", max_rss_mb)
+        self._max_wall_time = max_wall_time
+        self._max_rss_mb = max_rss_mb
+        if batch is not None and not isinstance(batch, bool):
+            raise TypeError(f"batch must be a bool, "
+                            f"got {get_long_infoname(batch)}")
+        self._batch = batch
 
 
     def __call__(self, fn:Callable|str) -> PureFn:
@@ -80,5 +120,10 @@ class pure(guarded):
                          , requirements=self._requirements
                          , fixed_kwargs=self._fixed_kwargs
                          , result_checks=self._result_checks
-                         , verbose_logging=self._verbose_logging)
+                         , verbose_logging=self._verbose_logging
+                         , max_concurrency=self._max_concurrency
+                         , max_portal_concurrency=self._max_portal_concurrency
+                         , max_wall_time=self._max_wall_time
+                         , max_rss_mb=self._max_rss_mb
+                         , batch=self._batch)
         return wrapper
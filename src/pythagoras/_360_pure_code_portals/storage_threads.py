@@ -0,0 +1,49 @@
+"""Bounded thread pool for independent storage operations.
+
+Portals are bound to the thread that uses them, but the dictionaries that
+hold their data are not: reading or writing a key of a PersiDict is a
+self-contained file or network operation. On networked volumes and object
+stores, such operations are dominated by round-trip latency, so bulk work
+(submitting thousands of requests, checking thousands of results) speeds up
+considerably when the operations are issued concurrently.
+
+Items are processed in batches of _STORAGE_BATCH_SIZE per task, by at most
+_MAX_STORAGE_THREADS threads. Operations passed here must only touch
+storage: they must not enter portals or build addresses that store values.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Final, Sequence, TypeVar
+
+_MAX_STORAGE_THREADS: Final[int] = 16
+_STORAGE_BATCH_SIZE: Final[int] = 32
+
+ItemType = TypeVar("ItemType")
+ResultType = TypeVar("ResultType")
+
+
+def _map_storage_operation(operation: Callable[[ItemType], ResultType]
+        , items: Sequence[ItemType]) -> list[ResultType]:
+    """Apply a storage operation to each item, concurrently in batches.
+
+    Args:
+        operation: Function of one item that only reads or writes storage.
+        items: The items to process.
+
+    Returns:
+        list: Results of the operation, in the order of items.
+
+    Raises:
+        Exception: The first exception raised by the operation.
+    """
+    if len(items) <= _STORAGE_BATCH_SIZE:
+        return [operation(item) for item in items]
+    batches = [items[i:i + _STORAGE_BATCH_SIZE]
+        for i in range(0, len(items), _STORAGE_BATCH_SIZE)]
+    n_threads = min(_MAX_STORAGE_THREADS, len(batches))
+    with ThreadPoolExecutor(max_workers=n_threads) as pool:
+        batch_results = pool.map(
+            lambda batch: [operation(item) for item in batch], batches)
+        return [result for results in batch_results for result in results]
@@ -8,7 +8,10 @@ worker assignment, or single execution.
 Main exports:
 - SwarmingPortal: Portal for distributed swarming execution of pure functions.
 - DescendantProcessInfo: Tracks descendant processes spawned by a swarming portal.
+- ExecutionLimitExceeded: Crash recorded when a worker kills an execution
+  that exceeded its max_wall_time or max_rss_mb.
 """
 
 from .system_processes_info_getters import *
 from .swarming_portals import *
+from .task_watchdog import *
@@ -0,0 +1,217 @@
+"""Execution of small requests in batches within one worker subprocess.
+
+A background worker runs execution requests in a fresh subprocess, so
+every request pays for spawning a Python interpreter, reconstructing the
+portal and loading the function. For functions that run for milliseconds,
+this overhead dwarfs the computation itself.
+
+Instead of exiting after the request it picked, a subprocess keeps
+executing more pending requests of the same function at the same
+priority, reusing the already loaded function object (with its compiled
+code and its invocation plan of requirements). It stops once it has
+executed a batch of requests or spent its target time slice, whichever
+comes first.
+
+The batch size adapts to observed execution times: the average duration
+of the function's executions on this node is kept in the portal's local
+node value store, and a batch holds as many executions as fit into the
+target time slice. Slow functions thus still get one request per
+subprocess, while tiny ones get up to _MAX_BATCH_SIZE.
+
+Requests of batch (vectorized) functions, see PureFn.batch, are instead
+collected first and executed together in one call of the function; the
+whole call is then subject to the function's wall time limit.
+
+Batched requests are not claimed exclusively: like any other request in
+the swarming model, a request may occasionally be executed by more than
+one worker.
+"""
+
+from __future__ import annotations
+
+import time
+from multiprocessing.connection import Connection
+from typing import Final
+
+from persidict import PersiDict
+
+from .._350_guarded_code_portals import NO_OBJECTIONS
+from .._360_pure_code_portals.pure_core_classes import (
+    PureCodePortal, PureFn, PureFnExecutionResultAddr,
+    _DEFAULT_PRIORITY, _get_request_partition)
+from .resource_scheduler import _sample_queued_requests
+from .task_watchdog import _report_task
+
+_TARGET_TIME_SLICE_SECONDS: Final[float] = 2.0
+_MAX_BATCH_SIZE: Final[int] = 64
+_DURATION_SMOOTHING: Final[float] = 0.3
+_DURATIONS_KEY: Final[str] = "execution_durations"
+
+
+def _get_durations(portal: PureCodePortal) -> PersiDict:
+    """Return the store of average execution durations on this node."""
+    return portal.local_node_value_store.get_subdict(_DURATIONS_KEY)
+
+
+def _get_average_duration(portal: PureCodePortal, fn: PureFn
+        ) -> float | None:
+    """Return the average execution duration of a function on this node."""
+    record = _get_durations(portal).get(fn.hash_signature, None)
+    if not isinstance(record, dict):
+        return None
+    return record["seconds"]
+
+
+def _record_execution_durations(portal: PureCodePortal, fn: PureFn
+        , durations: list[float]) -> None:
+    """Fold the durations of a batch into the function's running average.
+
+    Args:
+        portal: The portal whose local node value store keeps durations.
+        fn: The executed function.
+        durations: Execution times (in seconds) observed in the batch.
+    """
+    if not durations:
+        return
+    observed = sum(durations) / len(durations)
+    average = _get_average_duration(portal, fn)
+    if average is not None:
+        observed = (_DURATION_SMOOTHING * observed
+            + (1 - _DURATION_SMOOTHING) * average)
+    _get_durations(portal)[fn.hash_signature] = dict(seconds=observed)
+
+
+def _get_batch_size(average_duration: float | None) -> int:
+    """Return how many executions fit into the target time slice.
+
+    Args:
+        average_duration: Average execution time in seconds, or None
+            if it is not known yet.
+
+    Returns:
+        int: Batch size between 1 and _MAX_BATCH_SIZE.
+    """
+    if average_duration is None:
+        return 1
+    if average_duration <= 0:
+        return _MAX_BATCH_SIZE
+    batch_size = int(_TARGET_TIME_SLICE_SECONDS / average_duration)
+    return max(1, min(_MAX_BATCH_SIZE, batch_size))
+
+
+def _get_request_priority(portal: PureCodePortal
+        , address: PureFnExecutionResultAddr) -> int:
+    """Return the priority of a pending request (the default if unknown)."""
+    priority = portal._execution_requests.get(address, None)
+    if priority is None or isinstance(priority, bool):
+        return _DEFAULT_PRIORITY
+    return priority
+
+
+def _claim_requests(portal: PureCodePortal, fn: PureFn, priority: int
+        , k: int, seen: set[PureFnExecutionResultAddr]
+        ) -> list[PureFnExecutionResultAddr]:
+    """Find up to k more pending requests of a function to execute.
+
+    Args:
+        portal: The portal with the queue of execution requests.
+        fn: The function whose requests are wanted.
+        priority: Priority of the queue partition to take requests from.
+        k: Maximum number of requests to return.
+        seen: Addresses already taken by this batch; updated in place.
+
+    Returns:
+        list[PureFnExecutionResultAddr]: Addresses of the requests, with
+        the loaded function object attached to them.
+    """
+    partition = _get_request_partition(fn, priority)
+    claimed = []
+    for address in _sample_queued_requests(portal, partition, k):
+        if address in seen:
+            continue
+        seen.add(address)
+        if address not in portal._execution_requests:
+            continue
+        address._set_cached_properties(fn=fn)
+        if (not address._dead_letter_if_exhausted(portal)
+                and address.needs_execution):
+            claimed.append(address)
+    return claimed
+
+
+def _execute_batch(portal: PureCodePortal
+        , address: PureFnExecutionResultAddr
+        , task_connection: Connection | None = None) -> None:
+    """Execute a request, then more pending requests of the same function.
+
+    The first request must already be reported to the supervising worker;
+    every following one is reported right before its execution, so wall
+    time limits apply to each execution separately.
+
+    Args:
+        portal: The portal whose worker executes the requests.
+        address: The result address of the first request.
+        task_connection: Pipe to the supervising background worker, or None.
+    """
+    started = time.monotonic()
+    fn = address.fn
+    priority = _get_request_priority(portal, address)
+    average_duration = _get_average_duration(portal, fn)
+    if fn.batch:
+        _execute_vectorized_batch(portal, address, priority, average_duration)
+        return
+    durations: list[float] = []
+    try:
+        address.execute()
+        durations.append(time.monotonic() - started)
+        if average_duration is None:
+            average_duration = durations[0]
+        batch_size = _get_batch_size(average_duration)
+        seen = {address}
+        while len(durations) < batch_size:
+            claimed = _claim_requests(portal, fn, priority
+                , batch_size - len(durations), seen)
+            if not claimed:
+                return
+            for next_address in claimed:
+                if time.monotonic() - started > _TARGET_TIME_SLICE_SECONDS:
+                    return
+                if next_address.can_be_executed is not NO_OBJECTIONS:
+                    continue
+                _report_task(task_connection, next_address, fn)
+                execution_started = time.monotonic()
+                next_address.execute()
+                durations.append(time.monotonic() - execution_started)
+    finally:
+        _record_execution_durations(portal, fn, durations)
+
+
+def _execute_vectorized_batch(portal: PureCodePortal
+        , address: PureFnExecutionResultAddr, priority: int
+        , average_duration: float | None) -> None:
+    """Collect pending requests of a batch function and execute them at once.
+
+    Args:
+        portal: The portal whose worker executes the requests.
+        address: The result address of the first request.
+        priority: Priority of the queue partition to take requests from.
+        average_duration: Average execution time per request on this node,
+            or None if it is not known yet.
+    """
+    fn = address.fn
+    if average_duration is None:
+        batch_size = _MAX_BATCH_SIZE
+    else:
+        batch_size = _get_batch_size(average_duration)
+    addresses = [address]
+    seen = {address}
+    while len(addresses) < batch_size:
+        claimed = _claim_requests(portal, fn, priority
+            , batch_size - len(addresses), seen)
+        if not claimed:
+            break
+        addresses += claimed
+    started = time.monotonic()
+    fn._execute_vectorized(addresses)
+    duration = (time.monotonic() - started) / len(addresses)
+    _record_execution_durations(portal, fn, [duration])
@@ -0,0 +1,156 @@
+"""Per-function concurrency limits for swarm workers.
+
+A pure function may declare max_concurrency (executions at the same time
+on one node) and max_portal_concurrency (executions at the same time
+across all nodes of the portal). Swarm workers enforce these limits with
+leases: before executing a request, a worker takes a lease for the
+function, and if the limit is already reached, it leaves the request in
+the queue and looks for another one.
+
+Node leases live in the portal's local node value store and are owned by
+processes: a lease of a process that is no longer running is dead.
+Portal-wide leases live in the portal's shared storage. Processes on other
+nodes can't be checked directly, so portal-wide leases also carry an
+expiration time, which a heartbeat thread keeps pushing forward while the
+execution runs; a lease whose expiration time passed is dead.
+
+Taking a lease is optimistic: a worker counts live leases, writes its own
+lease if there is room, and counts again. If concurrent workers overshot
+the limit, the worker withdraws its lease and skips the request. Limits
+are therefore never exceeded, at the price of occasional spurious skips.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Final, Iterator
+
+from persidict import PersiDict
+
+from .._110_supporting_utilities import get_node_signature, get_random_signature
+from .._360_pure_code_portals.pure_core_classes import PureCodePortal, PureFn
+from .system_processes_info_getters import (
+    get_current_process_id, get_current_process_start_time,
+    get_process_start_time)
+
+_CONCURRENCY_LEASES_KEY: Final[str] = "concurrency_leases"
+_PORTAL_LEASE_TTL_SECONDS: Final[float] = 60.0
+
+
+def _get_node_leases(portal: PureCodePortal, fn: PureFn) -> PersiDict:
+    """Return the store of a function's concurrency leases on this node."""
+    return portal.local_node_value_store.get_subdict(
+        (_CONCURRENCY_LEASES_KEY, fn.hash_signature))
+
+
+def _get_portal_leases(portal: PureCodePortal, fn: PureFn) -> PersiDict:
+    """Return the store of a function's portal-wide concurrency leases."""
+    return portal._concurrency_leases.get_subdict(fn.hash_signature)
+
+
+def _make_lease() -> dict:
+    """Create a lease record owned by the current process."""
+    return dict(node=get_node_signature()
+        , pid=get_current_process_id()
+        , process_start_time=get_current_process_start_time()
+        , expires_at=time.time() + _PORTAL_LEASE_TTL_SECONDS)
+
+
+def _lease_is_live(lease: dict) -> bool:
+    """Check whether a lease is still held.
+
+    Leases taken on this node are live while their process is running;
+    leases taken on other nodes are live until they expire.
+    """
+    try:
+        if lease["node"] == get_node_signature():
+            return (get_process_start_time(lease["pid"])
+                == lease["process_start_time"])
+        return lease["expires_at"] > time.time()
+    except (KeyError, TypeError):
+        return False
+
+
+def _count_live_leases(leases: PersiDict) -> int:
+    """Count live leases, removing the dead ones."""
+    n_live = 0
+    for key in list(leases.keys()):
+        lease = leases.get(key)
+        if isinstance(lease, dict) and _lease_is_live(lease):
+            n_live += 1
+        else:
+            leases.delete_if_exists(key)
+    return n_live
+
+
+def _try_acquire_lease(leases: PersiDict, limit: int) -> str | None:
+    """Take a lease unless the limit is reached.
+
+    Args:
+        leases: The store of leases for one function.
+        limit: Maximum number of live leases.
+
+    Returns:
+        str | None: The key of the new lease, or None if there is no room.
+    """
+    if _count_live_leases(leases) >= limit:
+        return None
+    key = f"{get_current_process_id()}_{get_random_signature()}"
+    leases[key] = _make_lease()
+    if _count_live_leases(leases) > limit:
+        leases.delete_if_exists(key)
+        return None
+    return key
+
+
+def _renew_lease_periodically(leases: PersiDict, key: str
+        , stop: threading.Event) -> None:
+    """Push a lease's expiration time forward until stop is set."""
+    while not stop.wait(_PORTAL_LEASE_TTL_SECONDS / 3):
+        try:
+            leases[key] = _make_lease()
+        except Exception:
+            pass  # Renewal is best-effort; retried on the next beat
+
+
+@contextmanager
+def _concurrency_lease(portal: PureCodePortal, fn: PureFn) -> Iterator[bool]:
+    """Hold concurrency leases for a function while it executes.
+
+    Args:
+        portal: The portal whose stores keep the leases.
+        fn: The function about to be executed.
+
+    Yields:
+        bool: True if the function may execute now, False if one of its
+        concurrency limits is reached (the caller should skip it).
+    """
+    acquired: list[tuple[PersiDict, str]] = []
+    stop_renewal = threading.Event()
+    renewal: threading.Thread | None = None
+    try:
+        limits = ((fn.max_concurrency, _get_node_leases)
+            , (fn.max_portal_concurrency, _get_portal_leases))
+        for limit, get_leases in limits:
+            if limit is None:
+                continue
+            leases = get_leases(portal, fn)
+            key = _try_acquire_lease(leases, limit)
+            if key is None:
+                yield False
+                return
+            acquired.append((leases, key))
+        if fn.max_portal_concurrency is not None:
+            renewal = threading.Thread(target=_renew_lease_periodically
+                , args=(*acquired[-1], stop_renewal), daemon=True)
+            renewal.start()
+        yield True
+    finally:
+        stop_renewal.set()
+        if renewal is not None:
+            # A renewal in flight would otherwise re-create a deleted lease
+            renewal.join()
+        for leases, key in acquired:
+            leases.delete_if_exists(key)
@@ -0,0 +1,89 @@
+"""Priority-aware, fair-share choice of the queue partition to work on.
+
+Pending execution requests are indexed in the portal's request queue,
+partitioned by priority and function, and the small registry of partitions
+in use lives next to it (see PureCodePortal). A swarm worker first picks
+a partition and only then samples requests inside it, so the cost of the
+choice depends on the number of partitions, not on the size of the queue.
+
+Priority levels take part in a lottery: every non-empty level gets a share
+of worker picks _PRIORITY_WEIGHT_BASE times larger than the level right
+below it. Urgent requests are thus picked first most of the time, while a
+huge backlog of low-priority requests keeps making progress. Within a
+level, every function gets an equal share, so one function with a million
+queued requests can't starve another one with a few.
+
+Registry entries are refreshed whenever requests are added to their
+partitions; a worker removes an entry only when its partition is empty
+and the entry has not been refreshed for a while.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+import time
+from collections import Counter
+from typing import Final, Iterator
+
+from persidict import PersiDict
+
+from .._360_pure_code_portals.pure_core_classes import (
+    PureCodePortal, _REQUEST_PARTITION_TTL_SECONDS)
+
+_PRIORITY_WEIGHT_BASE: Final[float] = 4.0
+
+
+def _is_empty(persi_dict: PersiDict) -> bool:
+    """Check whether a dictionary has no keys, without listing all of them."""
+    return next(iter(persi_dict.keys()), None) is None
+
+
+def _expire_partition_if_stale(portal: PureCodePortal
+        , partition: tuple[str, ...]) -> None:
+    """Forget an empty partition unless requests were added to it recently."""
+    try:
+        age = time.time() - portal._request_partitions.timestamp(partition)
+    except KeyError:
+        return
+    if age > _REQUEST_PARTITION_TTL_SECONDS:
+        portal._request_partitions.delete_if_exists(partition)
+
+
+def _iter_request_partitions(portal: PureCodePortal
+        ) -> Iterator[tuple[tuple[str, ...], int]]:
+    """Yield non-empty request queue partitions in lottery order.
+
+    Each priority level's share is split evenly among its partitions,
+    and partitions are drawn by weighted sampling without replacement,
+    so the first yielded partition follows the priority and fair-share
+    rules, and the following ones are fallbacks.
+
+    Args:
+        portal: The portal with the queue of execution requests.
+
+    Yields:
+        tuple: The key prefix of a partition and its priority.
+    """
+    partitions = []
+    for partition, record in portal._request_partitions.items():
+        if isinstance(record, dict):
+            partitions.append((tuple(partition), record["priority"]))
+    if not partitions:
+        return
+    top_level = max(priority for _, priority in partitions)
+    level_sizes = Counter(priority for _, priority in partitions)
+
+    def lottery_key(item: tuple[tuple[str, ...], int]) -> float:
+        priority = item[1]
+        weight = (_PRIORITY_WEIGHT_BASE ** (priority - top_level)
+            / level_sizes[priority])
+        if weight <= 0:
+            return -math.inf
+        return math.log(1 - random.random()) / weight
+
+    for partition, priority in sorted(partitions, key=lottery_key, reverse=True):
+        if not _is_empty(portal._request_queue.get_subdict(partition)):
+            yield partition, priority
+        else:
+            _expire_partition_if_stale(portal, partition)
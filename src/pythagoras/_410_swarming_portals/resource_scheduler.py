@@ -0,0 +1,291 @@
+"""Resource-aware selection of execution requests for swarm workers.
+
+A worker that picks a random request and only then finds out that its
+unused_ram()/unused_cpu() requirements fail simply moves on, so large jobs
+can starve behind a stream of small ones, and several large jobs picked
+at once can overload the node. Instead, a worker samples a few pending
+requests from partitions of the request queue taken in priority and
+fair-share order (see fair_share), reads the resources their functions
+declare (see get_resource_demand), and picks the largest one that fits
+into what is left on the node.
+
+What is left is computed from reservations rather than from instantaneous
+readings alone: a worker reserves the declared resources of the request
+it executes for as long as the execution runs, in the portal's local node
+value store. The node's capacity minus live reservations is then capped
+by the current free resources, which also accounts for load from outside
+the swarm. Reservations of processes that died are ignored and removed.
+
+Requests whose functions declare no resources always fit and don't
+reserve anything, so plain workloads pay only for sampling a few keys.
+"""
+
+from __future__ import annotations
+
+import random
+from contextlib import contextmanager
+from itertools import islice
+from typing import Final, Iterator
+
+import psutil
+from persidict import PersiDict
+
+from .._110_supporting_utilities import get_random_signature
+from .._350_guarded_code_portals import get_node_resources, get_resource_demand
+from .._360_pure_code_portals.pure_core_classes import (
+    PureCodePortal, PureFn, PureFnExecutionResultAddr,
+    _DEFAULT_PRIORITY, _get_random_queue_shard, _get_request_queue_key)
+from .fair_share import _iter_request_partitions
+from .system_processes_info_getters import (
+    get_current_process_id, get_current_process_start_time,
+    get_process_start_time)
+
+_SCHEDULING_CANDIDATES: Final[int] = 8
+_CANDIDATES_PER_PARTITION: Final[int] = 2
+_SHARD_PROBES: Final[int] = 4
+_UNINDEXED_BATCH_SIZE: Final[int] = 1000
+_RESERVATIONS_KEY: Final[str] = "resource_reservations"
+_RESOURCES: Final[tuple[str, ...]] = ("cpu_cores", "ram_mb")
+
+
+def _sample_keys(persi_dict: PersiDict, k: int) -> list:
+    """Select up to k random keys in a single pass over the dictionary.
+
+    Args:
+        persi_dict: The dictionary to sample from.
+        k: Maximum number of keys to return.
+
+    Returns:
+        list: Distinct keys in random order.
+    """
+    sample = []
+    for i, key in enumerate(persi_dict.keys()):
+        if i < k:
+            sample.append(key)
+        else:
+            j = random.randint(0, i)
+            if j < k:
+                sample[j] = key
+    random.shuffle(sample)
+    return sample
+
+
+def _sample_queued_requests(portal: PureCodePortal
+        , partition: tuple[str, ...], k: int
+        ) -> list[PureFnExecutionResultAddr]:
+    """Sample up to k requests from a request queue partition.
+
+    Probes a few random shards of the partition and lists only the first
+    non-empty one. The whole partition is listed only if all probed shards
+    are empty, which means that it holds few requests.
+
+    Args:
+        portal: The portal with the queue of execution requests.
+        partition: The key prefix of the partition.
+        k: Maximum number of requests to return.
+
+    Returns:
+        list[PureFnExecutionResultAddr]: Result addresses of the requests.
+    """
+    queue = portal._request_queue.get_subdict(partition)
+    for _ in range(_SHARD_PROBES):
+        keys = _sample_keys(queue.get_subdict(_get_random_queue_shard()), k)
+        if keys:
+            break
+    else:
+        keys = [key[1:] for key in _sample_keys(queue, k)]
+    return [PureFnExecutionResultAddr.from_strings(
+            descriptor=key[2], hash_signature=key[0] + key[1] + key[3]
+            , assert_readiness=False)
+        for key in keys]
+
+
+def _index_unindexed_requests(portal: PureCodePortal) -> bool:
+    """Add requests that have no request queue entry to the queue.
+
+    Requests written before the request queue existed are recorded only
+    in execution_requests (with True as their value), so workers can't
+    find them in the queue. Listing execution_requests is expensive, so
+    it is done only when the queue is empty, and up to
+    _UNINDEXED_BATCH_SIZE requests are indexed at a time.
+
+    Args:
+        portal: The portal with the execution requests.
+
+    Returns:
+        bool: Whether any request was added to the queue.
+    """
+    n_indexed = 0
+    for key, priority in islice(
+            portal._execution_requests.items(), _UNINDEXED_BATCH_SIZE):
+        address = PureFnExecutionResultAddr.from_strings(
+            descriptor=key[2], hash_signature=key[0] + key[1] + key[3]
+            , assert_readiness=False)
+        if isinstance(priority, bool) or not isinstance(priority, int):
+            priority = _DEFAULT_PRIORITY
+        portal._enqueue_request(address, priority)
+        n_indexed += 1
+    return n_indexed > 0
+
+
+def _get_node_capacity() -> dict[str, float]:
+    """Return the total logical CPU cores and RAM (MB) of this node."""
+    return dict(cpu_cores=float(psutil.cpu_count(logical=True) or 1)
+        , ram_mb=psutil.virtual_memory().total / (1024 * 1024))
+
+
+def _get_reservations(portal: PureCodePortal) -> PersiDict:
+    """Return the store of resource reservations on this node."""
+    return portal.local_node_value_store.get_subdict(_RESERVATIONS_KEY)
+
+
+def _reservation_is_live(reservation: dict) -> bool:
+    """Check whether the process that made a reservation is still running."""
+    try:
+        return (get_process_start_time(reservation["pid"])
+            == reservation["process_start_time"])
+    except (KeyError, TypeError):
+        return False
+
+
+def _get_reserved_resources(portal: PureCodePortal) -> dict[str, float]:
+    """Sum the live resource reservations on this node.
+
+    Reservations left behind by processes that are no longer running
+    are removed.
+
+    Args:
+        portal: The portal whose local node value store keeps reservations.
+
+    Returns:
+        dict[str, float]: Reserved "cpu_cores" and "ram_mb".
+    """
+    reserved = dict.fromkeys(_RESOURCES, 0.0)
+    reservations = _get_reservations(portal)
+    for key in list(reservations.keys()):
+        reservation = reservations.get(key)
+        if not isinstance(reservation, dict):
+            continue
+        if not _reservation_is_live(reservation):
+            reservations.delete_if_exists(key)
+            continue
+        for resource in _RESOURCES:
+            reserved[resource] += reservation.get(resource, 0.0)
+    return reserved
+
+
+def _get_available_resources(portal: PureCodePortal) -> dict[str, float]:
+    """Return the resources new executions on this node may still use.
+
+    Args:
+        portal: The portal whose local node value store keeps reservations.
+
+    Returns:
+        dict[str, float]: Available "cpu_cores" and "ram_mb": capacity minus
+        live reservations, but no more than what is currently free.
+    """
+    capacity = _get_node_capacity()
+    reserved = _get_reserved_resources(portal)
+    free = get_node_resources(smoothed=False)
+    return dict(
+        cpu_cores=min(capacity["cpu_cores"] - reserved["cpu_cores"]
+            , free["unused_cpu_cores"])
+        , ram_mb=min(capacity["ram_mb"] - reserved["ram_mb"]
+            , free["unused_ram_mb"]))
+
+
+def _fits(demand: dict[str, float], available: dict[str, float]) -> bool:
+    """Check whether a resource demand fits into the available resources."""
+    return all(demand[resource] <= available[resource]
+        for resource in _RESOURCES if demand[resource] > 0)
+
+
+def _demand_size(demand: dict[str, float]
+        , capacity: dict[str, float]) -> float:
+    """Size of a demand as the sum of its shares of the node's capacity."""
+    return sum(demand[resource] / capacity[resource] for resource in _RESOURCES)
+
+
+def _pick_execution_request(portal: PureCodePortal
+        , excluded: set[PureFnExecutionResultAddr] | None = None
+        ) -> tuple[PureFnExecutionResultAddr, dict[str, float]] | None:
+    """Pick a pending execution request that fits into this node.
+
+    Samples a few pending requests from queue partitions taken in priority
+    and fair-share order. Among the requests that fit into the available
+    resources, only those at the priority level of the first fitting one
+    are considered, and the one with the largest declared resource demand
+    is returned. Index entries of requests that are no longer pending are
+    removed, and requests that failed too many times are dead-lettered
+    along the way. If the queue is empty, requests recorded without
+    a queue entry are indexed first; see _index_unindexed_requests.
+
+    Args:
+        portal: The portal with the queue of execution requests.
+        excluded: Addresses of requests the caller has already skipped.
+
+    Returns:
+        tuple | None: The result address of the picked request and its
+        resource demand, or None if no sampled request can run now.
+    """
+    candidates = []
+    queue_is_empty = True
+    for partition, priority in _iter_request_partitions(portal):
+        queue_is_empty = False
+        for address in _sample_queued_requests(
+                portal, partition, _CANDIDATES_PER_PARTITION):
+            if excluded and address in excluded:
+                continue
+            if address not in portal._execution_requests:
+                portal._request_queue.delete_if_exists(
+                    _get_request_queue_key(partition, address))
+                continue
+            if (address._dead_letter_if_exhausted(portal)
+                    or not address.needs_execution):
+                continue
+            candidates.append(
+                (address, get_resource_demand(address.fn), priority))
+            break  # Demands are per function: one request per partition
+        if len(candidates) >= _SCHEDULING_CANDIDATES:
+            break
+    if queue_is_empty and _index_unindexed_requests(portal):
+        return _pick_execution_request(portal, excluded)
+    if not candidates:
+        return None
+
+    demanding = [c for c in candidates if any(c[1].values())]
+    if not demanding:
+        return candidates[0][:2]
+    available = _get_available_resources(portal)
+    fitting = [c for c in candidates if _fits(c[1], available)]
+    if not fitting:
+        return None
+    fitting = [c for c in fitting if c[2] == fitting[0][2]]
+    capacity = _get_node_capacity()
+    return max(fitting, key=lambda c: _demand_size(c[1], capacity))[:2]
+
+
+@contextmanager
+def _resource_reservation(portal: PureCodePortal, fn: PureFn
+        , demand: dict[str, float] | None = None) -> Iterator[None]:
+    """Reserve the declared resources of a function while it executes.
+
+    Args:
+        portal: The portal whose local node value store keeps reservations.
+        fn: The function about to be executed.
+        demand: The function's resource demand, if already known.
+    """
+    if demand is None:
+        demand = get_resource_demand(fn)
+    if not any(demand.values()):
+        yield
+        return
+    reservations = _get_reservations(portal)
+    key = f"{get_current_process_id()}_{get_random_signature()}"
+    reservations[key] = dict(demand
+        , pid=get_current_process_id()
+        , process_start_time=get_current_process_start_time())
+    try:
+        yield
+    finally:
+        reservations.delete_if_exists(key)
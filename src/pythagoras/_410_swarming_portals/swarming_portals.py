@@ -14,9 +14,11 @@ mechanism.
 from __future__ import annotations
 
 import atexit
+import os
 import signal
-from time import sleep
-from typing import Final
+import time
+from contextlib import nullcontext
+from typing import Any, Callable, Final
 
 import pandas as pd
 import mixinforge
@@ -26,15 +28,20 @@ from persidict import PersiDict, Joker, KEEP_CURRENT
 from mixinforge import *
 
 from .._210_basic_portals import get_known_portals
-from .._350_guarded_code_portals import (NO_OBJECTIONS,
-                                           get_unused_ram_mb, get_unused_cpu_cores)
+from .._350_guarded_code_portals import NO_OBJECTIONS, get_node_resources
 from .._210_basic_portals.basic_portal_core_classes import _describe_runtime_characteristic
 from persidict import OverlappingMultiDict
 from .._360_pure_code_portals.pure_core_classes import (
     PureCodePortal, PureFnExecutionResultAddr, PureFnCallSignature)
 from .._320_logging_code_portals import log_exception
+from .resource_scheduler import _pick_execution_request, _resource_reservation
+from .concurrency_leases import _concurrency_lease
+from .batch_execution import _execute_batch
+from .task_watchdog import (_report_task, _find_limit_violation
+    , _record_limit_violation, _SUPERVISION_INTERVAL_SECONDS)
 
 from multiprocessing import get_context
+from multiprocessing.connection import Connection
 from .descendant_process_info import *
 from .system_processes_info_getters import *
 
@@ -76,6 +83,7 @@ class SwarmingPortal(PureCodePortal):
     """
     _compute_nodes: OverlappingMultiDict | None
     _node_id: str | None
+    _concurrency_leases: PersiDict | None
 
     _ancestor_process_id: int | None
     _ancestor_process_start_time: int | None
@@ -84,7 +92,7 @@ class SwarmingPortal(PureCodePortal):
 
     def __init__(self
                  , root_dict: PersiDict | str | None = None
-                 , verbose_logging: bool|Joker = KEEP_CURRENT
+                 , verbose_logging: bool|float|Joker = KEEP_CURRENT
                  , max_n_workers: int|Joker|None = KEEP_CURRENT
                  , min_n_workers: int|Joker|None = KEEP_CURRENT
                  , exact_n_workers: int|None = None
@@ -167,6 +175,12 @@ class SwarmingPortal(PureCodePortal):
 
         self._all_workers = self.local_node_value_store.get_subdict("all_workers")
 
+        leases_dict_prototype = self._root_dict.get_subdict(
+            "concurrency_leases")
+        leases_dict_params = leases_dict_prototype.get_params()
+        leases_dict_params.update(append_only=False, serialization_format="pkl")
+        self._concurrency_leases = type(self._root_dict)(**leases_dict_params)
+
 
     @property
     def auxiliary_param_names(self) -> set[str]:
@@ -340,7 +354,8 @@ class SwarmingPortal(PureCodePortal):
         """Compute target worker count based on configuration and system resources.
 
         Uses exact_n_workers if set; otherwise dynamically calculates based on
-        available CPU cores and RAM, bounded by min_n_workers and max_n_workers.
+        smoothed readings of free CPU cores and RAM (see get_node_resources),
+        bounded by min_n_workers and max_n_workers.
 
         Returns:
             Target number of workers to maintain, at least 0.
@@ -351,8 +366,9 @@ class SwarmingPortal(PureCodePortal):
             n = self.max_n_workers
             if n in (None, KEEP_CURRENT):
                 n = 10
-            n = min(n, int(get_unused_cpu_cores()) + 2)
-            n = min(n, int(get_unused_ram_mb() / 500))
+            resources = get_node_resources()
+            n = min(n, int(resources["unused_cpu_cores"]) + 2)
+            n = min(n, int(resources["unused_ram_mb"] / 500))
             n = int(n)
 
             min_n_workers = self.min_n_workers
@@ -472,9 +488,54 @@ class SwarmingPortal(PureCodePortal):
         # self._compute_nodes = None
         if self.is_ancestor:
             self._terminate_descendant_processes()
+        self._concurrency_leases = None
         super()._clear()
 
 
+    def _get_local_pool_jsparams(self) -> JsonSerializedObject:
+        """Serialize the portal for processes of a local process pool.
+
+        Pool processes get this process as their ancestor, so they don't
+        launch background workers of their own.
+
+        Returns:
+            JsonSerializedObject: Parameters to reconstruct the portal.
+        """
+        return update_jsparams(super()._get_local_pool_jsparams()
+            , ancestor_process_id=get_current_process_id()
+            , ancestor_process_start_time=get_current_process_start_time())
+
+
+    def _execute_pending_request(self) -> bool:
+        """Execute a pending request on behalf of a caller waiting for a result.
+
+        The request is picked and executed the way background workers do
+        it, respecting priorities, resource reservations and concurrency
+        limits, but without suppressing the caller's output. A failure of
+        the request's function is logged by the function, counted as
+        a failed attempt of the request, and doesn't propagate to the
+        waiting caller; any other error (e.g., of storage, leases or
+        reservations) does.
+
+        Returns:
+            bool: Whether a request was executed.
+        """
+        picked = _pick_execution_request(self)
+        if picked is None:
+            return False
+        address, demand = picked
+        if address.can_be_executed is not NO_OBJECTIONS:
+            return False
+        started_at = time.time()
+        try:
+            return _execute_within_limits(self, address, address.execute
+                , demand, suppress_output=False)
+        except Exception:
+            if _attempt_failed_in_this_process(self, address, started_at):
+                return True
+            raise
+
+
     def _randomly_delay_execution(self
             , p:float = 0.5
             , min_delay:float = 0.02
@@ -502,7 +563,7 @@ class SwarmingPortal(PureCodePortal):
 
         if self.entropy_infuser.uniform(0, 1) < p:
             delay = self.entropy_infuser.uniform(min_delay, max_delay)
-            sleep(delay)
+            time.sleep(delay)
 
 
 def _install_sigterm_exit_handler() -> None:
@@ -654,8 +715,10 @@ def _launch_many_background_workers(portal_init_jsparams:JsonSerializedObject) -
 def _background_worker(portal_init_jsparams:JsonSerializedObject) -> None:
     """Process execution requests in an infinite loop until ancestor dies.
 
-    Each request is handled in a subprocess for isolation. Worker output is
-    suppressed to avoid noise.
+    Each request (or batch of short requests, see batch_execution) is
+    handled in a subprocess for isolation, which the worker kills if an
+    execution exceeds its wall time or memory limits (see task_watchdog).
+    Worker output is suppressed to avoid noise.
 
     Args:
         portal_init_jsparams: Serialized portal configuration for reconstruction.
@@ -676,12 +739,17 @@ def _background_worker(portal_init_jsparams:JsonSerializedObject) -> None:
                     while True:
                         if not portal.ancestor_runtime_is_live():
                             return
+                        receiver, sender = ctx.Pipe(duplex=False)
                         p = ctx.Process(
                             target=_process_random_execution_request
-                            , args=(portal_init_jsparams,))
+                            , args=(portal_init_jsparams, sender))
                         current_subprocess = p
                         p.start()
-                        p.join()
+                        sender.close()
+                        try:
+                            _supervise_task(portal, p, receiver)
+                        finally:
+                            receiver.close()
                         current_subprocess = None
                         portal._randomly_delay_execution()
                 finally:
@@ -691,15 +759,104 @@ def _background_worker(portal_init_jsparams:JsonSerializedObject) -> None:
         _terminate_process_best_effort(current_subprocess, timeout=0.5)
 
 
-def _process_random_execution_request(portal_init_jsparams:JsonSerializedObject):
+def _supervise_task(portal: SwarmingPortal, process
+        , task_connection: Connection) -> None:
+    """Wait for a request subprocess, killing it if it exceeds its limits.
+
+    Args:
+        portal: The portal of the background worker.
+        process: The subprocess running _process_random_execution_request.
+        task_connection: Pipe on which the subprocess reports its request.
+    """
+    task = None
+    while True:
+        process.join(timeout=_SUPERVISION_INTERVAL_SECONDS)
+        try:
+            while task_connection.poll():
+                task = task_connection.recv()
+        except (EOFError, OSError):
+            pass
+        if not process.is_alive():
+            return
+        if task is None:
+            continue
+        violation = _find_limit_violation(task, process.pid)
+        if violation is None:
+            continue
+        _terminate_process_best_effort(process, timeout=0.5, kill_timeout=1.0)
+        try:
+            _record_limit_violation(portal, task, violation)
+        except Exception:
+            log_exception()
+        return
+
+
+def _attempt_failed_in_this_process(portal: SwarmingPortal
+        , address: PureFnExecutionResultAddr, since: float) -> bool:
+    """Check whether this process recorded a failed attempt of a request.
+
+    Args:
+        portal: The portal with the request's attempt summary.
+        address: The result address of the request.
+        since: Time (as returned by time.time()) the attempt began after.
+
+    Returns:
+        bool: True if the latest attempt of the request was made by this
+        process no earlier than since, and has failed.
+    """
+    summary = portal._attempt_summaries.get(address, None)
+    return (isinstance(summary, dict)
+        and not summary.get("running", False)
+        and summary.get("pid") == os.getpid()
+        and summary.get("last_attempt_at", 0) >= since)
+
+
+def _execute_within_limits(portal: SwarmingPortal
+        , address: PureFnExecutionResultAddr, execute: Callable[[], Any]
+        , demand: dict[str, float] | None = None
+        , task_connection: Connection | None = None
+        , suppress_output: bool = True) -> bool:
+    """Execute a request unless the function's concurrency limits forbid it.
+
+    Args:
+        portal: The portal whose worker executes the request.
+        address: The result address of the request.
+        execute: Callable that performs the execution.
+        demand: The function's resource demand, if already known.
+        task_connection: Pipe to the supervising background worker, or None.
+        suppress_output: Whether to silence stdout/stderr of the execution,
+            as background workers do.
+
+    Returns:
+        bool: True if the request was executed, False if it was skipped
+        because too many executions of the function are already running.
+    """
+    fn = address.fn
+    with _concurrency_lease(portal, fn) as acquired:
+        if not acquired:
+            return False
+        with (_resource_reservation(portal, fn, demand)
+                , OutputSuppressor() if suppress_output else nullcontext()):
+            _report_task(task_connection, address, fn)
+            execute()
+        return True
+
+
+def _process_random_execution_request(portal_init_jsparams:JsonSerializedObject
+        , task_connection: Connection | None = None):
     """Select and execute a random pending request if ancestor is alive.
 
     Continuously validates request readiness, following dependency chains when
-    validation returns PureFnCallSignature. Executes when validation succeeds.
-    Returns immediately if the ancestor process dies.
+    validation returns PureFnCallSignature. Executes when validation succeeds,
+    followed by a batch of other pending requests of the same function if
+    its executions are short (see batch_execution). Requests of functions
+    that already run at their concurrency limit are skipped. Returns
+    immediately if the ancestor process dies.
 
     Args:
         portal_init_jsparams: Serialized portal configuration for reconstruction.
+        task_connection: Pipe on which the request is reported to the
+            supervising background worker, or None if unsupervised.
     """
     _install_sigterm_exit_handler()
 
@@ -708,6 +865,7 @@ def _process_random_execution_request(portal_init_jsparams:JsonSerializedObject)
         raise TypeError(f"Expected SwarmingPortal, got {get_long_infoname(portal)}")
     with portal:
         call_signature:PureFnCallSignature|None = None
+        skipped: set[PureFnExecutionResultAddr] = set()
         iterations = 0
         while True:
             iterations += 1
@@ -722,31 +880,36 @@ def _process_random_execution_request(portal_init_jsparams:JsonSerializedObject)
                     call_signature = requirement_result
                     continue
                 elif requirement_result is NO_OBJECTIONS:
-                    with OutputSuppressor():
-                        call_signature.fn.execute(**call_signature.packed_kwargs)
-                    return
+                    signature = call_signature
+                    if _execute_within_limits(portal
+                            , signature.execution_results_addr
+                            , lambda: signature.fn.execute(
+                                **signature.packed_kwargs)
+                            , task_connection=task_connection):
+                        return
+                    call_signature = None
+                    continue
                 else:
                     call_signature = None
                     continue
             else:
-                addr = portal._execution_requests.random_key()
-                if addr is None:
+                picked = _pick_execution_request(portal, excluded=skipped)
+                if picked is None:
                     portal._randomly_delay_execution()
                     continue
-                new_address = PureFnExecutionResultAddr.from_strings(
-                    descriptor=addr[2], hash_signature=addr[0]+addr[1]+addr[3]
-                    ,assert_readiness=False)
-                if not new_address.needs_execution:
-                    continue
+                new_address, demand = picked
                 requirement_result =  new_address.can_be_executed
                 if isinstance(requirement_result, PureFnCallSignature):
                     call_signature = requirement_result
                     continue
                 elif requirement_result is not NO_OBJECTIONS:
                     continue
-                with OutputSuppressor():
-                    new_address.execute()
-                return
+                if _execute_within_limits(portal, new_address
+                        , lambda: _execute_batch(
+                            portal, new_address, task_connection)
+                        , demand, task_connection):
+                    return
+                skipped.add(new_address)
 
 
 def _terminate_all_portals_descendant_processes():
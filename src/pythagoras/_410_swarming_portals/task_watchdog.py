@@ -0,0 +1,129 @@
+"""Wall time and memory limits for executions in swarm workers.
+
+A background worker runs every execution request in its own subprocess.
+A runaway pure function could hang such a subprocess forever or eat all
+memory on the node, so the background worker supervises it instead of
+waiting for it blindly.
+
+Right before executing, the subprocess reports to its parent which request
+it executes, along with the function's max_wall_time and max_rss_mb limits
+(per-function settings, or portal-wide ones in the portal's settings).
+The parent polls the subprocess and kills it once it runs longer than
+max_wall_time or its process tree uses more than max_rss_mb of memory.
+
+The kill is recorded as an ExecutionLimitExceeded crash of the call and
+in the portal's crash history. The killed attempt is already counted in
+the call's attempt summary, so the request backs off and is eventually
+dead-lettered like any other repeatedly failing request.
+"""
+
+from __future__ import annotations
+
+import time
+from multiprocessing.connection import Connection
+from typing import Any, Final
+
+import psutil
+
+from .._110_supporting_utilities import get_random_signature
+from .._320_logging_code_portals import (
+    add_execution_environment_summary, log_exception)
+from .._360_pure_code_portals.pure_core_classes import (
+    PureCodePortal, PureFn, PureFnExecutionResultAddr)
+
+_SUPERVISION_INTERVAL_SECONDS: Final[float] = 0.25
+
+
+class ExecutionLimitExceeded(RuntimeError):
+    """Raised (and logged) when a swarm worker kills a runaway execution.
+
+    The execution ran longer than the function's max_wall_time or used
+    more memory than its max_rss_mb.
+    """
+
+    pass
+
+
+def _report_task(task_connection: Connection | None
+        , address: PureFnExecutionResultAddr, fn: PureFn) -> None:
+    """Tell the supervising worker which request is about to be executed.
+
+    Nothing is reported if there is no supervisor or the function has
+    neither a wall time nor a memory limit.
+
+    Args:
+        task_connection: Pipe to the supervising background worker, or None.
+        address: The result address of the request.
+        fn: The function of the request.
+    """
+    if task_connection is None:
+        return
+    max_wall_time = fn.max_wall_time
+    max_rss_mb = fn.max_rss_mb
+    if max_wall_time is None and max_rss_mb is None:
+        return
+    task_connection.send(dict(address=address, reported_at=time.time()
+        , max_wall_time=max_wall_time, max_rss_mb=max_rss_mb))
+
+
+def _get_process_tree_rss_mb(process_id: int) -> float:
+    """Return the memory (RSS, MB) used by a process and its descendants."""
+    try:
+        process = psutil.Process(process_id)
+        processes = [process] + process.children(recursive=True)
+    except psutil.Error:
+        return 0.0
+    rss = 0
+    for p in processes:
+        try:
+            rss += p.memory_info().rss
+        except psutil.Error:
+            pass
+    return rss / (1024 * 1024)
+
+
+def _find_limit_violation(task: dict[str, Any], process_id: int
+        ) -> str | None:
+    """Check whether a running execution exceeds its limits.
+
+    Args:
+        task: The report sent by _report_task.
+        process_id: PID of the subprocess running the execution.
+
+    Returns:
+        str | None: Description of the exceeded limit, or None.
+    """
+    elapsed = time.time() - task["reported_at"]
+    max_wall_time = task["max_wall_time"]
+    if max_wall_time is not None and elapsed > max_wall_time:
+        return (f"Execution ran for {elapsed:.1f} s, "
+                f"exceeding max_wall_time of {max_wall_time} s")
+    max_rss_mb = task["max_rss_mb"]
+    if max_rss_mb is not None:
+        rss_mb = _get_process_tree_rss_mb(process_id)
+        if rss_mb > max_rss_mb:
+            return (f"Execution used {rss_mb:.0f} MB of memory, "
+                    f"exceeding max_rss_mb of {max_rss_mb} MB")
+    return None
+
+
+def _record_limit_violation(portal: PureCodePortal, task: dict[str, Any]
+        , violation: str) -> None:
+    """Record a killed execution as a crash of its call.
+
+    Args:
+        portal: The portal of the supervising worker.
+        task: The report sent by _report_task.
+        violation: Description of the exceeded limit.
+    """
+    with portal:
+        call_signature = task["address"].call_signature
+        session_id = "run_" + get_random_signature()
+        try:
+            raise ExecutionLimitExceeded(
+                f"{violation}; killed by the swarm worker")
+        except ExecutionLimitExceeded as e:
+            log_exception()
+            crash = add_execution_environment_summary(
+                exc_type=type(e), exc_value=e)
+        call_signature.crashes[session_id + "_crash_0"] = crash
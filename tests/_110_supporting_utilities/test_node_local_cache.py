@@ -0,0 +1,34 @@
+from pythagoras._110_supporting_utilities import (
+    get_node_local_cache, get_node_local_cache_key)
+from pythagoras._110_supporting_utilities import node_local_cache
+from pythagoras._110_supporting_utilities.constants_for_signatures_and_converters import (
+    PTH_NODE_CACHE_DIR_ENV_VAR)
+
+
+def test_node_local_cache_roundtrip(tmpdir, monkeypatch):
+    monkeypatch.setenv(PTH_NODE_CACHE_DIR_ENV_VAR, str(tmpdir))
+    cache = get_node_local_cache("test_cache")
+    assert cache is not None
+    cache["abc"] = "value"
+    assert get_node_local_cache("test_cache")["abc"] == "value"
+    assert tmpdir.join("test_cache").check(dir=True)
+
+
+def test_node_local_cache_disabled(monkeypatch):
+    monkeypatch.setenv(PTH_NODE_CACHE_DIR_ENV_VAR, "")
+    assert get_node_local_cache("test_cache") is None
+
+
+def test_node_local_cache_unwritable_location(tmpdir, monkeypatch):
+    blocker = tmpdir.join("not_a_dir")
+    blocker.write("x")
+    monkeypatch.setenv(PTH_NODE_CACHE_DIR_ENV_VAR, str(blocker))
+    assert get_node_local_cache("test_cache") is None
+
+
+def test_node_local_cache_key_depends_on_release(monkeypatch):
+    key = get_node_local_cache_key("source", True)
+    assert key == get_node_local_cache_key("source", True)
+    assert key != get_node_local_cache_key("source", False)
+    monkeypatch.setattr(node_local_cache, "_pythagoras_version", "0.0.0")
+    assert key != get_node_local_cache_key("source", True)
@@ -226,3 +226,47 @@ def test_max_nested_with_reentrant_portal():
 
     with pytest.raises(RuntimeError):
         stack.push(portal)
+
+
+def test_reenter_only_for_top_portal():
+    """Verify the re-entry fast path applies only to the top portal."""
+    stack = _PortalStack()
+    portal1, portal2 = MagicMock(), MagicMock()
+
+    assert not stack.reenter(portal1)
+    stack.push(portal1)
+    assert stack.reenter(portal1)
+    assert stack.depth() == 2
+    assert stack.is_reentered(portal1)
+    assert not stack.reenter(portal2)
+    assert stack.depth() == 2
+
+
+def test_leave_reentered_keeps_portal_on_stack():
+    """Verify leaving a nested use only decrements the counter."""
+    stack = _PortalStack()
+    portal = MagicMock()
+    stack.push(portal)
+    stack.reenter(portal)
+
+    assert stack.leave_reentered(portal)
+    assert stack.peek() is portal
+    assert stack.depth() == 1
+    assert not stack.is_reentered(portal)
+
+    assert not stack.leave_reentered(portal)
+    stack.pop(portal)
+    assert stack.is_empty()
+
+
+def test_reenter_respects_max_nested_portals():
+    """Verify the re-entry fast path does not bypass the depth limit."""
+    stack = _PortalStack()
+    portal = MagicMock()
+    stack.push(portal)
+    for _ in range(MAX_NESTED_PORTALS - 1):
+        assert stack.reenter(portal)
+
+    assert not stack.reenter(portal)
+    with pytest.raises(RuntimeError):
+        stack.push(portal)
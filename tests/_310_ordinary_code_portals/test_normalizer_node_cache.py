@@ -0,0 +1,56 @@
+import pytest
+
+from pythagoras._110_supporting_utilities import get_node_local_cache
+from pythagoras._110_supporting_utilities.constants_for_signatures_and_converters import (
+    PTH_NODE_CACHE_DIR_ENV_VAR)
+from pythagoras._310_ordinary_code_portals import code_normalizer
+from pythagoras._310_ordinary_code_portals.code_normalizer import (
+    _normalize_fn_source_code_str, _NORMALIZED_SOURCES_CACHE_NAME)
+
+SOURCE = '''
+def f(x: int) -> int:
+    """Docstring."""
+    return x+1
+'''
+
+
+@pytest.fixture
+def node_cache_dir(tmpdir, monkeypatch):
+    monkeypatch.setenv(PTH_NODE_CACHE_DIR_ENV_VAR, str(tmpdir))
+    _normalize_fn_source_code_str.cache_clear()
+    yield tmpdir
+    _normalize_fn_source_code_str.cache_clear()
+
+
+def test_normalized_source_is_cached_on_disk(node_cache_dir, monkeypatch):
+    expected = _normalize_fn_source_code_str(SOURCE, "f")
+    assert "Docstring" not in expected
+    node_cache = get_node_local_cache(_NORMALIZED_SOURCES_CACHE_NAME)
+    assert list(node_cache.values()) == [expected]
+
+    # A fresh process (empty in-process cache) must not re-normalize.
+    _normalize_fn_source_code_str.cache_clear()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("normalizer should not run on a cache hit")
+
+    monkeypatch.setattr(
+        code_normalizer, "_normalize_fn_source_code_str_uncached", fail)
+    assert _normalize_fn_source_code_str(SOURCE, "f") == expected
+
+
+def test_cache_key_depends_on_decorator_flag(node_cache_dir):
+    decorated = "@pure()\n" + SOURCE.lstrip()
+    kept = _normalize_fn_source_code_str(decorated, "f", False)
+    dropped = _normalize_fn_source_code_str(decorated, "f", True)
+    assert "@pure" in kept
+    assert "@pure" not in dropped
+    node_cache = get_node_local_cache(_NORMALIZED_SOURCES_CACHE_NAME)
+    assert len(node_cache) == 2
+
+
+def test_errors_are_not_cached(node_cache_dir):
+    with pytest.raises(SyntaxError):
+        _normalize_fn_source_code_str("def f(:\n    pass", "f")
+    node_cache = get_node_local_cache(_NORMALIZED_SOURCES_CACHE_NAME)
+    assert len(node_cache) == 0
@@ -0,0 +1,74 @@
+import ast
+import pickle
+
+import pytest
+
+from pythagoras._210_basic_portals.portal_tester import _PortalTester
+from pythagoras._310_ordinary_code_portals import (
+    OrdinaryCodePortal, OrdinaryFn, get_normalized_fn_source_code_str,
+    set_default_normalizer_version, get_default_normalizer_version,
+    LEGACY_NORMALIZER_VERSION, AST_NORMALIZER_VERSION)
+
+SOURCE = '''
+def f(a, b):
+    """Docstring."""
+    x = [a,b,   a+b]  # comment
+    return x
+'''
+
+
+@pytest.fixture
+def restore_default_normalizer():
+    yield
+    set_default_normalizer_version(None)
+
+
+def test_default_is_legacy(monkeypatch, restore_default_normalizer):
+    monkeypatch.delenv("PYTHAGORAS_NORMALIZER_VERSION", raising=False)
+    assert get_default_normalizer_version() == LEGACY_NORMALIZER_VERSION
+    fn = OrdinaryFn(SOURCE)
+    assert fn.normalizer_version == LEGACY_NORMALIZER_VERSION
+    assert "normalizer_version" not in fn.__getstate__()
+
+
+def test_ast_normalizer_output():
+    normalized = get_normalized_fn_source_code_str(
+        SOURCE, normalizer_version=AST_NORMALIZER_VERSION)
+    assert "Docstring" not in normalized
+    assert "comment" not in normalized
+    assert normalized == ast.unparse(ast.parse(normalized)) + "\n"
+
+
+def test_version_is_part_of_identity(tmpdir, restore_default_normalizer):
+    with _PortalTester(OrdinaryCodePortal, tmpdir):
+        legacy_fn = OrdinaryFn(SOURCE)
+        set_default_normalizer_version(AST_NORMALIZER_VERSION)
+        ast_fn = OrdinaryFn(SOURCE)
+        assert ast_fn.normalizer_version == AST_NORMALIZER_VERSION
+        assert ast_fn.__getstate__()["normalizer_version"] == (
+            AST_NORMALIZER_VERSION)
+        assert legacy_fn.hash_signature != ast_fn.hash_signature
+        assert ast_fn.execute(a=1, b=2) == [1, 2, 3]
+
+        restored = pickle.loads(pickle.dumps(ast_fn))
+        assert restored.normalizer_version == AST_NORMALIZER_VERSION
+        assert restored.hash_signature == ast_fn.hash_signature
+
+        clone = OrdinaryFn(legacy_fn)
+        assert clone.normalizer_version == LEGACY_NORMALIZER_VERSION
+
+
+def test_environment_variable(monkeypatch, restore_default_normalizer):
+    monkeypatch.setenv("PYTHAGORAS_NORMALIZER_VERSION", AST_NORMALIZER_VERSION)
+    assert get_default_normalizer_version() == AST_NORMALIZER_VERSION
+    set_default_normalizer_version(LEGACY_NORMALIZER_VERSION)
+    assert get_default_normalizer_version() == LEGACY_NORMALIZER_VERSION
+    monkeypatch.setenv("PYTHAGORAS_NORMALIZER_VERSION", "unknown")
+    set_default_normalizer_version(None)
+    with pytest.raises(ValueError):
+        get_default_normalizer_version()
+
+
+def test_invalid_version():
+    with pytest.raises(ValueError):
+        set_default_normalizer_version("black_v1")
@@ -0,0 +1,102 @@
+import pytest
+
+import pythagoras as pth
+from pythagoras import _PortalTester
+from pythagoras import LoggingCodePortal
+from pythagoras._210_basic_portals.portal_description_helpers import (
+    _get_description_value_by_key)
+from pythagoras._320_logging_code_portals.exception_fingerprints import (
+    get_exception_fingerprint)
+from pythagoras._320_logging_code_portals.logging_portal_core_classes import (
+    LoggingFnCallSignature, _TOP_CRASH_FINGERPRINTS_TXT)
+
+
+def _fingerprint_of(fn, *args):
+    try:
+        fn(*args)
+    except Exception as e:
+        return get_exception_fingerprint(type(e), e, e.__traceback__)
+
+
+def test_fingerprint_ignores_message_but_not_location():
+    def fail(x):
+        raise ValueError(f"bad {x}")
+
+    def fail_elsewhere(x):
+        raise ValueError(f"bad {x}")
+
+    assert _fingerprint_of(fail, 1) == _fingerprint_of(fail, 2)
+    assert _fingerprint_of(fail, 1) != _fingerprint_of(fail_elsewhere, 1)
+
+
+def test_repeated_crashes_are_aggregated(tmpdir, capsys):
+    with _PortalTester(LoggingCodePortal, tmpdir, verbose_logging=True) as t:
+        portal = t.portal
+        portal.global_portal_settings["crash_payloads_per_window"] = 3
+
+        @pth.logging()
+        def f(x):
+            return 1 / 0
+
+        for i in range(7):
+            with pytest.raises(ZeroDivisionError):
+                f(x=i)
+
+        assert len(portal._crash_history) == 3
+        assert len(portal._crash_fingerprints) == 1
+        [top] = portal.get_top_crash_fingerprints()
+        assert top["exception_type"] == "ZeroDivisionError"
+        assert top["count"] == 7
+        assert len(top["sample_session_ids"]) == 7
+
+        last_signature = LoggingFnCallSignature(f, dict(x=6))
+        [crash] = last_signature.execution_records[0].crashes
+        assert crash["exception_fingerprint"] == top["fingerprint"]
+        assert crash["occurrence"] == 7
+
+        captured = capsys.readouterr().out
+        assert captured.count("execution_environment_summary") == 3
+        assert "occurrence 7" in captured
+
+        description = portal.describe()
+        summary = _get_description_value_by_key(
+            description, _TOP_CRASH_FINGERPRINTS_TXT)
+        assert "ZeroDivisionError" in summary
+        assert ": 7" in summary
+
+
+def test_all_crash_payloads_are_stored_by_default(tmpdir, capsys):
+    with _PortalTester(LoggingCodePortal, tmpdir) as t:
+        assert t.portal.crash_payloads_per_window is None
+        for _ in range(12):
+            try:
+                with t.portal:
+                    raise KeyError("k")
+            except KeyError:
+                pass
+        assert len(t.portal._crash_history) == 12
+        assert t.portal.get_top_crash_fingerprints()[0]["count"] == 12
+        assert capsys.readouterr().out.count(
+            "execution_environment_summary") == 12
+
+
+def test_silent_crash_printing(tmpdir, capsys):
+    with _PortalTester(LoggingCodePortal, tmpdir) as t:
+        t.portal.global_portal_settings["crash_printing"] = "silent"
+        try:
+            with t.portal:
+                raise KeyError("k")
+        except KeyError:
+            pass
+        assert len(t.portal._crash_history) == 1
+        assert "Exception logged" not in capsys.readouterr().out
+
+
+def test_invalid_crash_settings(tmpdir):
+    with _PortalTester(LoggingCodePortal, tmpdir) as t:
+        t.portal.global_portal_settings["crash_printing"] = "loud"
+        with pytest.raises(ValueError):
+            _ = t.portal.crash_printing
+        t.portal.global_portal_settings["crash_payloads_per_window"] = -1
+        with pytest.raises(TypeError):
+            _ = t.portal.crash_payloads_per_window
@@ -0,0 +1,74 @@
+import pytest
+
+from pythagoras._210_basic_portals.portal_tester import _PortalTester
+from pythagoras._320_logging_code_portals import LoggingCodePortal, logging
+from pythagoras._320_logging_code_portals.execution_metrics import (
+    _estimate_size_in_bytes)
+
+
+def test_metrics_recorded_without_verbose_logging(tmpdir):
+    with _PortalTester(LoggingCodePortal, tmpdir) as t:
+
+        @logging(verbose_logging=False)
+        def slow(x):
+            import time
+            time.sleep(0.01)
+            return [x] * 1000
+
+        @logging(verbose_logging=False)
+        def fast(x):
+            return x
+
+        for i in range(5):
+            slow(x=i)
+            fast(x=i)
+
+        metrics = t.portal.get_execution_metrics()
+        assert len(metrics) == 10
+        assert (metrics["wall_time"] >= 0).all()
+        assert metrics["process_peak_rss"].notna().all()
+        assert not metrics["crashed"].any()
+
+        slow_metrics = t.portal.get_execution_metrics(slow)
+        assert len(slow_metrics) == 5
+        assert (slow_metrics["wall_time"] >= 0.01).all()
+        assert (slow_metrics["bytes_out"] > 1000).all()
+
+        summary = t.portal.get_execution_metrics_summary()
+        assert list(summary["fn_name"]) == ["slow", "fast"]
+        assert list(summary["count"]) == [5, 5]
+        slow_row = summary.iloc[0]
+        assert slow_row["p50_wall_time"] <= slow_row["p95_wall_time"]
+        assert slow_row["bytes_out"] == slow_metrics["bytes_out"].sum()
+
+
+def test_metrics_for_crashed_execution(tmpdir):
+    with _PortalTester(LoggingCodePortal, tmpdir) as t:
+
+        @logging()
+        def boom():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            boom()
+
+        metrics = t.portal.get_execution_metrics()
+        assert list(metrics["crashed"]) == [True]
+        assert metrics["bytes_out"].isna().all()
+        summary = t.portal.get_execution_metrics_summary()
+        assert summary.iloc[0]["crashes"] == 1
+
+
+def test_empty_metrics(tmpdir):
+    with _PortalTester(LoggingCodePortal, tmpdir) as t:
+        assert t.portal.get_execution_metrics().empty
+        assert t.portal.get_execution_metrics_summary().empty
+
+
+def test_size_estimates_are_cheap_and_proportional():
+    small = _estimate_size_in_bytes(["x" * 10] * 10)
+    large = _estimate_size_in_bytes(["x" * 10] * 100_000)
+    assert 0 < small < large
+    assert large > 100_000 * 10
+    assert _estimate_size_in_bytes(dict(a=b"x" * 5000)) > 5000
+    assert _estimate_size_in_bytes(lambda: None) > 0
@@ -0,0 +1,67 @@
+import pstats
+
+from pythagoras._210_basic_portals.portal_tester import _PortalTester
+from pythagoras._320_logging_code_portals import (
+    LoggingCodePortal, LoggingFnCallSignature, logging,
+    merge_execution_profiles, format_collapsed_stacks)
+
+
+def test_no_profiles_by_default(tmpdir):
+    with _PortalTester(LoggingCodePortal, tmpdir) as t:
+
+        @logging(verbose_logging=True)
+        def f(n):
+            return sum(range(n))
+
+        f(n=10)
+        signature = LoggingFnCallSignature(f, dict(n=10))
+        assert len(signature.execution_profiles) == 0
+        assert signature.execution_records[0].profile is None
+        assert t.portal.get_execution_metrics()["profile_addr"].isna().all()
+
+
+def test_portal_level_profiling(tmpdir):
+    with _PortalTester(LoggingCodePortal, tmpdir) as t:
+        t.portal.global_portal_settings["profiling"] = True
+
+        @logging()
+        def busy_helper(n):
+            return sum(i * i for i in range(n))
+
+        for n in (1000, 2000, 3000):
+            busy_helper(n=n)
+
+        signature = LoggingFnCallSignature(busy_helper, dict(n=1000))
+        assert len(signature.execution_profiles) == 1
+
+        profiles = t.portal.get_execution_profiles(busy_helper)
+        assert len(profiles) == 3
+        assert all(p["fn_name"] == "busy_helper" for p in profiles)
+
+        merged = merge_execution_profiles(profiles)
+        assert isinstance(merged, pstats.Stats)
+        genexpr_calls = [stats[1] for func, stats in merged.stats.items()
+            if func[2] == "<genexpr>"]
+        assert sum(genexpr_calls) >= 6000
+
+        collapsed = format_collapsed_stacks(profiles)
+        assert "<genexpr>" in collapsed
+        for line in collapsed.splitlines():
+            assert int(line.rsplit(" ", 1)[1]) > 0
+
+
+def test_function_level_memory_profiling(tmpdir):
+    with _PortalTester(LoggingCodePortal, tmpdir):
+
+        @logging(verbose_logging=True)
+        def allocate():
+            return [bytes(1000) for _ in range(100)]
+
+        allocate.global_portal_settings["profiling"] = True
+        allocate.global_portal_settings["profile_memory"] = True
+        allocate()
+
+        signature = LoggingFnCallSignature(allocate, {})
+        profile = signature.execution_records[0].profile
+        assert profile["memory_peak"] >= 100_000
+        assert len(profile["memory_top"]) > 0
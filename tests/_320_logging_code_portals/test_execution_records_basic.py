@@ -1,7 +1,7 @@
 from pythagoras import logging
 from pythagoras._210_basic_portals.portal_tester import _PortalTester
 from pythagoras._320_logging_code_portals import (
-    LoggingCodePortal,LoggingFnCallSignature)
+    LoggingCodePortal, LoggingFnCallSignature, LoggingFnExecutionRecord)
 import pytest
 
 def test_basics(tmpdir):
@@ -160,3 +160,55 @@ def test_exception(tmpdir):
         with pytest.raises(Exception):
             _ = a.execution_records[0].result
         assert "ZeroDivisionError" in a.execution_records[0].output
+
+
+def test_events_in_order(tmpdir):
+    with _PortalTester(LoggingCodePortal, tmpdir):
+
+        @logging(verbose_logging=True)
+        def g(n):
+            from pythagoras import log_event
+            for i in range(n):
+                log_event(step=i)
+            return n
+
+        assert g(n=12) == 12
+        a = LoggingFnCallSignature(fn=g, arguments=dict(n=12))
+        record = a.execution_records[0]
+        events = record.events
+        assert len(events) == 12
+        assert [e["step"] for e in events] == list(range(12))
+        assert record.crashes == []
+
+
+def test_events_after_a_failed_write_are_found(tmpdir):
+    with _PortalTester(LoggingCodePortal, tmpdir):
+
+        @logging(verbose_logging=True)
+        def h():
+            return 1
+
+        assert h() == 1
+        a = LoggingFnCallSignature(fn=h, arguments={})
+        for i in (0, 3, 4):  # Writes of events 1 and 2 have failed
+            a.events[f"run_gaps_event_{i}"] = dict(step=i)
+        record = LoggingFnExecutionRecord(a, "run_gaps")
+        assert [e["step"] for e in record.events] == [0, 3, 4]
+
+
+def test_record_for_unknown_session(tmpdir):
+    with _PortalTester(LoggingCodePortal, tmpdir):
+
+        @logging(verbose_logging=True)
+        def h():
+            return 1
+
+        assert h() == 1
+        a = LoggingFnCallSignature(fn=h, arguments={})
+        record = LoggingFnExecutionRecord(a, "run_missing")
+        assert record.output is None
+        assert record.attempt_context is None
+        assert record.events == []
+        assert record.crashes == []
+        with pytest.raises(ValueError):
+            _ = record.result
@@ -0,0 +1,67 @@
+import pytest
+
+from pythagoras._210_basic_portals.portal_tester import _PortalTester
+from pythagoras._320_logging_code_portals import (
+    LoggingCodePortal, LoggingFnCallSignature, logging)
+
+
+def test_sampled_verbose_logging(tmpdir):
+    with _PortalTester(LoggingCodePortal, tmpdir) as t:
+
+        @logging(verbose_logging=0.25)
+        def f(x):
+            return x
+
+        assert f.verbose_logging
+        assert f.verbose_logging_rate == 0.25
+
+        n_calls = 400
+        for i in range(n_calls):
+            assert f(x=i) == i
+
+        n_logged = len(t.portal._run_history.pkl)
+        assert 0.1 * n_calls < n_logged < 0.4 * n_calls
+        assert len(t.portal._run_history.txt) == n_logged
+
+
+def test_deterministic_sampling(tmpdir):
+    with _PortalTester(LoggingCodePortal, tmpdir) as t:
+        t.portal.global_portal_settings["verbose_logging_sampling"] = (
+            "deterministic")
+
+        @logging(verbose_logging=0.5)
+        def g(x):
+            return x
+
+        for _ in range(3):
+            for i in range(20):
+                g(x=i)
+
+        counts = {len(LoggingFnCallSignature(g, dict(x=i)).execution_results)
+            for i in range(20)}
+        assert counts <= {0, 3}
+        assert counts == {0, 3}
+
+
+def test_crashes_logged_when_not_sampled(tmpdir):
+    with _PortalTester(LoggingCodePortal, tmpdir) as t:
+
+        @logging(verbose_logging=1e-9)
+        def h():
+            return 1 / 0
+
+        with pytest.raises(ZeroDivisionError):
+            h()
+
+        signature = LoggingFnCallSignature(h, {})
+        assert len(signature.execution_attempts) == 0
+        assert len(signature.crashes) == 1
+        assert len(t.portal._crash_history) == 1
+
+
+@pytest.mark.parametrize("rate", [-0.1, 1.5])
+def test_invalid_sample_rate(rate):
+    with pytest.raises(ValueError):
+        logging(verbose_logging=rate)
+    with pytest.raises(ValueError):
+        LoggingCodePortal(verbose_logging=rate)
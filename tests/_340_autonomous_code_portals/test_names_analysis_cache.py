@@ -0,0 +1,64 @@
+import pytest
+
+from pythagoras._110_supporting_utilities import get_node_local_cache
+from pythagoras._110_supporting_utilities.constants_for_signatures_and_converters import (
+    PTH_NODE_CACHE_DIR_ENV_VAR)
+from pythagoras._340_autonomous_code_portals import names_usage_analyzer
+from pythagoras._340_autonomous_code_portals.names_usage_analyzer import (
+    _analyze_names_in_function, _validate_and_parse_function_source,
+    _NAMES_ANALYSIS_CACHE_NAME)
+
+SOURCE = '''
+def f(x, y=2):
+    import math
+    def g(z):
+        return yield_count + z
+    return math.sqrt(x) + len(missing)
+'''
+
+
+@pytest.fixture
+def node_cache_dir(tmpdir, monkeypatch):
+    monkeypatch.setenv(PTH_NODE_CACHE_DIR_ENV_VAR, str(tmpdir))
+    _validate_and_parse_function_source.cache_clear()
+    yield tmpdir
+    _validate_and_parse_function_source.cache_clear()
+
+
+def _snapshot(analyzer):
+    names = analyzer.names
+    return (names.function, names.explicitly_global_unbound_deep
+        , names.explicitly_nonlocal_unbound_deep, names.local, names.imported
+        , names.unclassified_deep, names.accessible, names.has_relative_imports
+        , analyzer.imported_packages_deep, analyzer.n_yelds)
+
+
+def test_analysis_is_cached_on_disk(node_cache_dir, monkeypatch):
+    fresh = _analyze_names_in_function(SOURCE)
+    assert fresh["analyzer"].names.unclassified_deep == {
+        "yield_count", "len", "missing"}
+    assert len(get_node_local_cache(_NAMES_ANALYSIS_CACHE_NAME)) == 1
+
+    # A fresh process (empty in-process cache) must not re-analyze.
+    _validate_and_parse_function_source.cache_clear()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("analyzer should not run on a cache hit")
+
+    monkeypatch.setattr(names_usage_analyzer
+        , "_validate_and_parse_function_source_uncached", fail)
+    restored = _analyze_names_in_function(SOURCE)
+    assert restored["normalized_source"] == fresh["normalized_source"]
+    assert _snapshot(restored["analyzer"]) == _snapshot(fresh["analyzer"])
+
+
+def test_analysis_is_cached_in_process(node_cache_dir):
+    first = _analyze_names_in_function(SOURCE)
+    second = _analyze_names_in_function(SOURCE)
+    assert first["analyzer"] is second["analyzer"]
+
+
+def test_errors_are_not_cached(node_cache_dir):
+    with pytest.raises(ValueError):
+        _validate_and_parse_function_source("x = 1\n")
+    assert len(get_node_local_cache(_NAMES_ANALYSIS_CACHE_NAME)) == 0
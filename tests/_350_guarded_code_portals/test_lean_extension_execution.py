@@ -0,0 +1,103 @@
+import pytest
+
+import pythagoras as pth
+from pythagoras import GuardedCodePortal, KwArgs, ValueAddr
+from pythagoras._210_basic_portals.portal_tester import _PortalTester
+from pythagoras._320_logging_code_portals.logging_portal_core_classes import (
+    LoggingFnExecutionFrame)
+from pythagoras._350_guarded_code_portals.guarded_decorators import guarded
+from pythagoras._350_guarded_code_portals.guarded_portal_core_classes import (
+    ComplexRequirementFn, ResultCheckFn, SimpleRequirementFn)
+
+
+def always_ok():
+    return pth.NO_OBJECTIONS
+
+
+def x_is_positive(packed_kwargs, fn_addr):
+    if packed_kwargs.unpack()["x"] > 0:
+        return pth.NO_OBJECTIONS
+
+
+def result_is_even(packed_kwargs, fn_addr, result):
+    if result % 2 == 0:
+        return pth.NO_OBJECTIONS
+
+
+def broken_check(packed_kwargs, fn_addr, result):
+    return 1 / 0
+
+
+def double(x):
+    return x * 2
+
+
+def test_extensions_do_not_open_execution_frames(tmpdir, monkeypatch):
+    with _PortalTester(GuardedCodePortal, tmpdir):
+        requirements = [SimpleRequirementFn(always_ok)
+            , ComplexRequirementFn(x_is_positive)]
+        check = ResultCheckFn(result_is_even)
+        fn = guarded(requirements=requirements, result_checks=check)(double)
+        assert fn(x=1) == 2
+
+        frames = []
+        original_enter = LoggingFnExecutionFrame.__enter__
+        def counting_enter(frame):
+            frames.append(frame.fn_name)
+            return original_enter(frame)
+        monkeypatch.setattr(
+            LoggingFnExecutionFrame, "__enter__", counting_enter)
+
+        n_packs = []
+        original_pack = KwArgs.pack
+        def counting_pack(kwargs, *args, **kw):
+            if not all(isinstance(v, ValueAddr) for v in kwargs.values()):
+                n_packs.append(kwargs)
+            return original_pack(kwargs, *args, **kw)
+        monkeypatch.setattr(KwArgs, "pack", counting_pack)
+
+        assert fn(x=5) == 10
+        assert frames == ["double"]
+        assert len(n_packs) == 1
+
+        for extension in requirements + [check]:
+            assert len(extension.get_signature(dict()).execution_attempts) == 0
+
+
+def test_failing_extensions_still_block_execution(tmpdir):
+    with _PortalTester(GuardedCodePortal, tmpdir):
+        fn = guarded(requirements=ComplexRequirementFn(x_is_positive))(double)
+        with pytest.raises(Exception):
+            fn(x=-1)
+
+
+def test_extension_crashes_are_logged(tmpdir):
+    with _PortalTester(GuardedCodePortal, tmpdir) as t:
+        fn = guarded(result_checks=ResultCheckFn(broken_check))(double)
+        with pytest.raises(ZeroDivisionError):
+            fn(x=1)
+        [top] = t.portal.get_top_crash_fingerprints()
+        assert top["exception_type"] == "ZeroDivisionError"
+        assert top["count"] == 1
+
+
+def result_at_least(packed_kwargs, fn_addr, result, threshold):
+    if result >= threshold:
+        return pth.NO_OBJECTIONS
+
+
+def test_extensions_apply_fixed_kwargs(tmpdir):
+    with _PortalTester(GuardedCodePortal, tmpdir):
+        check = ResultCheckFn(result_at_least).fix_kwargs(threshold=10)
+        fn = guarded(result_checks=check)(double)
+        assert fn(x=5) == 10
+        with pytest.raises(pth.FunctionError):
+            fn(x=4)
+
+
+def test_extensions_reject_unexpected_kwargs(tmpdir):
+    with _PortalTester(GuardedCodePortal, tmpdir):
+        check = ResultCheckFn(result_at_least).fix_kwargs(threshold=10)
+        with pytest.raises(ValueError, match="Invalid kwargs"):
+            check._execute_lean(dict(packed_kwargs=KwArgs(x=5).pack()
+                , fn_addr=None, result=10, threshold=1))
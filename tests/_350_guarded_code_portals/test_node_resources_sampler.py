@@ -0,0 +1,122 @@
+import pytest
+
+from pythagoras import get_node_resources, get_unused_cpu_cores, get_unused_ram_mb
+from pythagoras._110_supporting_utilities.constants_for_signatures_and_converters import (
+    PTH_NODE_CACHE_DIR_ENV_VAR)
+from pythagoras._350_guarded_code_portals import node_resources_sampler as sampler
+
+
+class _FakeNode:
+    """Scripted resource probes and clock for the sampler."""
+
+    def __init__(self, monkeypatch):
+        self.now = 1_000_000.0
+        self.monotonic = 0.0
+        self.ram_mb = 8000
+        self.cpu_cores = 4.0
+        self.n_samples = 0
+        monkeypatch.setattr(sampler.time, "time", lambda: self.now)
+        monkeypatch.setattr(sampler.time, "monotonic", lambda: self.monotonic)
+        monkeypatch.setattr(sampler, "_probe_unused_ram_mb", self._ram)
+        monkeypatch.setattr(sampler, "_probe_unused_cpu_cores", self._cpu)
+        monkeypatch.setattr(sampler, "_has_load_average", lambda: True)
+        monkeypatch.setattr(sampler, "_process_reading", None)
+
+    def _ram(self):
+        self.n_samples += 1
+        return self.ram_mb
+
+    def _cpu(self):
+        return self.cpu_cores
+
+    def advance(self, seconds):
+        self.now += seconds
+        self.monotonic += seconds
+
+    def restart_process(self, monkeypatch):
+        monkeypatch.setattr(sampler, "_process_reading", None)
+
+
+@pytest.fixture
+def node(tmpdir, monkeypatch):
+    monkeypatch.setenv(PTH_NODE_CACHE_DIR_ENV_VAR, str(tmpdir))
+    return _FakeNode(monkeypatch)
+
+
+def test_readings_are_shared_by_processes_on_a_node(node, monkeypatch):
+    assert get_node_resources(smoothed=False) == dict(
+        unused_cpu_cores=4.0, unused_ram_mb=8000.0)
+    assert node.n_samples == 1
+
+    node.ram_mb = 1000
+    for _ in range(10):
+        node.restart_process(monkeypatch)
+        node.advance(0.05)
+        assert get_node_resources(smoothed=False)["unused_ram_mb"] == 8000
+    assert node.n_samples == 1
+
+    node.advance(1.0)
+    assert get_node_resources(smoothed=False)["unused_ram_mb"] == 1000
+    assert node.n_samples == 2
+
+
+def test_readings_are_reused_within_a_process(node, monkeypatch):
+    monkeypatch.setenv(PTH_NODE_CACHE_DIR_ENV_VAR, "")
+    for _ in range(100):
+        get_node_resources()
+    assert node.n_samples == 1
+    node.advance(2.0)
+    get_node_resources()
+    assert node.n_samples == 2
+
+
+def test_smoothing_damps_momentary_spikes(node):
+    assert get_node_resources()["unused_ram_mb"] == 8000
+    node.advance(1.0)
+    node.ram_mb = 0
+    raw = get_node_resources(smoothed=False)["unused_ram_mb"]
+    smoothed = get_node_resources()["unused_ram_mb"]
+    assert raw == 0
+    assert 5000 < smoothed < 8000
+
+    for _ in range(30):
+        node.advance(1.0)
+        get_node_resources()
+    assert get_node_resources()["unused_ram_mb"] < 100
+
+
+def test_stale_history_is_not_smoothed(node):
+    get_node_resources()
+    node.advance(3600)
+    node.ram_mb = 10
+    assert get_node_resources()["unused_ram_mb"] == 10
+
+
+def test_cpu_usage_without_load_average(node, monkeypatch):
+    monkeypatch.setattr(sampler, "_has_load_average", lambda: False)
+    ticks = iter([(10.0, 90.0), (60.0, 140.0)])
+
+    class FakeCpuTimes(tuple):
+        _fields = ("user", "idle")
+        idle = property(lambda self: self[1])
+
+    monkeypatch.setattr(sampler.psutil, "cpu_times"
+        , lambda: FakeCpuTimes(next(ticks)))
+    monkeypatch.setattr(sampler.psutil, "cpu_count", lambda logical: 4)
+
+    get_node_resources()  # No previous snapshot: falls back to the probe
+    node.advance(1.0)
+    assert get_node_resources(smoothed=False)["unused_cpu_cores"] == 2.0
+
+
+def test_invalid_argument():
+    with pytest.raises(TypeError):
+        get_node_resources(smoothed="yes")
+
+
+def test_unused_resource_getters_read_the_shared_readings(node):
+    assert get_unused_ram_mb() == 8000
+    assert get_unused_cpu_cores() == 4.0
+    node.ram_mb = 1000
+    assert get_unused_ram_mb() == 8000
+    assert node.n_samples == 1
@@ -0,0 +1,135 @@
+import math
+import time
+
+import pytest
+
+import pythagoras as pth
+from pythagoras import (GuardedCodePortal, SimpleRequirementFn
+    , installed_packages, unused_cpu, unused_ram, required_environment_variables)
+from pythagoras._210_basic_portals.portal_tester import _PortalTester
+from pythagoras._350_guarded_code_portals.guarded_decorators import guarded
+from pythagoras._350_guarded_code_portals.guarded_portal_core_classes import (
+    _requirement_outcomes, _clear_requirement_outcomes)
+
+
+def _counting_requirement():
+    import os
+    counter = os.environ.get("PYTHAGORAS_TEST_REQUIREMENT_CALLS", "")
+    os.environ["PYTHAGORAS_TEST_REQUIREMENT_CALLS"] = counter + "x"
+    if os.environ.get("PYTHAGORAS_TEST_REQUIREMENT_FAIL"):
+        return None
+    return pth.NO_OBJECTIONS
+
+
+def _calls() -> int:
+    import os
+    return len(os.environ.get("PYTHAGORAS_TEST_REQUIREMENT_CALLS", ""))
+
+
+def _requirement_with_arg(a):
+    return pth.NO_OBJECTIONS
+
+
+def _guarded_with(requirement):
+    @guarded(requirements=requirement)
+    def f(x):
+        return x * 2
+    return f
+
+
+@pytest.fixture(autouse=True)
+def _clean_environment(monkeypatch):
+    monkeypatch.delenv("PYTHAGORAS_TEST_REQUIREMENT_CALLS", raising=False)
+    monkeypatch.delenv("PYTHAGORAS_TEST_REQUIREMENT_FAIL", raising=False)
+    _clear_requirement_outcomes()
+    yield
+    _clear_requirement_outcomes()
+
+
+def test_no_caching_by_default(tmpdir):
+    with _PortalTester(GuardedCodePortal, tmpdir):
+        f = _guarded_with(SimpleRequirementFn(_counting_requirement))
+        for i in range(3):
+            assert f(x=i) == i * 2
+        assert _calls() == 3
+        assert len(_requirement_outcomes) == 0
+
+
+def test_success_is_reused_within_ttl(tmpdir):
+    with _PortalTester(GuardedCodePortal, tmpdir):
+        requirement = SimpleRequirementFn(
+            _counting_requirement, success_ttl=math.inf)
+        f = _guarded_with(requirement)
+        for i in range(3):
+            assert f(x=i) == i * 2
+        assert _calls() == 1
+        assert requirement.success_ttl == math.inf
+        assert requirement.failure_ttl == 0
+
+
+def test_failure_is_reused_and_expires(tmpdir, monkeypatch):
+    with _PortalTester(GuardedCodePortal, tmpdir):
+        f = _guarded_with(SimpleRequirementFn(
+            _counting_requirement, failure_ttl=0.2))
+        monkeypatch.setenv("PYTHAGORAS_TEST_REQUIREMENT_FAIL", "1")
+        for i in range(2):
+            with pytest.raises(Exception):
+                f(x=i)
+        assert _calls() == 1
+        monkeypatch.delenv("PYTHAGORAS_TEST_REQUIREMENT_FAIL")
+        with pytest.raises(Exception):
+            f(x=10)
+        time.sleep(0.3)
+        assert f(x=10) == 20
+        assert _calls() == 2
+
+
+def test_ttl_survives_fix_kwargs(tmpdir):
+    with _PortalTester(GuardedCodePortal, tmpdir):
+        requirement = SimpleRequirementFn(
+            _requirement_with_arg, success_ttl=5, failure_ttl=1)
+        fixed = requirement.fix_kwargs(a=1)
+        assert fixed.success_ttl == 5
+        assert fixed.failure_ttl == 1
+
+
+def test_portal_setting_overrides_declared_ttl(tmpdir):
+    with _PortalTester(GuardedCodePortal, tmpdir) as t:
+        f = _guarded_with(SimpleRequirementFn(
+            _counting_requirement, success_ttl=math.inf))
+        t.portal.global_portal_settings["requirement_success_ttl"] = 0
+        for i in range(3):
+            f(x=i)
+        assert _calls() == 3
+
+
+def test_factories_declare_ttls(tmpdir):
+    with _PortalTester(GuardedCodePortal, tmpdir):
+        [package] = installed_packages("pytest")
+        assert package.success_ttl == math.inf
+        assert package.failure_ttl == 0
+        for requirement in [unused_cpu(1), unused_ram(1)]:
+            assert 0 < requirement.success_ttl < 10
+            assert 0 < requirement.failure_ttl < 10
+        [variable] = required_environment_variables("HOME")
+        assert 0 < variable.success_ttl < 10
+        assert variable.failure_ttl == 0
+
+
+def test_portal_cleanup_forgets_outcomes(tmpdir):
+    with _PortalTester(GuardedCodePortal, tmpdir):
+        f = _guarded_with(SimpleRequirementFn(
+            _counting_requirement, success_ttl=math.inf))
+        f(x=1)
+        assert len(_requirement_outcomes) == 1
+    assert len(_requirement_outcomes) == 0
+
+
+@pytest.mark.parametrize("ttl, error", [
+    (-1, ValueError), (float("nan"), ValueError)
+    , ("1", TypeError), (True, TypeError)])
+def test_invalid_ttl(ttl, error):
+    with pytest.raises(error):
+        SimpleRequirementFn(_counting_requirement, success_ttl=ttl)
+    with pytest.raises(error):
+        SimpleRequirementFn(_counting_requirement, failure_ttl=ttl)
@@ -0,0 +1,68 @@
+import pytest
+
+from pythagoras import FunctionError
+from pythagoras._210_basic_portals.portal_tester import _PortalTester
+from pythagoras._360_pure_code_portals.pure_core_classes import PureCodePortal
+from pythagoras._360_pure_code_portals.pure_decorator import pure
+
+
+def batch_size_plus(x, y):
+    return [len(x) + a + b for a, b in zip(x, y)]
+
+
+def broken_batch(x):
+    return [0]
+
+
+def test_single_calls_are_unwrapped(tmpdir):
+    with _PortalTester(PureCodePortal, tmpdir):
+        fn = pure(batch=True)(batch_size_plus)
+        assert fn.batch
+        assert fn(x=1, y=2) == 4
+        assert fn.get_address(x=1, y=2).ready
+
+
+def test_batch_flag_is_part_of_identity(tmpdir):
+    with _PortalTester(PureCodePortal, tmpdir):
+        batch_fn = pure(batch=True)(batch_size_plus)
+        plain_fn = pure()(batch_size_plus)
+        assert not plain_fn.batch
+        assert batch_fn.hash_signature != plain_fn.hash_signature
+        assert pure()(batch_fn).batch
+        assert batch_fn.fix_kwargs(y=0).batch
+    with pytest.raises(TypeError):
+        pure(batch="yes")
+
+
+def test_pending_calls_are_executed_together(tmpdir):
+    with _PortalTester(PureCodePortal, tmpdir) as t:
+        fn = pure(batch=True)(batch_size_plus)
+        assert fn(x=0, y=0) == 1
+        results = fn.execute_each([dict(x=i, y=0) for i in range(5)])
+        assert results == [1, 5, 6, 7, 8]
+        assert len(t.portal._execution_requests) == 0
+        assert fn.execute_grid(dict(x=[1, 2], y=[10])) == [13, 14]
+
+        fixed = fn.fix_kwargs(y=100)
+        assert fixed.execute_each([dict(x=1), dict(x=2)]) == [103, 104]
+
+
+def test_wrong_number_of_results_fails(tmpdir):
+    with _PortalTester(PureCodePortal, tmpdir) as t:
+        fn = pure(batch=True)(broken_batch)
+        assert fn(x=7) == 0
+        with pytest.raises(FunctionError):
+            fn.execute_each([dict(x=1), dict(x=2)])
+        assert not fn.get_address(x=1).ready
+        assert len(t.portal._execution_requests) == 2
+
+
+def test_each_call_of_a_batch_is_logged_on_its_own(tmpdir):
+    with _PortalTester(PureCodePortal, tmpdir):
+        fn = pure(batch=True, verbose_logging=True)(batch_size_plus)
+        fixed = fn.fix_kwargs(y=100)
+        assert fixed.execute_each([dict(x=i) for i in range(3)]) == [103, 104, 105]
+        for i in range(3):
+            signature = fixed.get_signature(dict(x=i, y=100))
+            assert len(signature.execution_records) == 1
+            assert signature.last_execution_result.get() == 103 + i
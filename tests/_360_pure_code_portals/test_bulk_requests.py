@@ -0,0 +1,60 @@
+import pytest
+
+import pythagoras as pth
+from pythagoras._210_basic_portals.portal_tester import _PortalTester
+from pythagoras._360_pure_code_portals import storage_threads
+from pythagoras._360_pure_code_portals.pure_core_classes import PureCodePortal
+from pythagoras._360_pure_code_portals.pure_decorator import pure
+
+
+def inc(x):
+    return x + 1
+
+
+def test_ready_many_checks_and_imports_results(tmpdir, monkeypatch):
+    monkeypatch.setattr(storage_threads, "_STORAGE_BATCH_SIZE", 2)
+    with _PortalTester(PureCodePortal, tmpdir.mkdir("main")) as t:
+        fn = pure()(inc)
+        for i in range(0, 10, 2):
+            assert fn(x=i) == i + 1
+        other_portal = PureCodePortal(tmpdir.mkdir("other"))
+        with other_portal:
+            assert fn(x=5) == 6
+
+        addresses = [fn.get_address(x=i) for i in range(10)]
+        ready = t.portal.ready_many(addresses)
+        assert ready == [i % 2 == 0 or i == 5 for i in range(10)]
+        assert addresses[5] in t.portal._execution_results
+        assert fn.get_address(x=5).get() == 6
+
+        assert not pth.ready(addresses)
+        assert pth.ready(dict(a=addresses[:1], b=[addresses[2], 7]))
+
+        with pytest.raises(TypeError):
+            t.portal.ready_many([1, 2])
+
+
+def test_request_many_skips_results_and_keeps_priorities(tmpdir, monkeypatch):
+    monkeypatch.setattr(storage_threads, "_STORAGE_BATCH_SIZE", 2)
+    with _PortalTester(PureCodePortal, tmpdir) as t:
+        fn = pure()(inc)
+        addresses = [fn.get_address(x=i) for i in range(8)]
+        addresses[0].request_execution(priority=4)
+        addresses[1].request_execution(priority=4)
+        assert fn(x=0) == 1
+
+        t.portal.request_many(addresses)
+        assert not addresses[0].execution_requested
+        assert t.portal._execution_requests[addresses[1]] == 4
+        assert all(t.portal._execution_requests[a] == 0
+            for a in addresses[2:])
+
+        t.portal.request_many(addresses[1:3], priority=2)
+        assert t.portal._execution_requests[addresses[1]] == 2
+        assert t.portal._execution_requests[addresses[2]] == 2
+        assert len(t.portal._request_queue) == 7
+
+        with pytest.raises(TypeError):
+            t.portal.request_many(addresses, priority="high")
+        with pytest.raises(TypeError):
+            t.portal.request_many([dict(x=1)])
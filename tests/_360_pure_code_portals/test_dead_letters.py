@@ -0,0 +1,68 @@
+import pytest
+
+from pythagoras._210_basic_portals.portal_tester import _PortalTester
+from pythagoras._360_pure_code_portals.pure_core_classes import PureCodePortal
+from pythagoras._360_pure_code_portals.pure_decorator import pure
+
+
+def succeed(x):
+    return x
+
+
+def fail(x):
+    raise ValueError(f"bad {x}")
+
+
+def test_attempt_summary_is_dropped_after_success(tmpdir):
+    with _PortalTester(PureCodePortal, tmpdir) as t:
+        fn = pure()(succeed)
+        assert fn(x=1) == 1
+        assert len(t.portal._attempt_summaries) == 0
+
+
+def test_failed_attempts_are_counted_and_backed_off(tmpdir):
+    with _PortalTester(PureCodePortal, tmpdir) as t:
+        fn = pure()(fail)
+        address = fn.get_address(x=1)
+        assert address.needs_execution
+        with pytest.raises(ValueError):
+            fn(x=1)
+        assert t.portal._attempt_summaries[address]["count"] == 1
+        assert address.execution_requested
+        assert not address.needs_execution
+
+
+def test_exhausted_requests_are_dead_lettered_and_requeued(tmpdir):
+    with _PortalTester(PureCodePortal, tmpdir) as t:
+        t.portal.global_portal_settings["max_execution_attempts"] = 2
+        fn = pure()(fail)
+        address = fn.get_address(x=2)
+        for _ in range(3):
+            with pytest.raises(ValueError):
+                fn(x=2)
+
+        assert not address.needs_execution
+        assert address.execution_requested
+        assert len(t.portal.get_dead_letters()) == 0
+
+        assert address._dead_letter_if_exhausted(t.portal)
+        assert not address.execution_requested
+        dead_letters = t.portal.get_dead_letters()
+        assert len(dead_letters) == 1
+        assert dead_letters["address"][0] == address
+        assert dead_letters["fn_name"][0] == "fail"
+        assert dead_letters["attempts"][0] == 3
+
+        assert t.portal.requeue_dead_letters() == 1
+        assert len(t.portal.get_dead_letters()) == 0
+        assert address.execution_requested
+        assert address.needs_execution
+        assert t.portal.requeue_dead_letters([address]) == 0
+        assert not address._dead_letter_if_exhausted(t.portal)
+
+
+def test_invalid_max_execution_attempts(tmpdir):
+    with _PortalTester(PureCodePortal, tmpdir) as t:
+        t.portal.global_portal_settings["max_execution_attempts"] = -1
+        with pytest.raises(TypeError):
+            _ = t.portal.max_execution_attempts
@@ -0,0 +1,113 @@
+import gc
+import time
+import weakref
+
+from pythagoras._210_basic_portals.portal_tester import _PortalTester
+from pythagoras._310_ordinary_code_portals.ordinary_portal_core_classes import (
+    InvocationPlan)
+from pythagoras._350_guarded_code_portals.guarded_portal_core_classes import (
+    GuardedFn)
+from pythagoras._360_pure_code_portals.pure_core_classes import (
+    PureCodePortal, PureFn)
+from pythagoras._360_pure_code_portals.pure_decorator import pure
+from pythagoras import KwArgs, ValueAddr
+
+import pythagoras as pth
+
+
+_MAX_CALL_OVERHEAD_US = 200_000
+
+
+def do_nothing(x):
+    return x
+
+def add(x, y):
+    return x + y
+
+
+def _measure_overhead_us(fn, n_calls: int) -> float:
+    """Microbenchmark: average time of one call with new arguments."""
+    fn(x=-1)  # Build the invocation plan outside of the measured loop
+    start = time.perf_counter()
+    for i in range(n_calls):
+        fn(x=i)
+    return (time.perf_counter() - start) / n_calls * 1_000_000
+
+
+def test_plan_is_built_once_per_portal(tmpdir, monkeypatch):
+    n_builds = []
+    original = PureFn._build_invocation_plan
+    def counting_build(self, portal):
+        n_builds.append(portal)
+        return original(self, portal)
+    monkeypatch.setattr(PureFn, "_build_invocation_plan", counting_build)
+
+    with _PortalTester(PureCodePortal, tmpdir) as t:
+        fn = pure()(do_nothing)
+        for i in range(5):
+            assert fn(x=i) == i
+        assert n_builds == [t.portal]
+        plan = fn._get_invocation_plan(t.portal)
+        assert plan.portal is t.portal
+        assert plan.requirements == ()
+        assert plan.result_checks == ()
+
+        other_portal = PureCodePortal(tmpdir.mkdir("other"))
+        with other_portal:
+            assert fn(x=100) == 100
+        assert n_builds == [t.portal, other_portal]
+
+
+def test_plans_do_not_keep_portals_alive(tmpdir):
+    with _PortalTester(PureCodePortal, tmpdir) as t:
+        fn = pure()(do_nothing)
+        assert fn(x=1) == 1
+        assert isinstance(fn._invocation_plans, weakref.WeakKeyDictionary)
+        assert fn._get_invocation_plan(t.portal).portal is t.portal
+
+    class Portal:
+        pass
+    portal = Portal()
+    plan = InvocationPlan(portal)
+    plans = weakref.WeakKeyDictionary({portal: plan})
+    del portal
+    gc.collect()
+    assert plan.portal is None
+    assert len(plans) == 0
+
+
+def test_arguments_are_packed_once(tmpdir, monkeypatch):
+    with _PortalTester(PureCodePortal, tmpdir):
+        fn = pure(fixed_kwargs=dict(y=10))(add)
+        assert fn(x=0) == 10
+
+        n_packs = []
+        original = KwArgs.pack
+        def counting_pack(self, *args, **kwargs):
+            if not all(isinstance(v, ValueAddr) for v in self.values()):
+                n_packs.append(dict(self))
+            return original(self, *args, **kwargs)
+        monkeypatch.setattr(KwArgs, "pack", counting_pack)
+
+        assert fn(x=1) == 11
+        assert n_packs == [dict(x=1)]
+
+
+def test_functions_without_guards_skip_guard_checks(tmpdir, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("guards should not be checked")
+    monkeypatch.setattr(GuardedFn, "_check_requirements", fail)
+    monkeypatch.setattr(GuardedFn, "_check_result", fail)
+    with _PortalTester(PureCodePortal, tmpdir):
+        fn = pure()(do_nothing)
+        assert fn(x=7) == 7
+
+
+def test_no_op_call_overhead(tmpdir):
+    with _PortalTester(PureCodePortal, tmpdir):
+        autonomous_fn = pth.autonomous()(do_nothing)
+        pure_fn = pure()(do_nothing)
+        autonomous_us = _measure_overhead_us(autonomous_fn, 50)
+        pure_us = _measure_overhead_us(pure_fn, 50)
+        assert 0 < autonomous_us < _MAX_CALL_OVERHEAD_US
+        assert 0 < pure_us < _MAX_CALL_OVERHEAD_US
@@ -0,0 +1,86 @@
+import pytest
+
+from pythagoras._210_basic_portals.portal_tester import _PortalTester
+from pythagoras._360_pure_code_portals import lazy_grids
+from pythagoras._360_pure_code_portals.lazy_grids import (
+    AddressGrid, AddressList)
+from pythagoras._360_pure_code_portals.pure_core_classes import PureCodePortal
+from pythagoras._360_pure_code_portals.pure_decorator import pure
+from pythagoras._360_pure_code_portals import storage_threads
+from pythagoras._360_pure_code_portals.storage_threads import (
+    _map_storage_operation)
+
+
+def add(x, y):
+    return x + y
+
+
+def test_grid_addresses_match_individual_addresses(tmpdir):
+    with _PortalTester(PureCodePortal, tmpdir):
+        fn = pure()(add)
+        grid = AddressGrid(fn, dict(x=[1, 2, 3], y=[10, 20]))
+        assert grid.shape == (3, 2)
+        assert len(grid) == 6
+        expected = [fn.get_address(x=x, y=y)
+            for x in [1, 2, 3] for y in [10, 20]]
+        assert list(grid) == expected
+        assert [grid[i] for i in range(6)] == expected
+        assert grid[1:4] == expected[1:4]
+        assert grid[-1] == expected[-1]
+        assert grid[2, 0] == fn.get_address(x=3, y=10)
+        assert grid[-1, -2] == fn.get_address(x=3, y=10)
+        assert grid[1, 1].execute() == 22
+
+        with pytest.raises(IndexError):
+            _ = grid[6]
+        with pytest.raises(IndexError):
+            _ = grid[3, 0]
+        with pytest.raises(IndexError):
+            _ = grid[1, 1, 1]
+        with pytest.raises(TypeError):
+            _ = grid["1"]
+        with pytest.raises(TypeError):
+            AddressGrid(fn, [dict(x=1)])
+
+
+def test_swarm_grid_submits_in_chunks(tmpdir, monkeypatch):
+    monkeypatch.setattr(lazy_grids, "_SUBMISSION_CHUNK_SIZE", 7)
+    monkeypatch.setattr(storage_threads, "_STORAGE_BATCH_SIZE", 2)
+    with _PortalTester(PureCodePortal, tmpdir) as t:
+        fn = pure()(add)
+        assert fn(x=0, y=0) == 0
+        grid = fn.swarm_grid(dict(x=range(5), y=range(6)), priority=3)
+        assert isinstance(grid, AddressGrid)
+        requested = set(t.portal._execution_requests.keys())
+        assert len(requested) == 29
+        assert grid[0, 0] not in requested
+        assert all(t.portal._execution_requests[a] == 3
+            for a in grid[1:])
+        assert len(t.portal._request_queue) == 29
+
+
+def test_swarm_each_streams_argument_sets(tmpdir, monkeypatch):
+    monkeypatch.setattr(lazy_grids, "_SUBMISSION_CHUNK_SIZE", 4)
+    with _PortalTester(PureCodePortal, tmpdir):
+        fn = pure()(add)
+        addresses = fn.swarm_each(dict(x=i, y=1) for i in range(10))
+        assert isinstance(addresses, AddressList)
+        expected = [fn.get_address(x=i, y=1) for i in range(10)]
+        assert list(addresses) == expected
+        assert addresses[3] == expected[3]
+        assert addresses[-2:] == expected[-2:]
+        assert addresses[4].fn is fn
+        assert addresses[4].execute() == 5
+        assert all(a.execution_requested for a in addresses[5:])
+
+        with pytest.raises(TypeError):
+            fn.swarm_each(dict(x=1, y=1))
+        with pytest.raises(TypeError):
+            fn.swarm_each([dict(x=1, y=1), "x=2"])
+
+
+def test_storage_operations_keep_order(monkeypatch):
+    monkeypatch.setattr(storage_threads, "_STORAGE_BATCH_SIZE", 3)
+    assert _map_storage_operation(lambda i: i * i, range(20)) == [
+        i * i for i in range(20)]
+    assert _map_storage_operation(str, []) == []
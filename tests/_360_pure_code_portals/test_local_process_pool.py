@@ -0,0 +1,54 @@
+import pytest
+
+from pythagoras._210_basic_portals.portal_tester import _PortalTester
+from pythagoras._360_pure_code_portals import local_process_pool
+from pythagoras._360_pure_code_portals.pure_core_classes import PureCodePortal
+from pythagoras._360_pure_code_portals.pure_decorator import pure
+
+
+def cube(x):
+    return x ** 3
+
+
+def chunk_size(x):
+    return [len(x)] * len(x)
+
+
+def test_misses_are_executed_in_local_processes(tmpdir):
+    with _PortalTester(PureCodePortal, tmpdir) as t:
+        fn = pure()(cube)
+        assert fn.execute_each([dict(x=i) for i in range(10)], n_jobs=2) == [
+            i ** 3 for i in range(10)]
+        assert len(t.portal._execution_requests) == 0
+        assert fn.execute_grid(dict(x=[2, 20]), n_jobs=-1) == [8, 8000]
+
+
+def test_cache_hits_are_not_dispatched(tmpdir, monkeypatch):
+    with _PortalTester(PureCodePortal, tmpdir):
+        fn = pure()(cube)
+        fn.execute_each([dict(x=i) for i in range(4)])
+
+        def fail(*args, **kwargs):
+            raise AssertionError("A process pool was started")
+
+        monkeypatch.setattr(local_process_pool, "ProcessPoolExecutor", fail)
+        assert fn.execute_each([dict(x=i) for i in range(4)], n_jobs=4) == [
+            0, 1, 8, 27]
+        assert [a.get() for a in fn.run_each(
+            [dict(x=3), dict(x=5)], n_jobs=2)] == [27, 125]
+
+
+def test_batch_functions_get_one_chunk_per_process(tmpdir):
+    with _PortalTester(PureCodePortal, tmpdir):
+        fn = pure(batch=True)(chunk_size)
+        assert fn.execute_each([dict(x=i) for i in range(10)], n_jobs=2) == [
+            5] * 10
+
+
+def test_invalid_n_jobs(tmpdir):
+    with _PortalTester(PureCodePortal, tmpdir):
+        fn = pure()(cube)
+        with pytest.raises(TypeError):
+            fn.execute_each([dict(x=1)], n_jobs=2.0)
+        with pytest.raises(ValueError):
+            fn.execute_each([dict(x=1)], n_jobs=0)
@@ -0,0 +1,69 @@
+import threading
+
+from pythagoras._210_basic_portals.basic_portal_accessors import (
+    measure_active_portals_stack)
+from pythagoras._210_basic_portals.basic_portal_core_classes import (
+    _PortalStack)
+from pythagoras._210_basic_portals.portal_tester import _PortalTester
+from pythagoras._360_pure_code_portals.pure_core_classes import PureCodePortal
+from pythagoras._360_pure_code_portals.pure_decorator import pure
+
+
+def do_nothing(x):
+    return x
+
+
+def _count_portal_operations(monkeypatch) -> dict[str, int]:
+    """Benchmark helper: count portal stack operations by kind."""
+    counts = dict(push=0, pop=0, reenter=0, leave_reentered=0)
+
+    def counting(name):
+        original = getattr(_PortalStack, name)
+        def wrapper(self, portal):
+            result = original(self, portal)
+            if result is not False:
+                counts[name] += 1
+            return result
+        monkeypatch.setattr(_PortalStack, name, wrapper)
+
+    for name in counts:
+        counting(name)
+    return counts
+
+
+def test_portal_operations_per_pure_call(tmpdir, monkeypatch):
+    with _PortalTester(PureCodePortal, tmpdir):
+        fn = pure()(do_nothing)
+        fn(x=-1)
+        counts = _count_portal_operations(monkeypatch)
+        n_calls = 20
+        for i in range(n_calls):
+            fn(x=i)
+        for i in range(n_calls):
+            fn(x=i)
+
+        # The portal is already current, so every enter is a cheap re-entry.
+        assert counts["push"] == 0
+        assert counts["pop"] == 0
+        assert counts["reenter"] == counts["leave_reentered"] > 0
+
+
+def test_reentry_from_another_thread_is_rejected(tmpdir):
+    with _PortalTester(PureCodePortal, tmpdir) as t:
+        errors = []
+
+        def enter_portal():
+            try:
+                with t.portal:
+                    errors.append("entered")
+            except RuntimeError as e:
+                errors.append(e)
+
+        with t.portal:
+            depth = measure_active_portals_stack()
+            thread = threading.Thread(target=enter_portal)
+            thread.start()
+            thread.join()
+            assert measure_active_portals_stack() == depth
+        assert len(errors) == 1
+        assert isinstance(errors[0], RuntimeError)
@@ -0,0 +1,53 @@
+import pytest
+
+from pythagoras._210_basic_portals.portal_tester import _PortalTester
+from pythagoras._360_pure_code_portals.pure_core_classes import PureCodePortal
+from pythagoras._360_pure_code_portals.pure_decorator import pure
+
+
+def inc(x):
+    return x + 1
+
+
+def _queue_keys(portal):
+    return [key[:2] for key in portal._request_queue.keys()]
+
+
+def test_priority_is_persisted_with_requests(tmpdir):
+    with _PortalTester(PureCodePortal, tmpdir) as t:
+        fn = pure()(inc)
+        [low] = fn.swarm_each([dict(x=1)])
+        high = fn.swarm_grid(dict(x=[2, 3]), priority=5)
+        assert t.portal._execution_requests[low] == 0
+        assert all(t.portal._execution_requests[a] == 5 for a in high)
+        assert sorted(_queue_keys(t.portal)) == sorted(
+            [("priority_0", fn.hash_signature)]
+            + 2 * [("priority_5", fn.hash_signature)])
+        assert {record["priority"]
+            for record in t.portal._request_partitions.values()} == {0, 5}
+
+        fn.swarm(x=2)
+        assert t.portal._execution_requests[high[0]] == 5
+
+        low.request_execution(priority=7)
+        assert t.portal._execution_requests[low] == 7
+        assert ("priority_0", fn.hash_signature) not in _queue_keys(t.portal)
+
+
+def test_executed_requests_leave_the_index(tmpdir):
+    with _PortalTester(PureCodePortal, tmpdir) as t:
+        fn = pure()(inc)
+        addresses = fn.swarm_each([dict(x=i) for i in range(3)], priority=2)
+        for address in addresses:
+            address.execute()
+        assert len(t.portal._execution_requests) == 0
+        assert len(t.portal._request_queue) == 0
+
+
+def test_invalid_priority(tmpdir):
+    with _PortalTester(PureCodePortal, tmpdir):
+        fn = pure()(inc)
+        with pytest.raises(TypeError):
+            fn.swarm_each([dict(x=1)], priority=1.5)
+        with pytest.raises(TypeError):
+            fn.get_address(x=1).request_execution(priority=True)
@@ -0,0 +1,49 @@
+from persidict import FileDirDict
+
+from pythagoras._210_basic_portals.portal_tester import _PortalTester
+from pythagoras._360_pure_code_portals import pure_core_classes as core
+from pythagoras._360_pure_code_portals.pure_core_classes import PureCodePortal
+from pythagoras._360_pure_code_portals.pure_decorator import pure
+
+
+def square(x):
+    return x * x
+
+
+def test_requests_are_sharded_by_hash(tmpdir):
+    with _PortalTester(PureCodePortal, tmpdir) as t:
+        fn = pure()(square)
+        address = fn.swarm(x=3)
+        [key] = list(t.portal._request_queue.keys())
+        assert key[2] == address.hash_signature[-2:]
+        assert tuple(key[3:]) == tuple(address.strings)
+        assert t.portal._estimate_queue_size() == 1
+
+
+def test_large_partitions_are_estimated_from_shards(tmpdir, monkeypatch):
+    monkeypatch.setattr(core, "_QUEUE_SHARD_ALPHABET", "01")
+    monkeypatch.setattr(core, "_N_QUEUE_SHARDS", 4)
+    monkeypatch.setattr(core, "_EXACT_QUEUE_COUNT_LIMIT", 10)
+    partition = FileDirDict(base_dir=str(tmpdir))
+    for shard in ("00", "01", "10", "11"):
+        for i in range(25):
+            partition[(shard, f"request_{i}")] = True
+
+    listed = []
+    original_keys = FileDirDict.keys
+
+    def counting_keys(self):
+        for key in original_keys(self):
+            listed.append(key)
+            yield key
+
+    monkeypatch.setattr(FileDirDict, "keys", counting_keys)
+    assert core._estimate_partition_size(partition) == 100
+    assert len(listed) <= core._EXACT_QUEUE_COUNT_LIMIT + 1
+
+
+def test_small_partitions_are_counted_exactly(tmpdir):
+    partition = FileDirDict(base_dir=str(tmpdir))
+    for i in range(7):
+        partition[("ab", f"request_{i}")] = True
+    assert core._estimate_partition_size(partition) == 7
@@ -0,0 +1,63 @@
+from pythagoras._210_basic_portals.portal_tester import _PortalTester
+from pythagoras._360_pure_code_portals.pure_decorator import pure
+from pythagoras._410_swarming_portals import batch_execution
+from pythagoras._410_swarming_portals.batch_execution import (
+    _MAX_BATCH_SIZE, _execute_batch, _get_average_duration, _get_batch_size,
+    _record_execution_durations)
+from pythagoras._410_swarming_portals.swarming_portals import SwarmingPortal
+
+
+def tiny(x):
+    return x + 1
+
+
+def test_batch_size_follows_observed_durations():
+    assert _get_batch_size(None) == 1
+    assert _get_batch_size(0.0) == _MAX_BATCH_SIZE
+    assert _get_batch_size(1e-4) == _MAX_BATCH_SIZE
+    assert _get_batch_size(0.5) == 4
+    assert _get_batch_size(60) == 1
+
+
+def test_durations_are_averaged(tmpdir):
+    with _PortalTester(SwarmingPortal, tmpdir, max_n_workers=0) as t:
+        fn = pure()(tiny)
+        assert _get_average_duration(t.portal, fn) is None
+        _record_execution_durations(t.portal, fn, [1.0, 3.0])
+        assert _get_average_duration(t.portal, fn) == 2.0
+        _record_execution_durations(t.portal, fn, [4.0])
+        assert 2.0 < _get_average_duration(t.portal, fn) < 4.0
+
+
+def test_short_requests_are_executed_in_one_batch(tmpdir):
+    with _PortalTester(SwarmingPortal, tmpdir, max_n_workers=0) as t:
+        fn = pure()(tiny)
+        addresses = fn.swarm_each([dict(x=i) for i in range(10)])
+        _record_execution_durations(t.portal, fn, [0.001])
+        _execute_batch(t.portal, addresses[0])
+        assert all(a.ready for a in addresses)
+        assert len(t.portal._execution_requests) == 0
+
+
+def test_batch_stops_after_time_slice(tmpdir, monkeypatch):
+    monkeypatch.setattr(batch_execution, "_TARGET_TIME_SLICE_SECONDS", 0.0)
+    with _PortalTester(SwarmingPortal, tmpdir, max_n_workers=0) as t:
+        fn = pure()(tiny)
+        addresses = fn.swarm_each([dict(x=i) for i in range(10)])
+        _record_execution_durations(t.portal, fn, [0.0])
+        _execute_batch(t.portal, addresses[0])
+        assert sum(a.ready for a in addresses) == 1
+
+
+def batch_tiny(x):
+    return [len(x)] * len(x)
+
+
+def test_requests_of_batch_functions_are_vectorized(tmpdir):
+    with _PortalTester(SwarmingPortal, tmpdir, max_n_workers=0) as t:
+        fn = pure(batch=True)(batch_tiny)
+        addresses = fn.swarm_each([dict(x=i) for i in range(10)])
+        _execute_batch(t.portal, addresses[0])
+        assert [a.get() for a in addresses] == [10] * 10
+        assert len(t.portal._execution_requests) == 0
+        assert _get_average_duration(t.portal, fn) is not None
@@ -0,0 +1,112 @@
+import time
+
+import pytest
+
+from pythagoras._110_supporting_utilities import get_node_signature
+from pythagoras._210_basic_portals.portal_tester import _PortalTester
+from pythagoras._360_pure_code_portals.pure_decorator import pure
+from pythagoras._410_swarming_portals import concurrency_leases as leases_module
+from pythagoras._410_swarming_portals.concurrency_leases import (
+    _concurrency_lease, _get_node_leases, _get_portal_leases)
+from pythagoras._410_swarming_portals.swarming_portals import (
+    SwarmingPortal, _execute_within_limits)
+
+
+def limited(x):
+    return x * 2
+
+
+def unlimited(x):
+    return x * 3
+
+
+def test_limits_are_stored_and_inherited(tmpdir):
+    with _PortalTester(SwarmingPortal, tmpdir, max_n_workers=0):
+        fn = pure(max_concurrency=2, max_portal_concurrency=5)(limited)
+        assert fn.max_concurrency == 2
+        assert fn.max_portal_concurrency == 5
+        fixed = fn.fix_kwargs(x=1)
+        assert fixed.max_concurrency == 2
+        assert fixed.max_portal_concurrency == 5
+        assert pure()(limited).max_concurrency == 2
+        assert pure()(unlimited).max_concurrency is None
+
+
+def test_limits_do_not_change_identity(tmpdir):
+    with _PortalTester(SwarmingPortal, tmpdir, max_n_workers=0):
+        assert (pure(max_concurrency=1)(limited).hash_signature
+            == pure()(limited).hash_signature)
+
+
+def test_invalid_limits():
+    with pytest.raises(TypeError):
+        pure(max_concurrency=1.5)
+    with pytest.raises(TypeError):
+        pure(max_portal_concurrency=True)
+    with pytest.raises(ValueError):
+        pure(max_concurrency=0)
+
+
+def test_node_limit_blocks_extra_executions(tmpdir):
+    with _PortalTester(SwarmingPortal, tmpdir, max_n_workers=0) as t:
+        fn = pure(max_concurrency=1)(limited)
+        address = fn.get_address(x=1)
+        with _concurrency_lease(t.portal, fn) as first:
+            assert first
+            with _concurrency_lease(t.portal, fn) as second:
+                assert not second
+            assert not _execute_within_limits(
+                t.portal, address, address.execute)
+        assert len(_get_node_leases(t.portal, fn)) == 0
+        assert _execute_within_limits(t.portal, address, address.execute)
+        assert address.ready
+
+
+def test_dead_leases_are_dropped(tmpdir):
+    with _PortalTester(SwarmingPortal, tmpdir, max_n_workers=0) as t:
+        fn = pure(max_concurrency=1)(limited)
+        leases = _get_node_leases(t.portal, fn)
+        leases["dead"] = dict(node=get_node_signature(), pid=2**22 + 7
+            , process_start_time=1, expires_at=time.time() + 3600)
+        with _concurrency_lease(t.portal, fn) as acquired:
+            assert acquired
+        assert "dead" not in leases
+
+
+def test_portal_leases_of_other_nodes_expire(tmpdir, monkeypatch):
+    monkeypatch.setattr(leases_module, "_PORTAL_LEASE_TTL_SECONDS", 0.2)
+    with _PortalTester(SwarmingPortal, tmpdir, max_n_workers=0) as t:
+        fn = pure(max_portal_concurrency=1)(limited)
+        leases = _get_portal_leases(t.portal, fn)
+        leases["remote"] = dict(node="another_node", pid=1
+            , process_start_time=1, expires_at=time.time() + 3600)
+        with _concurrency_lease(t.portal, fn) as acquired:
+            assert not acquired
+        leases["remote"] = dict(leases["remote"], expires_at=time.time() - 1)
+        with _concurrency_lease(t.portal, fn) as acquired:
+            assert acquired
+            [own_key] = list(leases.keys())
+            first_expiry = leases[own_key]["expires_at"]
+            time.sleep(0.5)
+            assert leases[own_key]["expires_at"] > first_expiry
+        assert len(leases) == 0
+
+
+def test_renewal_stops_before_portal_lease_is_released(tmpdir, monkeypatch):
+    monkeypatch.setattr(leases_module, "_PORTAL_LEASE_TTL_SECONDS", 0.03)
+    renewed = []
+    original_make_lease = leases_module._make_lease
+    def slow_make_lease():
+        if renewed:
+            time.sleep(0.05)  # Keep a renewal in flight during release
+        renewed.append(True)
+        return original_make_lease()
+    monkeypatch.setattr(leases_module, "_make_lease", slow_make_lease)
+    with _PortalTester(SwarmingPortal, tmpdir, max_n_workers=0) as t:
+        fn = pure(max_portal_concurrency=1)(limited)
+        leases = _get_portal_leases(t.portal, fn)
+        with _concurrency_lease(t.portal, fn) as acquired:
+            assert acquired
+            time.sleep(0.02)
+        time.sleep(0.2)
+        assert len(leases) == 0
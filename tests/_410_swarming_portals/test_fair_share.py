@@ -0,0 +1,74 @@
+from collections import Counter
+
+from pythagoras._210_basic_portals.portal_tester import _PortalTester
+from pythagoras._360_pure_code_portals.pure_decorator import pure
+from pythagoras._410_swarming_portals import fair_share
+from pythagoras._410_swarming_portals.resource_scheduler import (
+    _pick_execution_request)
+from pythagoras._410_swarming_portals.swarming_portals import SwarmingPortal
+
+
+def bulk(x):
+    return x
+
+
+def interactive(x):
+    return -x
+
+
+def _first_partition_counts(portal, n_draws=300):
+    counts = Counter()
+    for _ in range(n_draws):
+        partition, _ = next(fair_share._iter_request_partitions(portal))
+        counts[partition] += 1
+    return counts
+
+
+def test_higher_priority_is_favored_without_starving_others(tmpdir):
+    with _PortalTester(SwarmingPortal, tmpdir, max_n_workers=0) as t:
+        bulk_fn = pure()(bulk)
+        urgent_fn = pure()(interactive)
+        bulk_fn.swarm_each([dict(x=i) for i in range(30)])
+        urgent_fn.swarm_each([dict(x=1)], priority=1)
+
+        counts = _first_partition_counts(t.portal)
+        urgent = counts[("priority_1", urgent_fn.hash_signature)]
+        assert 0.65 * 300 < urgent < 0.95 * 300
+        assert counts[("priority_0", bulk_fn.hash_signature)] > 0
+
+
+def test_functions_share_a_priority_level_fairly(tmpdir):
+    with _PortalTester(SwarmingPortal, tmpdir, max_n_workers=0) as t:
+        bulk_fn = pure()(bulk)
+        other_fn = pure()(interactive)
+        bulk_fn.swarm_each([dict(x=i) for i in range(30)])
+        other_fn.swarm(x=1)
+
+        counts = _first_partition_counts(t.portal)
+        assert 0.3 * 300 < counts[("priority_0", other_fn.hash_signature)] < 0.7 * 300
+
+
+def test_stale_entries_are_cleaned_up(tmpdir, monkeypatch):
+    with _PortalTester(SwarmingPortal, tmpdir, max_n_workers=0) as t:
+        fn = pure()(bulk)
+        address = fn.swarm(x=1)
+        t.portal._execution_requests.delete_if_exists(address)
+        assert _pick_execution_request(t.portal) is None
+        assert len(t.portal._request_queue) == 0
+
+        monkeypatch.setattr(fair_share, "_REQUEST_PARTITION_TTL_SECONDS", -1)
+        assert list(fair_share._iter_request_partitions(t.portal)) == []
+        assert len(t.portal._request_partitions) == 0
+
+
+def test_requests_without_queue_entries_are_indexed(tmpdir):
+    with _PortalTester(SwarmingPortal, tmpdir, max_n_workers=0) as t:
+        fn = pure()(bulk)
+        address = fn.get_address(x=1)
+        t.portal._execution_requests[address] = True
+        assert len(t.portal._request_queue) == 0
+
+        picked, _ = _pick_execution_request(t.portal)
+        assert picked == address
+        assert len(t.portal._request_queue) == 1
+        assert t.portal._execution_requests[address] == 0
@@ -0,0 +1,20 @@
+import mixinforge
+
+from pythagoras._210_basic_portals.portal_tester import _PortalTester
+from pythagoras._360_pure_code_portals.pure_decorator import pure
+from pythagoras._410_swarming_portals.swarming_portals import SwarmingPortal
+
+
+def square(x):
+    return x * x
+
+
+def test_pool_processes_do_not_launch_workers(tmpdir):
+    with _PortalTester(SwarmingPortal, tmpdir, max_n_workers=0) as t:
+        pool_portal = mixinforge.loadjs(t.portal._get_local_pool_jsparams())
+        assert not pool_portal.is_ancestor
+        assert pool_portal.ancestor_runtime_is_live()
+
+        fn = pure()(square)
+        assert fn.execute_each([dict(x=i) for i in range(4)], n_jobs=2) == [
+            0, 1, 4, 9]
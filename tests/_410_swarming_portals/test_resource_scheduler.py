@@ -0,0 +1,111 @@
+from pythagoras import unused_cpu, unused_ram, get_resource_demand
+from pythagoras._210_basic_portals.portal_tester import _PortalTester
+from pythagoras._360_pure_code_portals.pure_decorator import pure
+from pythagoras._410_swarming_portals import resource_scheduler as scheduler
+from pythagoras._410_swarming_portals.swarming_portals import SwarmingPortal
+
+
+def small(x):
+    return x
+
+
+def big(x):
+    return -x
+
+
+def _set_node(monkeypatch, cpu_cores, ram_mb):
+    capacity = dict(cpu_cores=8.0, ram_mb=64 * 1024.0)
+    monkeypatch.setattr(scheduler, "_get_node_capacity", lambda: capacity)
+    monkeypatch.setattr(scheduler, "get_node_resources", lambda smoothed: dict(
+        unused_cpu_cores=cpu_cores, unused_ram_mb=ram_mb))
+
+
+def test_resource_demand_is_read_from_requirements(tmpdir):
+    with _PortalTester(SwarmingPortal, tmpdir, max_n_workers=0):
+        fn = pure(requirements=[unused_cpu(2), unused_ram(Gb=32)])(big)
+        assert get_resource_demand(fn) == dict(cpu_cores=2.0, ram_mb=32768.0)
+        assert get_resource_demand(pure()(small)) == dict(
+            cpu_cores=0.0, ram_mb=0.0)
+
+
+def test_largest_fitting_request_is_picked(tmpdir, monkeypatch):
+    with _PortalTester(SwarmingPortal, tmpdir, max_n_workers=0) as t:
+        small_fn = pure(requirements=unused_ram(Gb=1))(small)
+        big_fn = pure(requirements=unused_ram(Gb=32))(big)
+        for i in range(5):
+            small_fn.swarm(x=i)
+        big_address = big_fn.swarm(x=1)
+
+        _set_node(monkeypatch, cpu_cores=8.0, ram_mb=60 * 1024.0)
+        address, demand = scheduler._pick_execution_request(t.portal)
+        assert address == big_address
+        assert demand["ram_mb"] == 32 * 1024
+
+        _set_node(monkeypatch, cpu_cores=8.0, ram_mb=8 * 1024.0)
+        address, demand = scheduler._pick_execution_request(t.portal)
+        assert address.fn == small_fn
+
+        _set_node(monkeypatch, cpu_cores=8.0, ram_mb=512.0)
+        assert scheduler._pick_execution_request(t.portal) is None
+
+
+def test_reservations_reduce_available_resources(tmpdir, monkeypatch):
+    with _PortalTester(SwarmingPortal, tmpdir, max_n_workers=0) as t:
+        big_fn = pure(requirements=unused_ram(Gb=40))(big)
+        big_fn.swarm(x=1)
+        _set_node(monkeypatch, cpu_cores=8.0, ram_mb=60 * 1024.0)
+
+        with scheduler._resource_reservation(t.portal, big_fn):
+            reserved = scheduler._get_reserved_resources(t.portal)
+            assert reserved == dict(cpu_cores=0.0, ram_mb=40 * 1024.0)
+            assert scheduler._pick_execution_request(t.portal) is None
+        assert scheduler._get_reserved_resources(t.portal)["ram_mb"] == 0
+        assert scheduler._pick_execution_request(t.portal) is not None
+
+
+def test_reservations_of_dead_processes_are_dropped(tmpdir):
+    with _PortalTester(SwarmingPortal, tmpdir, max_n_workers=0) as t:
+        reservations = scheduler._get_reservations(t.portal)
+        reservations["dead"] = dict(cpu_cores=1.0, ram_mb=1024.0
+            , pid=-1, process_start_time=123)
+        assert scheduler._get_reserved_resources(t.portal) == dict(
+            cpu_cores=0.0, ram_mb=0.0)
+        assert "dead" not in reservations
+
+
+def test_sample_keys():
+    keys = scheduler._sample_keys(_FakeDict(range(100)), 8)
+    assert len(keys) == len(set(keys)) == 8
+    assert scheduler._sample_keys(_FakeDict(range(3)), 8).__len__() == 3
+
+
+class _FakeDict:
+    def __init__(self, keys):
+        self._keys = list(keys)
+
+    def keys(self):
+        return iter(self._keys)
+
+
+def test_queued_requests_are_sampled_from_shards(tmpdir):
+    with _PortalTester(SwarmingPortal, tmpdir, max_n_workers=0) as t:
+        fn = pure()(small)
+        requested = set(fn.swarm_each([dict(x=i) for i in range(40)]))
+        [partition] = [tuple(p) for p in t.portal._request_partitions.keys()]
+        for _ in range(5):
+            sample = scheduler._sample_queued_requests(t.portal, partition, 2)
+            assert 1 <= len(sample) <= 2
+            assert set(sample) <= requested
+
+
+def test_exhausted_requests_are_dead_lettered_when_picked(tmpdir):
+    with _PortalTester(SwarmingPortal, tmpdir, max_n_workers=0) as t:
+        t.portal.global_portal_settings["max_execution_attempts"] = 0
+        address = pure()(small).swarm(x=1)
+        address._register_execution_attempt(t.portal)
+        address._register_execution_stop(t.portal)
+        assert address.execution_requested
+
+        assert scheduler._pick_execution_request(t.portal) is None
+        assert not address.execution_requested
+        assert len(t.portal.get_dead_letters()) == 1
@@ -0,0 +1,85 @@
+import os
+import time
+from multiprocessing import get_context
+
+import pytest
+
+from pythagoras import ExecutionLimitExceeded
+from pythagoras._210_basic_portals.portal_tester import _PortalTester
+from pythagoras._360_pure_code_portals.pure_decorator import pure
+from pythagoras._410_swarming_portals.swarming_portals import (
+    SwarmingPortal, _supervise_task)
+from pythagoras._410_swarming_portals.task_watchdog import (
+    _find_limit_violation, _report_task)
+
+
+def slow(x):
+    return x
+
+
+def test_limits_are_stored_and_validated(tmpdir):
+    with _PortalTester(SwarmingPortal, tmpdir, max_n_workers=0) as t:
+        fn = pure(max_wall_time=2.5, max_rss_mb=512)(slow)
+        assert fn.max_wall_time == 2.5
+        assert fn.max_rss_mb == 512
+        assert fn.fix_kwargs(x=1).max_wall_time == 2.5
+
+        t.portal.global_portal_settings["max_wall_time"] = 7
+        assert fn.max_wall_time == 7
+
+    with pytest.raises(TypeError):
+        pure(max_wall_time="1 hour")
+    with pytest.raises(ValueError):
+        pure(max_rss_mb=0)
+    with pytest.raises(ValueError):
+        pure(max_wall_time=float("nan"))
+
+
+def test_only_limited_tasks_are_reported(tmpdir):
+    with _PortalTester(SwarmingPortal, tmpdir, max_n_workers=0):
+        receiver, sender = get_context("spawn").Pipe(duplex=False)
+        plain = pure()(slow)
+        _report_task(sender, plain.get_address(x=1), plain)
+        assert not receiver.poll()
+
+        limited = pure(max_rss_mb=100)(slow)
+        address = limited.get_address(x=2)
+        _report_task(sender, address, limited)
+        task = receiver.recv()
+        assert task["address"] == address
+        assert task["max_rss_mb"] == 100
+        assert task["max_wall_time"] is None
+
+
+def test_limit_violations_are_detected():
+    task = dict(reported_at=time.time() - 5
+        , max_wall_time=1, max_rss_mb=None)
+    assert "max_wall_time" in _find_limit_violation(task, os.getpid())
+    task = dict(reported_at=time.time(), max_wall_time=60, max_rss_mb=1)
+    assert "max_rss_mb" in _find_limit_violation(task, os.getpid())
+    task = dict(reported_at=time.time(), max_wall_time=60, max_rss_mb=10**7)
+    assert _find_limit_violation(task, os.getpid()) is None
+
+
+def test_runaway_execution_is_killed_and_recorded(tmpdir):
+    with _PortalTester(SwarmingPortal, tmpdir, max_n_workers=0) as t:
+        fn = pure(max_wall_time=1)(slow)
+        address = fn.get_address(x=3)
+
+        ctx = get_context("spawn")
+        receiver, sender = ctx.Pipe(duplex=False)
+        process = ctx.Process(target=time.sleep, args=(60,))
+        process.start()
+        sender.send(dict(address=address, reported_at=time.time() - 2
+            , max_wall_time=1, max_rss_mb=None))
+
+        started = time.monotonic()
+        _supervise_task(t.portal, process, receiver)
+        assert time.monotonic() - started < 30
+        assert not process.is_alive()
+
+        call_signature = address.call_signature
+        [crash] = list(call_signature.crashes.values())
+        assert crash["exc_type"] is ExecutionLimitExceeded
+        assert "max_wall_time" in str(crash["exc_value"])
+        assert len(t.portal._crash_history) == 1
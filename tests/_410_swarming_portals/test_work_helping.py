@@ -0,0 +1,121 @@
+import os
+import time
+
+import pytest
+
+from pythagoras._110_supporting_utilities import get_node_signature
+from pythagoras._210_basic_portals.portal_tester import _PortalTester
+from pythagoras._360_pure_code_portals import pure_core_classes as core
+from pythagoras._360_pure_code_portals.pure_decorator import pure
+from pythagoras._410_swarming_portals import swarming_portals
+from pythagoras._410_swarming_portals.swarming_portals import SwarmingPortal
+
+
+def double(x):
+    return 2 * x
+
+
+def fail(x):
+    raise ValueError(f"bad {x}")
+
+
+def chatty(x):
+    print(f"helping with {x}")
+    return x
+
+
+def _running_summary(pid, start_time, node=None):
+    return dict(count=1, last_attempt_at=time.time() - 3600, running=True
+        , node=node or get_node_signature(), pid=pid
+        , process_start_time=start_time)
+
+
+def test_get_executes_awaited_request_inline(tmpdir, monkeypatch):
+    monkeypatch.setattr(core, "_WORK_HELPING_GRACE_PERIOD_SECONDS", 0.0)
+    with _PortalTester(SwarmingPortal, tmpdir, max_n_workers=0) as t:
+        t.portal.global_portal_settings["work_helping"] = True
+        address = pure()(double).swarm(x=21)
+        started = time.monotonic()
+        assert address.get(timeout=30) == 42
+        assert time.monotonic() - started < 10
+        assert len(t.portal._execution_requests) == 0
+
+
+def test_work_helping_is_opt_in(tmpdir):
+    with _PortalTester(SwarmingPortal, tmpdir, max_n_workers=0) as t:
+        assert not t.portal.work_helping
+        address = pure()(double).swarm(x=1)
+        with pytest.raises(TimeoutError):
+            address.get(timeout=1)
+        t.portal.global_portal_settings["work_helping"] = "yes"
+        with pytest.raises(TypeError):
+            _ = t.portal.work_helping
+
+
+def test_in_progress_requests_are_not_duplicated(tmpdir):
+    with _PortalTester(SwarmingPortal, tmpdir, max_n_workers=0) as t:
+        fn = pure()(double)
+        awaited = fn.swarm(x=1)
+        other = fn.swarm(x=2)
+        own_start_time = core._get_process_start_time(os.getpid())
+        t.portal._attempt_summaries[awaited] = _running_summary(
+            os.getpid(), own_start_time)
+        assert awaited._execution_in_progress(t.portal)
+        assert not awaited.needs_execution
+
+        assert awaited._help_while_waiting(t.portal)
+        assert other.ready
+        assert not awaited.ready
+
+        t.portal._attempt_summaries[awaited] = _running_summary(
+            os.getpid(), own_start_time - 100)
+        assert not awaited._execution_in_progress(t.portal)
+        assert awaited.needs_execution
+
+
+def test_remote_leases_last_for_the_backoff_period(tmpdir):
+    with _PortalTester(SwarmingPortal, tmpdir, max_n_workers=0) as t:
+        address = pure()(double).swarm(x=3)
+        summary = _running_summary(1, 1, node="another_node")
+        t.portal._attempt_summaries[address] = summary
+        assert not address._execution_in_progress(t.portal)
+        t.portal._attempt_summaries[address] = dict(
+            summary, last_attempt_at=time.time())
+        assert address._execution_in_progress(t.portal)
+
+
+def test_failed_executions_release_the_lease(tmpdir):
+    with _PortalTester(SwarmingPortal, tmpdir, max_n_workers=0) as t:
+        fn = pure()(fail)
+        address = fn.get_address(x=1)
+        with pytest.raises(ValueError):
+            fn(x=1)
+        summary = t.portal._attempt_summaries[address]
+        assert summary["count"] == 1
+        assert not summary["running"]
+        assert not address._execution_in_progress(t.portal)
+
+
+def test_helping_absorbs_only_failures_of_the_function(tmpdir, monkeypatch):
+    with _PortalTester(SwarmingPortal, tmpdir, max_n_workers=0) as t:
+        address = pure()(fail).swarm(x=1)
+        assert t.portal._execute_pending_request()
+        assert t.portal._attempt_summaries[address]["count"] == 1
+
+        def broken_reservation(*args, **kwargs):
+            raise RuntimeError("reservation store is down")
+
+        pure()(double).swarm(x=5)
+        monkeypatch.setattr(
+            swarming_portals, "_resource_reservation", broken_reservation)
+        monkeypatch.setattr(swarming_portals, "_pick_execution_request"
+            , lambda portal: (pure()(double).get_address(x=5), None))
+        with pytest.raises(RuntimeError):
+            t.portal._execute_pending_request()
+
+
+def test_helping_keeps_the_callers_output(tmpdir, capsys):
+    with _PortalTester(SwarmingPortal, tmpdir, max_n_workers=0) as t:
+        pure()(chatty).swarm(x=7)
+        assert t.portal._execute_pending_request()
+        assert "helping with 7" in capsys.readouterr().out
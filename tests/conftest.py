@@ -0,0 +1,36 @@
+import os
+import shutil
+import tempfile
+
+import pytest
+
+from pythagoras._110_supporting_utilities.constants_for_signatures_and_converters import (
+    PTH_NODE_CACHE_DIR_ENV_VAR)
+
+_session_node_cache_dir: str | None = None
+_saved_node_cache_dir: str | None = None
+
+
+def pytest_configure(config):
+    """Keep node-local caches written while collecting tests out of ~/.pythagoras."""
+    global _session_node_cache_dir, _saved_node_cache_dir
+    _saved_node_cache_dir = os.environ.get(PTH_NODE_CACHE_DIR_ENV_VAR)
+    _session_node_cache_dir = tempfile.mkdtemp(prefix="pth_node_cache_")
+    os.environ[PTH_NODE_CACHE_DIR_ENV_VAR] = _session_node_cache_dir
+
+
+def pytest_unconfigure(config):
+    """Restore the node-local cache location and remove the session's cache."""
+    if _saved_node_cache_dir is None:
+        os.environ.pop(PTH_NODE_CACHE_DIR_ENV_VAR, None)
+    else:
+        os.environ[PTH_NODE_CACHE_DIR_ENV_VAR] = _saved_node_cache_dir
+    if _session_node_cache_dir is not None:
+        shutil.rmtree(_session_node_cache_dir, ignore_errors=True)
+
+
+@pytest.fixture(autouse=True)
+def isolated_node_local_cache(tmp_path_factory, monkeypatch):
+    """Give every test its own node-local caches, outside of ~/.pythagoras."""
+    monkeypatch.setenv(PTH_NODE_CACHE_DIR_ENV_VAR
+        , str(tmp_path_factory.mktemp("node_cache")))